@@ -0,0 +1,60 @@
+"""
+Laporan waktu impor modul dashboard dengan `python -X importtime`.
+
+Setiap modul diimpor di proses Python baru (seperti worker Streamlit yang baru
+dijalankan), lalu dilaporkan total waktu impor dan paket top-level termahal.
+
+Penggunaan (dari direktori root repo):
+    python benchmarks/importtime.py
+    python benchmarks/importtime.py diskominfo_app plotly.express --top 15
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULES = ["diskominfo_data", "diskominfo_charts", "diskominfo_app", "plotly.express"]
+
+
+def measure_import(module):
+    """
+    Mengimpor `module` di proses baru dengan -X importtime.
+
+    Mengembalikan (total_us, {paket top-level: waktu self us}, modul dimuat). Waktu self
+    dijumlahkan per paket top-level sehingga setiap modul hanya dihitung sekali.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_DIR, capture_output=True, text=True, check=True,
+    )
+    packages = {}
+    loaded = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        loaded.add(name)
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + int(self_us)
+    return sum(packages.values()), packages, loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Laporan waktu impor modul dashboard (python -X importtime).")
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES, help="Modul yang diukur")
+    parser.add_argument('--top', type=int, default=10, help="Jumlah paket termahal yang ditampilkan (default: 10)")
+    args = parser.parse_args(argv)
+
+    for module in args.modules:
+        total_us, packages, loaded = measure_import(module)
+        print(f"== {module}: {total_us / 1000:.1f} ms, {len(loaded)} modul, plotly.express dimuat: {'ya' if 'plotly.express' in loaded else 'tidak'}")
+        for name, cumulative in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+            print(f"   {cumulative / 1000:8.1f} ms  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
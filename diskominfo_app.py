@@ -0,0 +1,855 @@
+import streamlit as st
+import requests
+import datetime
+import os
+
+from diskominfo_cache import CircuitOpenError, DerivationGraph, SizedLRUCache, fetch_single_flight, get_circuit_breaker, read_snapshot, snapshot_mtime
+from diskominfo_charts import CARDS_PER_ROW, card_html, category_figures, choropleth_figure, comparison_figures, growth_figure, jenis_kelamin_cards, kecamatan_comparison_figures, kecamatan_jk_figures, period_label, period_title, ratio_figure, summary_cards
+from diskominfo_data import API_URLS, DATASET_SPECS, KECAMATAN_COL, KecamatanDimension, KecamatanStore, PayloadError, PeriodStore, build_rollups, content_hash, extract_pivot_data, fetch_dataset, find_kecamatan_jk_source, has_pivot_data, normalize_dataset, update_rollups
+from diskominfo_download import EXPORT_FORMATS, export_buffer, period_rows, period_slug
+from diskominfo_filters import FILTER_COLUMNS, FilterIndex, filter_options, match_period
+from diskominfo_forecast import FORECAST_HORIZON, FORECAST_LABELS, FORECAST_METHOD, build_forecast
+from diskominfo_geo import GEOMETRY_FILE, GEOMETRY_URL, geometry_names, load_geometry
+from diskominfo_growth import GROWTH_CHART_METRICS, GROWTH_COLUMNS, GROWTH_LABELS, GrowthStore
+from diskominfo_metrics import RATIO_LABELS, RatioMetrics, ratio_sources
+from diskominfo_etl import dataset_slug, load_artifact_dataset, read_latest_version, read_manifest
+from diskominfo_quality import RECONCILE_THRESHOLD, detect_anomalies, reconcile
+from diskominfo_query import page_count, page_rows, row_order, run_query
+
+# --- Lapisan Streamlit bersama ---
+# Halaman utama (visualisasi.py) dan semua halaman di pages/ memakai fungsi cache
+# di modul ini, sehingga setiap dataset diambil dan disimpan sekali per proses
+# dan tidak lagi per skrip.
+
+# Bila diset, dashboard hanya membaca artefak hasil `python diskominfo_etl.py`
+# dan tidak pernah memanggil API Satu Data.
+ARTIFACT_DIR = os.environ.get("DISKOMINFO_ARTIFACT_DIR")
+
+# Umur cache dataset (detik), baik di memori proses maupun di cache disk bersama
+CACHE_TTL = 3600
+
+# Batas memori cache dataset, rollup dan grafik per proses (MB)
+MEMORY_CACHE_MB = int(os.environ.get("DISKOMINFO_CACHE_MAX_MB", "256"))
+
+# Batas waktu satu panggilan API (detik)
+FETCH_TIMEOUT = 30
+
+# Error yang membuat sebuah dataset jatuh ke snapshot terakhir (last-known-good)
+FETCH_ERRORS = (requests.exceptions.RequestException, CircuitOpenError, PayloadError)
+
+
+def setup_page():
+    """Konfigurasi halaman yang sama untuk semua halaman aplikasi."""
+    st.set_page_config(page_title="Visualisasi Data Statistik Garut", layout="wide")
+
+
+# --- Fungsi untuk mengambil data dari API ---
+def _fetch_checked(api_url):
+    """Memanggil API dan menolak respons tanpa 'data.pivot_data' agar tidak menimpa snapshot yang valid."""
+    data = fetch_dataset(api_url, timeout=FETCH_TIMEOUT)
+    if not has_pivot_data(data):
+        raise PayloadError("Struktur data API tidak memiliki kunci 'data.pivot_data'.")
+    return data
+
+def get_data_from_api(api_url):
+    """
+    Mengambil data JSON dari URL API yang diberikan. Error diteruskan ke pemanggil.
+
+    Lewat fetch_single_flight: bila beberapa proses/sesi butuh URL yang sama saat cache
+    kedaluwarsa, hanya satu yang memanggil API dan sisanya memakai hasilnya. Setiap URL
+    juga dilindungi circuit breaker sehingga API yang sedang gagal tidak dipanggil
+    berulang kali pada setiap rerun.
+    """
+    breaker = get_circuit_breaker(api_url)
+    return fetch_single_flight(api_url, lambda url: breaker.call(_fetch_checked, url), ttl=CACHE_TTL)
+
+# --- Cache memori ---
+# Satu cache LRU berbatas byte per proses untuk dataset, rollup dan grafik (lihat
+# SizedLRUCache). Ukuran diukur dari DataFrame, sehingga penambahan dataset atau
+# irisan periode tidak membuat memori tumbuh tanpa batas di VM kecil.
+#
+# Versi data setiap dataset adalah hash isinya, dan graf turunan mencatat
+# sumber dataset -> versi data (frame + rollup) -> grafik. Refresh yang isinya sama
+# memakai ulang rollup dan grafik yang ada; bila isinya berubah, hanya turunan
+# dataset itu yang dibuang.
+@st.cache_resource
+def get_memory_cache():
+    return SizedLRUCache(MEMORY_CACHE_MB * 1024 * 1024)
+
+@st.cache_resource
+def get_derivation_graph():
+    return DerivationGraph()
+
+@st.cache_resource
+def get_kecamatan_dimension():
+    """Dimensi kecamatan bersama milik proses ini; semua dataset dari API dikodekan terhadapnya."""
+    return KecamatanDimension()
+
+@st.cache_resource
+def get_geometry_names():
+    """Nama kecamatan di geometri peta yang dibundel (dibaca sekali per proses), atau None bila belum ada."""
+    geojson = load_geometry()
+    return geometry_names(geojson) if geojson is not None else None
+
+def register_version(name, version):
+    """
+    Mencatat `version` sebagai versi data terbaru dataset `name`. Bila versinya baru,
+    frame, rollup dan grafik dari versi lama dataset ini dibuang; dataset lain tidak tersentuh.
+    Node turunan yang sudah terbuang dari cache oleh LRU ikut dibuang dari graf.
+    """
+    graph = get_derivation_graph()
+    source = ('sumber', name)
+    if version not in graph.children(source):
+        graph.invalidate(source, get_memory_cache())
+        graph.add(source, version)
+    graph.prune(get_memory_cache())
+
+def _previous_processed(name):
+    """(rollups, partitions) versi data `name` yang sedang dipakai, bila masih ada di cache."""
+    for version in get_derivation_graph().children(('sumber', name)):
+        if version[0] == 'olahan':
+            data = get_memory_cache().get(version)
+            if data is not None:
+                return data[1], data[2]
+    return None
+
+def process_raw_data(name, df_raw):
+    """
+    Menormalisasi dan mengagregasi DataFrame mentah, atau memakai ulang hasil sebelumnya
+    bila isinya sama. Bila isinya berubah, hanya periode (tahun, semester) yang baru atau
+    berubah dibanding versi sebelumnya yang diagregasi ulang. Mengembalikan (df, rollups, versi).
+    """
+    if df_raw is None:
+        raise PayloadError(f"Struktur data {name} tidak memiliki kunci 'data.pivot_data'.")
+    version = ('olahan', name, content_hash(df_raw))
+
+    def compute():
+        df = normalize_dataset(name, df_raw, get_kecamatan_dimension())
+        rollups, partitions, _ = update_rollups(name, df, _previous_processed(name))
+        return df, rollups, partitions
+    df, rollups, _ = get_memory_cache().get_or_compute(version, compute)
+    register_version(name, version)
+    return df, rollups, version
+
+def _cached_version(pointer):
+    """(df, rollups, versi) dari penunjuk versi di cache, atau None bila salah satunya sudah tidak ada."""
+    cache = get_memory_cache()
+    version = cache.get(pointer)
+    data = cache.get(version) if version is not None else None
+    return (data[0], data[1], version) if data is not None else None
+
+def get_processed_data(name, api_url):
+    """
+    Mengambil, menormalisasi dan mengagregasi satu dataset.
+
+    Hasilnya satu objek bersama untuk semua sesi dan halaman, sehingga harus diperlakukan
+    sebagai read-only. Kegagalan dilempar sebagai exception sehingga tidak ikut tersimpan
+    di cache. Elemen ketiga adalah versi data (hash isi), yang dipakai sebagai kunci cache
+    grafik.
+    """
+    pointer = ('dataset', name, api_url)
+    result = _cached_version(pointer)
+    if result is None:
+        with st.spinner("Mengambil data dari API..."):
+            result = process_raw_data(name, extract_pivot_data(get_data_from_api(api_url)))
+        get_memory_cache().put(pointer, result[2], ttl=CACHE_TTL)
+    return result
+
+def get_snapshot_data(name, api_url, snapshot_time):
+    """
+    Memproses snapshot terakhir di cache disk. `snapshot_time` ikut menjadi kunci cache
+    sehingga snapshot yang sama tidak dibaca ulang pada setiap rerun.
+    """
+    pointer = ('snapshot', name, api_url, snapshot_time)
+    result = _cached_version(pointer)
+    if result is None:
+        result = process_raw_data(name, extract_pivot_data(read_snapshot(api_url)))
+        get_memory_cache().put(pointer, result[2])
+    return result
+
+def get_artifact_manifest(artifact_dir, version):
+    return get_memory_cache().get_or_compute(('manifest', artifact_dir, version), lambda: read_manifest(artifact_dir, version))
+
+def get_artifact_data(name, artifact_dir, version, info):
+    """
+    Membaca satu dataset dari artefak. Dataset yang hash isinya sama dengan versi artefak
+    sebelumnya tidak dibaca ulang. Mengembalikan (df, rollups, versi).
+    """
+    data_version = ('artefak', name, info.get('content_hash') or version)
+
+    def compute():
+        with st.spinner("Memuat artefak data..."):
+            return load_artifact_dataset(artifact_dir, version, info)
+    df, rollups = get_memory_cache().get_or_compute(data_version, compute)
+    register_version(name, data_version)
+    return df, rollups, data_version
+
+
+def load_data(names=None):
+    """
+    Memuat dataset yang diminta (default: semua di API_URLS) dan rollup-nya.
+
+    Mengembalikan (data_aggr, rollups, data_status). Dataset yang gagal diambil memakai
+    snapshot terakhir (data_status[nama]['stale'] True) tanpa menghentikan dataset lain.
+    Halaman hanya dihentikan bila tidak ada satu pun dataset yang tersedia.
+    """
+    names = list(API_URLS) if names is None else names
+    data_aggr = {}
+    rollups = {}
+    data_status = {}
+    if ARTIFACT_DIR:
+        artifact_version = read_latest_version(ARTIFACT_DIR)
+        if artifact_version is None:
+            st.error(f"Artefak data tidak ditemukan di {ARTIFACT_DIR}. Jalankan `python diskominfo_etl.py --output {ARTIFACT_DIR}` terlebih dahulu.")
+            st.stop()
+        manifest = get_artifact_manifest(ARTIFACT_DIR, artifact_version)
+        for name in names:
+            if name in manifest['datasets']:
+                data_aggr[name], rollups[name], data_version = get_artifact_data(name, ARTIFACT_DIR, artifact_version, manifest['datasets'][name])
+                data_status[name] = {'stale': False, 'version': data_version}
+        st.write(f"Data diperbarui terakhir pada: {manifest['created_at']}")
+        st.success(f"Data berhasil dimuat dari artefak versi {artifact_version}.")
+        return data_aggr, rollups, data_status
+
+    for name in names:
+        api_url = API_URLS[name]
+        try:
+            data_aggr[name], rollups[name], data_version = get_processed_data(name, api_url)
+            data_status[name] = {'stale': False, 'version': data_version}
+            continue
+        except FETCH_ERRORS as e:
+            fetch_error = e
+
+        snapshot_time = snapshot_mtime(api_url)
+        try:
+            if snapshot_time is None:
+                raise PayloadError("Belum ada snapshot tersimpan.")
+            data_aggr[name], rollups[name], data_version = get_snapshot_data(name, api_url, snapshot_time)
+        except PayloadError as e:
+            st.error(f"Gagal mengambil data untuk: {name}. Pastikan URL API benar dan data tersedia. ({fetch_error}; {e})")
+            continue
+        data_status[name] = {
+            'stale': True,
+            'version': data_version,
+            'as_of': datetime.datetime.fromtimestamp(snapshot_time).strftime('%Y-%m-%d %H:%M:%S'),
+            'error': str(fetch_error),
+        }
+
+    if not data_aggr:
+        st.stop()
+
+    st.write(f"Data diperbarui terakhir pada: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    stale_names = [name for name, status in data_status.items() if status['stale']]
+    if stale_names:
+        st.warning(f"API sedang bermasalah untuk: {', '.join(stale_names)}. Dataset tersebut menampilkan snapshot terakhir; dataset lain tetap terbaru.")
+    else:
+        st.success("Data berhasil diambil dari API.")
+    return data_aggr, rollups, data_status
+
+
+# --- Cache store periode dan grafik ---
+# PeriodStore dan grafik disimpan per versi data di cache memori yang sama dan dicatat
+# sebagai turunan versi datanya di graf turunan. Rerun yang hanya berganti tab atau
+# periode yang sudah pernah dibuka tidak membangun ulang grafik, sehingga Plotly Express
+# (dimuat lazy di diskominfo_charts) tidak perlu diimpor. Periode yang jarang dibuka
+# adalah entri pertama yang dibuang saat memori penuh.
+def _cached_derivation(key, version, build):
+    get_derivation_graph().add(version, key)
+    return get_memory_cache().get_or_compute(key, build)
+
+def _cached_multi_derivation(key, versions, build):
+    """Seperti _cached_derivation untuk turunan beberapa dataset: dibuang bila salah satu versinya berubah."""
+    graph = get_derivation_graph()
+    for version in versions:
+        graph.add(version, key)
+    return get_memory_cache().get_or_compute(key, build)
+
+def _data_version(name, data_status):
+    return (data_status or {}).get(name, {}).get('version')
+
+def get_period_store(name, rollups, data_status=None):
+    """PeriodStore untuk rollup dataset `name`, dari cache bila versi datanya diketahui."""
+    version = _data_version(name, data_status)
+    if version is None:
+        return PeriodStore(name, rollups)
+    return _cached_derivation(('periode', version), version, lambda: PeriodStore(name, rollups))
+
+def get_kecamatan_store(name, rollups, data_status=None):
+    """KecamatanStore (rollup terurut per kecamatan) dataset `name`, dibangun sekali per versi data."""
+    version = _data_version(name, data_status)
+    if version is None:
+        return KecamatanStore(name, rollups)
+    return _cached_derivation(('indeks_kecamatan', version), version, lambda: KecamatanStore(name, rollups))
+
+def get_kecamatan_period_store(store, kecamatan, data_status=None):
+    """
+    (PeriodStore, versi) rollup satu kecamatan dari KecamatanStore `store`.
+
+    Versinya dicatat sebagai turunan versi data dataset, sehingga grafik yang disimpan
+    dengan versi ini (get_category_figures dan seterusnya) tidak bercampur dengan grafik
+    seluruh kabupaten dan ikut dibuang saat datanya berubah.
+    """
+    version = _data_version(store.name, data_status)
+    build = lambda: PeriodStore(store.name, store.kecamatan_rollups(kecamatan))
+    if version is None:
+        return build(), None
+    kecamatan_version = ('per_kecamatan', version, kecamatan)
+    return _cached_derivation(kecamatan_version, version, build), kecamatan_version
+
+def get_anomalies(name, rollups, data_status=None):
+    """Tabel detect_anomalies dataset `name`, dihitung sekali per versi data."""
+    version = _data_version(name, data_status)
+    if version is None:
+        return detect_anomalies(name, rollups)
+    return _cached_derivation(('anomali', version), version, lambda: detect_anomalies(name, rollups))
+
+def get_forecast(name, rollups, data_status=None):
+    """Tabel build_forecast dataset `name` (semua deret sekaligus), dihitung sekali per versi data."""
+    version = _data_version(name, data_status)
+    if version is None:
+        return build_forecast(name, rollups)
+    return _cached_derivation(('proyeksi', version), version, lambda: build_forecast(name, rollups))
+
+# Grafik disimpan per versi data; anomali dan proyeksi di grafik tren berasal dari versi yang sama
+def get_category_figures(store, tahun, semester, version, anomalies=None, forecast=None):
+    if version is None:
+        return category_figures(store.name, store, tahun, semester, anomalies, forecast)
+    key = ('grafik_kategori', store.name, tahun, semester, version)
+    return _cached_derivation(key, version, lambda: category_figures(store.name, store, tahun, semester, anomalies, forecast))
+
+def get_kecamatan_jk_figures(store, tahun, semester, version, anomalies=None, forecast=None):
+    if version is None:
+        return kecamatan_jk_figures(store, tahun, semester, anomalies, forecast)
+    key = ('grafik_kecamatan_jk', store.name, tahun, semester, version)
+    return _cached_derivation(key, version, lambda: kecamatan_jk_figures(store, tahun, semester, anomalies, forecast))
+
+# Perbandingan dua periode memakai irisan PeriodStore yang sama, sehingga biayanya tetap dua lookup per rerun
+def get_comparison_figures(store, base, current, version):
+    build = lambda: comparison_figures(store.name, store, base, current)
+    if version is None:
+        return build()
+    return _cached_derivation(('grafik_banding', store.name, base, current, version), version, build)
+
+def get_kecamatan_comparison_figures(store, base, current, version):
+    build = lambda: kecamatan_comparison_figures(store, base, current)
+    if version is None:
+        return build()
+    return _cached_derivation(('grafik_banding_kecamatan', store.name, base, current, version), version, build)
+
+def get_period_comparison(store, key, columns, base, current, version):
+    """Tabel PeriodStore.compare, disimpan per versi data di cache memori."""
+    build = lambda: store.compare(key, columns, base, current)
+    if version is None:
+        return build()
+    return _cached_derivation(('banding', store.name, key, tuple(columns), base, current, version), version, build)
+
+def get_growth_store(name, rollups, data_status=None):
+    """GrowthStore (metrik pertumbuhan semua periode) dataset `name`, dari cache bila versi datanya diketahui."""
+    version = _data_version(name, data_status)
+    if version is None:
+        return GrowthStore(name, rollups)
+    return _cached_derivation(('pertumbuhan', version), version, lambda: GrowthStore(name, rollups))
+
+def get_growth_figure(store, key, x, x_label, metric, tahun, semester, version):
+    build = lambda: growth_figure(store.slice(key, tahun, semester), x, x_label, metric, tahun, semester)
+    if version is None:
+        return build()
+    return _cached_derivation(('grafik_pertumbuhan', store.name, key, metric, tahun, semester, version), version, build)
+
+def get_choropleth_figure(store, value, tahun, semester, version):
+    """Peta choropleth jumlah penduduk per kecamatan; `value` None berarti total semua kategori."""
+    def build():
+        spec = DATASET_SPECS[store.name]
+        df_kecamatan = store.slice('kecamatan_kategori', tahun, semester)
+        if value is not None:
+            df_kecamatan = df_kecamatan[df_kecamatan[spec['category']] == value]
+        df_values = df_kecamatan.groupby(KECAMATAN_COL, observed=True)['jumlah'].sum().reset_index()
+        df_values[KECAMATAN_COL] = df_values[KECAMATAN_COL].astype(str)
+        subject = spec['label'] if value is None else f"{spec['label']} {value}"
+        return choropleth_figure(df_values, 'jumlah', 'Jumlah Penduduk (jiwa)', f"Peta Jumlah Penduduk Berdasarkan {subject} {period_title(tahun, semester)}", GEOMETRY_URL)
+    if version is None:
+        return build()
+    return _cached_derivation(('grafik_peta', store.name, value, tahun, semester, version), version, build)
+
+def get_ratio_metrics(rollups, data_status=None):
+    """RatioMetrics dari rollup yang dimuat, disimpan per kombinasi versi dataset sumbernya."""
+    versions = [_data_version(name, data_status) for name in ratio_sources(rollups)]
+    if None in versions:
+        return RatioMetrics(rollups)
+    return _cached_multi_derivation(('rasio', tuple(versions)), versions, lambda: RatioMetrics(rollups))
+
+def get_ratio_figure(metrics, metric, tahun, semester, versions):
+    build = lambda: ratio_figure(metrics.slice(tahun, semester), metric, tahun, semester)
+    if None in versions:
+        return build()
+    return _cached_multi_derivation(('grafik_rasio', metric, tahun, semester, tuple(versions)), versions, build)
+
+def get_reconciliation(rollups, data_status, threshold=RECONCILE_THRESHOLD):
+    """Hasil reconcile untuk semua dataset yang dimuat, disimpan per kombinasi versi data."""
+    versions = [_data_version(name, data_status) for name in sorted(rollups)]
+    if None in versions:
+        return reconcile(rollups, threshold)
+    return _cached_multi_derivation(('rekonsiliasi', tuple(versions), threshold), versions, lambda: reconcile(rollups, threshold))
+
+def get_query_result(name, df, data_status, group_by, filters, tahun_range):
+    """Hasil run_query untuk dataset `name`, disimpan per versi data di cache memori."""
+    version = _data_version(name, data_status)
+    if version is None:
+        return run_query(df, group_by, filters, tahun_range)
+    filter_key = tuple(sorted((col, tuple(values)) for col, values in filters.items() if values))
+    key = ('kueri', name, tuple(group_by), filter_key, tuple(tahun_range), version)
+    return _cached_derivation(key, version, lambda: run_query(df, group_by, filters, tahun_range))
+
+def get_row_order(name, df, data_status, filters, sort_by, ascending):
+    """Urutan baris (posisi) untuk penjelajah data mentah, disimpan per versi data di cache memori."""
+    version = _data_version(name, data_status)
+    if version is None:
+        return row_order(df, filters, sort_by, ascending)
+    filter_key = tuple(sorted((col, tuple(values)) for col, values in filters.items() if values))
+    key = ('urutan_baris', name, filter_key, sort_by, ascending, version)
+    return _cached_derivation(key, version, lambda: row_order(df, filters, sort_by, ascending))
+
+
+# --- Filter global ---
+# Pilihan panel filter sidebar, disimpan di session_state agar tetap sama saat berpindah halaman
+FILTER_STATE_KEY = 'filter_global'
+FILTER_LABELS = {KECAMATAN_COL: "Kecamatan", 'jenis_kelamin': "Jenis Kelamin"}
+
+def get_filter_index(name, df, data_status=None):
+    """FilterIndex dataset `name`, dibangun sekali per versi data."""
+    version = _data_version(name, data_status)
+    if version is None:
+        return FilterIndex(df)
+    return _cached_derivation(('indeks_filter', version), version, lambda: FilterIndex(df))
+
+def _filtered_dataset(name, df, data_status, rows, selection_key):
+    """
+    (df, rollups, versi) dataset `name` yang hanya berisi baris `rows`.
+
+    Versinya dicatat sebagai turunan versi data asal di graf turunan, sehingga store dan
+    grafik yang dibangun dari data terfilter ikut dibuang saat data asalnya berubah.
+    """
+    def build():
+        df_rows = df.iloc[rows]
+        return df_rows, build_rollups(name, df_rows)
+    version = _data_version(name, data_status)
+    if version is None:
+        return (*build(), None)
+    filtered_version = ('tersaring', version, selection_key)
+    df_rows, dataset_rollups = _cached_derivation(filtered_version, version, build)
+    return df_rows, dataset_rollups, filtered_version
+
+def _filter_widget_state(widget_key, value):
+    """Mengisi state widget filter dari pilihan tersimpan saat widget belum ada (misalnya setelah berpindah halaman)."""
+    if widget_key not in st.session_state:
+        st.session_state[widget_key] = value
+
+def apply_global_filters(data_aggr, rollups, data_status):
+    """
+    Panel filter global di sidebar (periode, kecamatan, jenis kelamin) untuk semua tab halaman.
+
+    Pilihan kecamatan dan jenis kelamin diterjemahkan sekali per rerun menjadi posisi baris
+    setiap dataset (FilterIndex.rows); rollup baris terpilih disimpan di cache per versi
+    data dan pilihan filter. Mengembalikan (data_aggr, rollups, data_status) yang sudah
+    difilter; data_status[nama]['periode'] berisi periode filter untuk dataset itu (atau
+    None), yang dipakai select_period di setiap tab.
+    """
+    indexes = {name: get_filter_index(name, df, data_status) for name, df in data_aggr.items()}
+    periods, values = filter_options(indexes.values())
+    state = st.session_state.setdefault(FILTER_STATE_KEY, {'periode': None, **{col: [] for col in FILTER_COLUMNS}})
+
+    with st.sidebar:
+        st.markdown("### Filter Global")
+        widget_key = f'_{FILTER_STATE_KEY}_periode'
+        _filter_widget_state(widget_key, state['periode'] if state['periode'] in periods else None)
+        state['periode'] = st.selectbox("Periode:", [None] + periods, format_func=lambda period: "Pilih per tab" if period is None else period_label(*period), key=widget_key)
+        for col in FILTER_COLUMNS:
+            widget_key = f'_{FILTER_STATE_KEY}_{col}'
+            _filter_widget_state(widget_key, [value for value in state[col] if value in values[col]])
+            state[col] = st.multiselect(f"{FILTER_LABELS[col]}:", values[col], placeholder="Semua", key=widget_key)
+
+    selections = {col: tuple(state[col]) for col in FILTER_COLUMNS}
+    selection_key = tuple(sorted(selections.items()))
+    filtered_aggr, filtered_rollups, filtered_status = {}, {}, {}
+    empty, skipped = [], []
+    for name, df in data_aggr.items():
+        index = indexes[name]
+        rows = index.rows(selections)
+        status = {**data_status[name], 'periode': match_period(index.periods, state['periode'])}
+        skipped.extend(DATASET_SPECS[name]['label'] for col in FILTER_COLUMNS if selections[col] and col not in index)
+        if rows is None:
+            filtered_aggr[name], filtered_rollups[name] = df, rollups[name]
+        elif len(rows) == 0:
+            empty.append(DATASET_SPECS[name]['label'])
+            continue
+        else:
+            filtered_aggr[name], filtered_rollups[name], status['version'] = _filtered_dataset(name, df, data_status, rows, selection_key)
+        filtered_status[name] = status
+
+    with st.sidebar:
+        if skipped:
+            st.caption(f"Sebagian filter tidak berlaku untuk: {', '.join(sorted(set(skipped)))} (kolomnya tidak tersedia).")
+        if empty:
+            st.caption(f"Tidak ada data yang cocok dengan filter untuk: {', '.join(empty)}.")
+    return filtered_aggr, filtered_rollups, filtered_status
+
+
+# --- Fungsi tampilan tab ---
+# Label kolom dataset yang ditampilkan di pembangun kueri dan penjelajah data mentah
+COLUMN_LABELS = {
+    'tahun': "Tahun",
+    'semester': "Semester",
+    'kecamatan': "Kecamatan",
+    'jenis_kelamin': "Jenis Kelamin",
+    'jumlah': "Jumlah",
+    **{spec['category']: spec['label'] for spec in DATASET_SPECS.values()},
+}
+
+def render_cards(cards, num_cols_per_row):
+    """Menampilkan kartu ringkasan (ikon, jumlah, label, warna) dalam baris st.columns."""
+    for i in range(0, len(cards), num_cols_per_row):
+        cols = st.columns(num_cols_per_row, gap="small")
+        for j, (icon, value, label, color) in enumerate(cards[i:i + num_cols_per_row]):
+            with cols[j]:
+                st.markdown(card_html(icon, value, label, color), unsafe_allow_html=True)
+
+def select_period(periods, key, period=None):
+    """
+    Selectbox tahun dan semester (bila ada) untuk sebuah tab dari daftar periode. Mengembalikan (tahun, semester).
+
+    Bila `period` (periode filter global) diberikan, selectbox tidak ditampilkan.
+    """
+    if period is not None:
+        st.caption(f"Periode {period_label(*period)} (filter global)")
+        return period
+    list_tahun = sorted({tahun for tahun, _ in periods}, reverse=True)
+    list_semester = sorted({semester for _, semester in periods if semester is not None})
+    if not list_semester:
+        return st.selectbox("Pilih Tahun:", list_tahun, key=f'tahun_{key}'), None
+
+    col_y, col_s = st.columns(2)
+    with col_y:
+        selected_tahun = st.selectbox("Pilih Tahun:", list_tahun, key=f'tahun_{key}')
+    with col_s:
+        selected_semester = st.selectbox("Pilih Semester:", list_semester, key=f'semester_{key}')
+    return selected_tahun, selected_semester
+
+def select_comparison_period(periods, current, key):
+    """
+    Toggle mode perbandingan dan pilihan periode pembanding untuk sebuah tab.
+
+    Mengembalikan periode pembanding (tahun, semester), atau None bila mode perbandingan
+    tidak aktif. Pilihan awalnya adalah periode sebelum `current`.
+    """
+    options = [period for period in periods if period != current]
+    if not options or not st.toggle("Bandingkan dengan periode lain", key=f'banding_{key}'):
+        return None
+    older = [i for i, period in enumerate(options) if period < current]
+    return st.selectbox("Periode pembanding:", options, index=older[0] if older else 0, format_func=lambda period: period_label(*period), key=f'pembanding_{key}')
+
+def render_comparison_table(df_compare, x, x_label, base, current):
+    """Tabel PeriodStore.compare dengan label periode sebagai judul kolom jumlah."""
+    st.dataframe(df_compare.rename(columns={
+        x: x_label,
+        'jumlah_pembanding': f"Jumlah {period_label(*base)}",
+        'jumlah': f"Jumlah {period_label(*current)}",
+        'selisih': "Selisih",
+        'selisih_pct': "Selisih (%)",
+    }), width="stretch", hide_index=True)
+
+def render_downloads(name, key, exports):
+    """
+    Tombol unduh CSV/Parquet untuk salah satu pilihan di `exports`.
+
+    `exports` berisi {label: (slug, df, periode)} dengan periode (tahun, semester) untuk
+    hanya mengekspor baris periode tersebut, atau None untuk seluruh `df`. File baru
+    dibuat (bertahap, lewat diskominfo_download) saat tombol diklik.
+    """
+    col_what, col_fmt, col_button = st.columns([2, 1, 1])
+    with col_what:
+        choice = st.selectbox("Data yang diunduh:", list(exports), key=f'unduh_data_{key}')
+    with col_fmt:
+        fmt = st.radio("Format:", list(EXPORT_FORMATS), format_func=lambda f: EXPORT_FORMATS[f][0], horizontal=True, key=f'unduh_format_{key}')
+    slug, df, period = exports[choice]
+
+    def build():
+        return export_buffer(df, fmt, None if period is None else period_rows(df, *period))
+    with col_button:
+        st.download_button(f"Unduh {EXPORT_FORMATS[fmt][0]}", data=build, file_name=f"{dataset_slug(name)}_{slug}.{fmt}", mime=EXPORT_FORMATS[fmt][1], on_click='ignore', key=f'unduh_{key}')
+
+def render_growth(name, table, x, x_label, key, tahun, semester, rollups, data_status=None):
+    """Grafik dan tabel pertumbuhan tabel `table` GrowthStore dataset `name` untuk satu periode."""
+    store = get_growth_store(name, rollups[name], data_status)
+    df_growth = store.slice(table, tahun, semester)
+    if df_growth.empty:
+        st.info("Data pertumbuhan tidak tersedia untuk periode yang dipilih.")
+        return
+    metric = st.radio("Metrik pertumbuhan:", GROWTH_CHART_METRICS, format_func=GROWTH_LABELS.get, horizontal=True, key=f'pertumbuhan_{key}')
+    if df_growth[metric].isna().all():
+        st.info(f"{GROWTH_LABELS[metric]} belum dapat dihitung: tidak ada periode pembanding sebelum {period_label(tahun, semester)}.")
+    else:
+        st.plotly_chart(get_growth_figure(store, table, x, x_label, metric, tahun, semester, _data_version(name, data_status)), width="stretch")
+    columns = [x, 'jumlah'] + [col for col in GROWTH_COLUMNS if col in df_growth.columns]
+    st.dataframe(df_growth[columns].rename(columns={x: x_label, 'jumlah': "Jumlah", **GROWTH_LABELS}), width="stretch", hide_index=True)
+
+def render_ratios(key, options, columns, tahun, semester, rollups, data_status=None):
+    """Grafik rasio (pilihan `options`) dan tabel kolom `columns` RatioMetrics per kecamatan untuk satu periode."""
+    metrics = get_ratio_metrics(rollups, data_status)
+    options = [metric for metric in options if metric in metrics.metrics()]
+    df_ratios = metrics.slice(tahun, semester) if options else None
+    if df_ratios is None or df_ratios.empty:
+        st.info("Rasio per kecamatan tidak tersedia untuk periode yang dipilih.")
+        return
+    metric = st.radio("Rasio:", options, format_func=RATIO_LABELS.get, horizontal=True, key=f'rasio_{key}') if len(options) > 1 else options[0]
+    versions = [_data_version(name, data_status) for name in metrics.sources]
+    st.plotly_chart(get_ratio_figure(metrics, metric, tahun, semester, versions), width="stretch")
+    columns = [KECAMATAN_COL] + [col for col in columns if col in df_ratios.columns]
+    st.dataframe(df_ratios[columns].rename(columns={KECAMATAN_COL: "Kecamatan", **RATIO_LABELS}), width="stretch", hide_index=True)
+
+def render_choropleth(name, key, store, tahun, semester, data_status=None):
+    """Peta choropleth per kecamatan untuk dataset `name`, dengan pilihan total atau satu kategori."""
+    names = get_geometry_names()
+    if names is None:
+        st.info(f"Peta kecamatan belum tersedia: berkas batas wilayah {os.path.relpath(GEOMETRY_FILE)} belum dibuat. Atur `DISKOMINFO_GEOMETRY_SOURCE` lalu jalankan `python diskominfo_geo.py --if-missing` (lihat README).")
+        return
+    category = DATASET_SPECS[name]['category']
+    options = [None] + sorted(store.rollups['kategori'][category].dropna().unique())
+    value = st.selectbox("Nilai peta:", options, format_func=lambda v: "Total penduduk" if v is None else v, key=f'peta_{key}')
+    st.plotly_chart(get_choropleth_figure(store, value, tahun, semester, _data_version(name, data_status)), width="stretch")
+
+    missing = sorted(set(store.slice('kecamatan_kategori', tahun, semester)[KECAMATAN_COL].astype(str)) - names)
+    if missing:
+        st.caption(f"Kecamatan tanpa batas wilayah di peta: {', '.join(missing)}")
+
+def render_forecast(forecast, table):
+    """Keterangan garis proyeksi di grafik tren dan tabel proyeksi `table` (hasil build_forecast) dalam expander."""
+    st.caption(f"Garis putus-putus: {FORECAST_LABELS[FORECAST_METHOD].lower()} {FORECAST_HORIZON} periode ke depan.")
+    with st.expander("Lihat tabel proyeksi periode berikutnya"):
+        df_forecast = forecast[table]
+        columns = [col for col in df_forecast.columns if col != 'langkah']
+        st.dataframe(df_forecast[columns].rename(columns={**COLUMN_LABELS, **FORECAST_LABELS}), width="stretch", hide_index=True)
+
+def render_stale_badge(name, data_status):
+    """Menampilkan penanda bila dataset `name` sedang memakai snapshot terakhir."""
+    status = (data_status or {}).get(name)
+    if status and status['stale']:
+        st.warning(f"⏳ Data {DATASET_SPECS[name]['label']} belum dapat diperbarui dari API. Menampilkan snapshot terakhir per {status['as_of']}.")
+
+def render_category_tab(name, key, cards_title, data_aggr, rollups, data_status=None):
+    """Menampilkan isi tab untuk dataset kategori (Agama, Perkawinan, Pekerjaan, Golongan Darah)."""
+    label = DATASET_SPECS[name]['label']
+    df = data_aggr.get(name)
+    if df is None:
+        st.info(f"Data untuk visualisasi {label} tidak tersedia.")
+        return
+    render_stale_badge(name, data_status)
+
+    try:
+        store = get_period_store(name, rollups[name], data_status)
+        selected_tahun, selected_semester = select_period(store.periods, key, (data_status or {}).get(name, {}).get('periode'))
+        df_sum = store.slice('kategori', selected_tahun, selected_semester)
+        if df_sum.empty:
+            st.info("Tidak ada data yang tersedia untuk tahun dan semester yang dipilih.")
+            return
+        current = (selected_tahun, selected_semester)
+        base = select_comparison_period(store.periods, current, key)
+
+        # Tampilan kartu untuk jumlah penduduk per kategori
+        st.markdown(f"#### {cards_title}")
+        render_cards(summary_cards(name, df_sum), CARDS_PER_ROW[name])
+        st.markdown("---")
+
+        version = _data_version(name, data_status)
+        anomalies = get_anomalies(name, rollups[name], data_status)
+        forecast = get_forecast(name, rollups[name], data_status)
+        figures = get_category_figures(store, selected_tahun, selected_semester, version, anomalies, forecast)
+        if base is not None:
+            # Mode perbandingan: grafik batang, pie dan kecamatan diganti grafik dua periode
+            st.markdown(f"### Perbandingan {period_label(*current)} dengan {period_label(*base)}")
+            figures = {**figures, **get_comparison_figures(store, base, current, version)}
+        col1, col2 = st.columns(2)
+        with col1:
+            st.plotly_chart(figures['bar'], width="stretch")
+        with col2:
+            st.plotly_chart(figures['pie'], width="stretch")
+        if base is not None:
+            st.plotly_chart(figures['selisih'], width="stretch")
+            render_comparison_table(get_period_comparison(store, 'kategori', [DATASET_SPECS[name]['category']], base, current, version), DATASET_SPECS[name]['category'], label, base, current)
+
+        st.markdown("---")
+
+        # Cek jika kolom 'kecamatan' tersedia sebelum membuat grafik
+        if 'kecamatan' in figures:
+            st.markdown(f"### Sebaran {label} per Kecamatan")
+            st.plotly_chart(figures['kecamatan'], width="stretch")
+            render_choropleth(name, key, store, selected_tahun, selected_semester, data_status)
+            st.markdown("---")
+        else:
+            st.info("Data kecamatan tidak tersedia untuk visualisasi ini.")
+
+        st.markdown(f"### Tren Jumlah Penduduk Berdasarkan {label} dari Tahun ke Tahun")
+        st.plotly_chart(figures['tren'], width="stretch")
+        render_forecast(forecast, 'kecamatan_kategori' if 'kecamatan_kategori' in forecast else 'kategori')
+        st.markdown("---")
+
+        if name == "Pekerjaan":
+            st.markdown("### Rasio Bekerja per Kecamatan")
+            render_ratios(key, ['rasio_bekerja'], ['bekerja', 'belum_tidak_bekerja', 'rasio_bekerja', 'pangsa_pct'], selected_tahun, selected_semester, rollups, data_status)
+            st.markdown("---")
+
+        st.markdown(f"### Pertumbuhan Penduduk Berdasarkan {label}")
+        render_growth(name, 'kategori', DATASET_SPECS[name]['category'], label, key, selected_tahun, selected_semester, rollups, data_status)
+
+        st.markdown("---")
+        period = (selected_tahun, selected_semester)
+        render_downloads(name, key, {
+            f"Data {period_label(*period)}": (f"data_{period_slug(*period)}", df, period),
+            f"Rekap {label} {period_label(*period)}": (f"rekap_{period_slug(*period)}", df_sum, None),
+            f"Rekap {label} semua periode": ("rekap", store.rollups['kategori'], None),
+            "Dataset lengkap": ("lengkap", df, None),
+        })
+    except Exception as e:
+        st.error(f"Error saat memproses data {label}: {e}")
+
+def render_kecamatan_jk_tab(source_name, key, data_aggr, rollups, data_status=None):
+    """Menampilkan isi tab Kecamatan & Jenis Kelamin dari dataset `source_name`."""
+    if source_name is None or source_name not in data_aggr or 'kecamatan_kategori' not in rollups[source_name]:
+        st.info("Data untuk visualisasi Kecamatan & Jenis Kelamin tidak tersedia.")
+        return
+    render_stale_badge(source_name, data_status)
+
+    try:
+        store = get_period_store(source_name, rollups[source_name], data_status)
+        has_jenis_kelamin = 'kecamatan_jk' in store
+        selected_tahun, selected_semester = select_period(store.periods, key, (data_status or {}).get(source_name, {}).get('periode'))
+        df_filtered_kecamatan = store.slice('kecamatan_jk' if has_jenis_kelamin else 'kecamatan_kategori', selected_tahun, selected_semester)
+        if df_filtered_kecamatan.empty:
+            st.info("Tidak ada data yang tersedia untuk tahun dan semester yang dipilih.")
+            return
+        current = (selected_tahun, selected_semester)
+        base = select_comparison_period(store.periods, current, key)
+
+        version = _data_version(source_name, data_status)
+        anomalies = get_anomalies(source_name, rollups[source_name], data_status)
+        forecast = get_forecast(source_name, rollups[source_name], data_status)
+        figures = get_kecamatan_jk_figures(store, selected_tahun, selected_semester, version, anomalies, forecast)
+        if base is not None:
+            # Mode perbandingan: grafik total dan jenis kelamin diganti grafik dua periode
+            figures = {**figures, **get_kecamatan_comparison_figures(store, base, current, version)}
+        if has_jenis_kelamin:
+            # Mengganti tampilan total penduduk dengan desain card
+            st.markdown("#### Total Jumlah Penduduk Berdasarkan Jenis Kelamin")
+            render_cards(jenis_kelamin_cards(df_filtered_kecamatan), 3)
+            st.markdown("---")
+
+        if base is not None:
+            st.markdown(f"### Perbandingan {period_label(*current)} dengan {period_label(*base)}")
+        if has_jenis_kelamin:
+            col1, col2 = st.columns(2)
+            with col1:
+                st.plotly_chart(figures['total'], width="stretch")
+            with col2:
+                st.plotly_chart(figures['jenis_kelamin'], width="stretch")
+        else:
+            st.plotly_chart(figures['total'], width="stretch")
+        if base is not None:
+            st.plotly_chart(figures['selisih'], width="stretch")
+            rollup_key = 'kecamatan_jk' if has_jenis_kelamin else 'kecamatan_kategori'
+            render_comparison_table(get_period_comparison(store, rollup_key, [KECAMATAN_COL], base, current, version), KECAMATAN_COL, "Kecamatan", base, current)
+
+        st.markdown("---")
+        st.markdown("### Tren Total Jumlah Penduduk per Kecamatan dari Tahun ke Tahun")
+        st.plotly_chart(figures['tren'], width="stretch")
+        render_forecast(forecast, 'kecamatan')
+        st.markdown("---")
+
+        st.markdown("### Rasio Penduduk per Kecamatan")
+        render_ratios(key, ['rasio_jenis_kelamin', 'pangsa_pct', 'rasio_bekerja'], ['jumlah', 'laki_laki', 'perempuan', 'rasio_jenis_kelamin', 'pangsa_pct', 'rasio_bekerja'], selected_tahun, selected_semester, rollups, data_status)
+        st.markdown("---")
+
+        st.markdown("### Pertumbuhan Total Penduduk per Kecamatan")
+        render_growth(source_name, 'kecamatan', KECAMATAN_COL, "Kecamatan", key, selected_tahun, selected_semester, rollups, data_status)
+
+        st.markdown("---")
+        period = (selected_tahun, selected_semester)
+        rollup_key = 'kecamatan_jk' if has_jenis_kelamin else 'kecamatan_kategori'
+        render_downloads(source_name, key, {
+            f"Rekap kecamatan {period_label(*period)}": (f"{rollup_key}_{period_slug(*period)}", df_filtered_kecamatan, None),
+            "Rekap kecamatan semua periode": (rollup_key, store.rollups[rollup_key], None),
+            "Dataset lengkap": ("lengkap", data_aggr[source_name], None),
+        })
+    except Exception as e:
+        st.error(f"Error saat memproses data Kecamatan & Jenis Kelamin: {e}")
+
+def render_kecamatan_detail(kecamatan, rollups, data_status=None):
+    """
+    Menampilkan semua dataset untuk satu kecamatan: kartu jenis kelamin, grafik periode
+    terpilih dan tren setiap dataset. Rollup kecamatan diambil dari KecamatanStore.
+    """
+    stores = {}
+    for name in DATASET_SPECS:
+        if name in rollups and 'kecamatan_kategori' in rollups[name]:
+            store, version = get_kecamatan_period_store(get_kecamatan_store(name, rollups[name], data_status), kecamatan, data_status)
+            if store.periods:
+                stores[name] = (store, version)
+    if not stores:
+        st.info(f"Tidak ada data untuk Kecamatan {kecamatan}.")
+        return
+
+    source = find_kecamatan_jk_source({name: store.rollups for name, (store, _) in stores.items()})
+    periods = sorted({period for store, _ in stores.values() for period in store.periods}, key=lambda period: (period[0], period[1] or 0), reverse=True)
+    selected_tahun, selected_semester = select_period(periods, 'detail_kecamatan')
+    if source is not None:
+        df_jk = stores[source][0].slice('kecamatan_jk', selected_tahun, selected_semester)
+        if not df_jk.empty:
+            st.markdown(f"#### Jumlah Penduduk Kecamatan {kecamatan} Berdasarkan Jenis Kelamin")
+            render_cards(jenis_kelamin_cards(df_jk), 3)
+
+    for name, (store, version) in stores.items():
+        label = DATASET_SPECS[name]['label']
+        st.markdown("---")
+        st.markdown(f"### {label}")
+        render_stale_badge(name, data_status)
+        figures = get_category_figures(store, selected_tahun, selected_semester, version)
+        if store.slice('kategori', selected_tahun, selected_semester).empty:
+            st.info(f"Data {label} tidak tersedia untuk periode yang dipilih.")
+        else:
+            col1, col2 = st.columns(2)
+            with col1:
+                st.plotly_chart(figures['bar'], width="stretch")
+            with col2:
+                st.plotly_chart(figures['pie'], width="stretch")
+        st.plotly_chart(figures['tren'], width="stretch")
+
+def render_raw_explorer(name, df, data_status=None, key=None, page_sizes=(25, 50, 100, 250)):
+    """
+    Penjelajah data mentah dengan paging, pengurutan dan filter kolom di sisi server.
+
+    Filter dan urutan hanya menghasilkan array posisi baris (di cache per versi data);
+    yang dikirim ke browser hanya baris pada halaman yang sedang dibuka.
+    """
+    key = key or f'mentah_{name}'
+    columns = [col for col in df.columns if col != 'jumlah']
+
+    filters = {}
+    filter_cols = st.columns(max(len(columns), 1))
+    for col, filter_col in zip(columns, filter_cols):
+        with filter_col:
+            options = sorted(df[col].dropna().unique())
+            filters[col] = st.multiselect(f"Filter {COLUMN_LABELS.get(col, col)}:", options, key=f'{key}_filter_{col}')
+
+    col_sort, col_dir, col_size = st.columns([2, 1, 1])
+    with col_sort:
+        sort_by = st.selectbox("Urutkan berdasarkan:", [None] + list(df.columns), format_func=lambda col: "(urutan asli)" if col is None else COLUMN_LABELS.get(col, col), key=f'{key}_sort')
+    with col_dir:
+        ascending = st.radio("Arah:", ["Naik", "Turun"], horizontal=True, key=f'{key}_dir') == "Naik"
+    with col_size:
+        page_size = st.selectbox("Baris per halaman:", page_sizes, key=f'{key}_size')
+
+    order = get_row_order(name, df, data_status, filters, sort_by, ascending)
+    n_pages = page_count(len(order), page_size)
+    page = st.number_input(f"Halaman (dari {n_pages:,}):", min_value=1, max_value=n_pages, value=1, step=1, key=f'{key}_page')
+    page = min(int(page), n_pages)
+
+    st.caption(f"{len(order):,} dari {len(df):,} baris cocok dengan filter. Menampilkan halaman {page:,} dari {n_pages:,}.")
+    st.dataframe(page_rows(df, order, page, page_size).rename(columns=COLUMN_LABELS), width="stretch")
@@ -0,0 +1,411 @@
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import fcntl
+except ImportError:  # Windows: koordinasi hanya di dalam satu proses
+    fcntl = None
+
+# --- Cache respons API bersama antar proses ---
+# Beberapa proses Streamlit di belakang proxy berbagi direktori cache lokal.
+# Setiap URL punya file lock; hanya pemegang lock yang memanggil API, proses
+# dan sesi lain menunggu lalu memakai hasil yang sudah ditulis ke disk.
+
+CACHE_DIR = os.environ.get("DISKOMINFO_CACHE_DIR", os.path.join(tempfile.gettempdir(), "diskominfo_cache"))
+
+_local_locks = {}
+_local_locks_guard = threading.Lock()
+
+
+def _cache_paths(cache_dir, api_url):
+    key = hashlib.sha1(api_url.encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, f"{key}.json"), os.path.join(cache_dir, f"{key}.lock")
+
+
+def _read_if_fresh(data_path, ttl):
+    """Isi cache bila umurnya masih di bawah `ttl` detik, selain itu None."""
+    try:
+        if time.time() - os.path.getmtime(data_path) >= ttl:
+            return None
+        with open(data_path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_atomic(data_path, data):
+    """Menulis `data` sebagai JSON ke `data_path` lewat file sementara, sehingga pembaca tidak pernah melihat isi setengah jadi."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(data_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, data_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _local_lock(lock_path):
+    with _local_locks_guard:
+        return _local_locks.setdefault(lock_path, threading.Lock())
+
+
+def _acquire_file_lock(lock_file, timeout):
+    """Mencoba flock eksklusif hingga `timeout` detik. True bila berhasil."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.2)
+
+
+def fetch_single_flight(api_url, fetcher, ttl=3600, cache_dir=None, lock_timeout=300):
+    """
+    Mengambil respons JSON `api_url` dengan koordinasi single-flight antar proses.
+
+    Bila cache di disk masih segar, hasilnya langsung dipakai. Bila tidak, hanya satu
+    pemanggil (lintas proses maupun thread) yang menjalankan `fetcher(api_url)`; pemanggil
+    lain menunggu lock lalu membaca hasil yang baru ditulis. Bila lock tidak didapat dalam
+    `lock_timeout` detik, pemanggil mengambil sendiri agar tidak macet selamanya.
+    Error dari `fetcher` diteruskan ke pemanggil dan tidak ditulis ke cache.
+    """
+    cache_dir = cache_dir or CACHE_DIR
+    os.makedirs(cache_dir, exist_ok=True)
+    data_path, lock_path = _cache_paths(cache_dir, api_url)
+
+    data = _read_if_fresh(data_path, ttl)
+    if data is not None:
+        return data
+
+    with _local_lock(lock_path):
+        with open(lock_path, 'a') as lock_file:
+            locked = fcntl is not None and _acquire_file_lock(lock_file, lock_timeout)
+            try:
+                # Proses lain mungkin sudah memperbarui cache selama kita menunggu lock
+                data = _read_if_fresh(data_path, ttl)
+                if data is not None:
+                    return data
+                data = fetcher(api_url)
+                write_atomic(data_path, data)
+                return data
+            finally:
+                if locked:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def snapshot_mtime(api_url, cache_dir=None):
+    """Waktu (epoch) snapshot terakhir yang berhasil diambil untuk `api_url`, atau None."""
+    data_path, _ = _cache_paths(cache_dir or CACHE_DIR, api_url)
+    try:
+        return os.path.getmtime(data_path)
+    except OSError:
+        return None
+
+
+def read_snapshot(api_url, cache_dir=None):
+    """
+    Snapshot terakhir yang berhasil diambil untuk `api_url` tanpa memperhatikan umurnya.
+
+    Dipakai sebagai data last-known-good saat API sedang gagal. None bila belum ada.
+    """
+    data_path, _ = _cache_paths(cache_dir or CACHE_DIR, api_url)
+    try:
+        with open(data_path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+# --- Circuit breaker per dataset ---
+class CircuitOpenError(Exception):
+    """Dilempar saat circuit breaker terbuka: pemanggilan ditolak tanpa menghubungi API."""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker sederhana untuk satu sumber data.
+
+    Setelah `failure_threshold` kegagalan berturut-turut, breaker terbuka dan setiap
+    pemanggilan langsung gagal selama `reset_timeout` detik. Setelah itu satu percobaan
+    diizinkan (half-open); bila berhasil breaker kembali tertutup.
+    """
+
+    def __init__(self, failure_threshold=3, reset_timeout=300):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    def call(self, func, *args, **kwargs):
+        with self._lock:
+            if self.opened_at is not None:
+                remaining = self.reset_timeout - (time.monotonic() - self.opened_at)
+                if remaining > 0:
+                    raise CircuitOpenError(f"API sedang gagal berulang kali, dicoba lagi dalam {remaining:.0f} detik")
+                # Half-open: pemanggil ini mencoba, pemanggil lain tetap ditolak selama percobaan
+                self.opened_at = time.monotonic()
+
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            with self._lock:
+                self.failures += 1
+                if self.failures >= self.failure_threshold:
+                    self.opened_at = time.monotonic()
+            raise
+
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+        return result
+
+
+_breakers = {}
+
+
+def get_circuit_breaker(key, **kwargs):
+    """Circuit breaker milik proses ini untuk `key` (misalnya URL dataset)."""
+    with _local_locks_guard:
+        if key not in _breakers:
+            _breakers[key] = CircuitBreaker(**kwargs)
+        return _breakers[key]
+
+
+# --- Cache memori berbatas byte ---
+_MISSING = object()
+
+
+def estimate_nbytes(value):
+    """
+    Perkiraan ukuran `value` di memori (byte).
+
+    DataFrame/Series diukur dengan memory_usage(deep=True), array numpy serta store
+    (PeriodStore, GrowthStore, dsb.) lewat atribut nbytes, figure Plotly dari ukuran
+    pickle-nya, dan container dijumlahkan isinya.
+    """
+    if hasattr(value, 'memory_usage'):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, 'sum') else int(usage)
+    if hasattr(value, 'nbytes'):
+        return int(value.nbytes)
+    if hasattr(value, 'to_plotly_json'):
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_nbytes(k) + estimate_nbytes(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class SizedLRUCache:
+    """
+    Cache LRU dalam proses dengan batas total ukuran `max_bytes`.
+
+    Ukuran setiap entri diperkirakan sekali saat disimpan (estimate_nbytes). Bila total
+    melebihi batas, entri yang paling lama tidak dipakai dibuang lebih dulu, sehingga
+    rollup yang dipakai setiap rerun tetap tinggal sementara irisan periode yang jarang
+    dibuka terbuang. Entri yang lebih besar dari batas tidak disimpan. Entri dapat diberi
+    `ttl` (detik). Penghitung hit, miss dan eviction tersedia lewat stats().
+    """
+
+    def __init__(self, max_bytes, sizeof=estimate_nbytes):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+        self.rejected = 0
+        self._entries = OrderedDict()  # key -> (value, nbytes, expires_at)
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self._key_locks = {}  # key -> [lock, jumlah pemanggil yang memakainya]
+
+    def _drop(self, key):
+        _, nbytes, _ = self._entries.pop(key)
+        self._nbytes -= nbytes
+        return nbytes
+
+    def _lookup(self, key):
+        """Nilai `key` (ditandai baru dipakai) atau _MISSING. Dipanggil dengan lock dipegang."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        value, _, expires_at = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self._drop(key)
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._lookup(key)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return value
+
+    def __contains__(self, key):
+        """True bila `key` masih tersimpan dan belum kedaluwarsa, tanpa mengubah urutan LRU maupun statistik."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and (entry[2] is None or time.monotonic() < entry[2])
+
+    def put(self, key, value, ttl=None):
+        nbytes = self.sizeof(value)
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if nbytes > self.max_bytes:
+                self.rejected += 1
+                return
+            self._entries[key] = (value, nbytes, expires_at)
+            self._nbytes += nbytes
+            while self._nbytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self.evicted_bytes += self._drop(oldest)
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute, ttl=None):
+        """
+        Nilai `key` dari cache, atau hasil `compute()` yang lalu disimpan.
+
+        Miss bersamaan untuk key yang sama hanya menjalankan `compute` sekali: pemanggil lain
+        menunggu lock per key lalu memakai hasilnya. Lock per key dibuang setelah pemanggil
+        terakhir selesai. Exception dari `compute` diteruskan dan tidak disimpan; pemanggil
+        yang menunggu lalu menghitung sendiri. Bila hasilnya terlalu besar untuk disimpan,
+        setiap pemanggil juga menghitung sendiri.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            key_lock[1] += 1
+        try:
+            with key_lock[0]:
+                with self._lock:
+                    value = self._lookup(key)
+                if value is _MISSING:
+                    value = compute()
+                    self.put(key, value, ttl=ttl)
+        finally:
+            with self._lock:
+                key_lock[1] -= 1
+                if key_lock[1] == 0:
+                    del self._key_locks[key]
+        return value
+
+    def invalidate(self, predicate):
+        """Membuang semua entri yang key-nya memenuhi `predicate(key)`. Mengembalikan jumlahnya."""
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                self._drop(key)
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._nbytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'evicted_bytes': self.evicted_bytes,
+                'rejected': self.rejected,
+            }
+
+
+
+# --- Graf turunan untuk invalidasi per dataset ---
+class DerivationGraph:
+    """
+    Mencatat entri cache mana yang diturunkan dari entri lain.
+
+    Contoh rantai: sumber dataset -> versi data (frame + rollup) -> grafik per periode.
+    Saat isi sebuah sumber berubah, hanya turunan sumber tersebut yang dibuang dari cache;
+    turunan dataset lain tetap tinggal.
+    """
+
+    def __init__(self):
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def add(self, parent, child):
+        with self._lock:
+            self._children.setdefault(parent, set()).add(child)
+
+    def children(self, node):
+        with self._lock:
+            return set(self._children.get(node, ()))
+
+    def descendants(self, node):
+        """Semua node yang (langsung maupun tidak) diturunkan dari `node`."""
+        with self._lock:
+            found = set()
+            stack = [node]
+            while stack:
+                for child in self._children.get(stack.pop(), ()):
+                    if child not in found:
+                        found.add(child)
+                        stack.append(child)
+            return found
+
+    def _remove(self, nodes):
+        """Membuang `nodes` dari graf, sebagai induk maupun sebagai anak. Dipanggil dengan lock dipegang."""
+        for node in nodes:
+            self._children.pop(node, None)
+        for parent in list(self._children):
+            children = self._children[parent]
+            children -= nodes
+            if not children:
+                del self._children[parent]
+
+    def invalidate(self, node, cache):
+        """
+        Membuang semua turunan `node` dari `cache` dan dari graf, termasuk sebagai anak
+        induk lain (turunan beberapa dataset). `node` sendiri tetap ada.
+        Mengembalikan jumlah entri cache yang dibuang.
+        """
+        stale = self.descendants(node)
+        with self._lock:
+            self._remove(stale | {node})
+        return cache.invalidate(lambda key: key in stale)
+
+    def prune(self, cache):
+        """
+        Membuang node daun yang sudah tidak ada di `cache` (misalnya terbuang oleh LRU),
+        berulang hingga tidak ada lagi, sehingga graf tidak tumbuh melebihi isi cache.
+        Mengembalikan jumlah node yang dibuang.
+        """
+        removed = 0
+        with self._lock:
+            while True:
+                dead = {child for children in self._children.values() for child in children
+                        if child not in self._children and child not in cache}
+                if not dead:
+                    return removed
+                self._remove(dead)
+                removed += len(dead)
@@ -0,0 +1,358 @@
+from diskominfo_data import DATASET_SPECS, KECAMATAN_COL, LAKI_LAKI_LABELS, PEREMPUAN_LABELS, TIDAK_BEKERJA_PATTERN, normalize_jenis_kelamin
+from diskominfo_forecast import FORECAST_LABELS, FORECAST_METHOD
+from diskominfo_geo import FEATURE_KEY
+from diskominfo_growth import GROWTH_LABELS
+from diskominfo_metrics import RATIO_LABELS, RATIO_REFERENCES
+
+# --- Definisi grafik bersama ---
+# Dipakai oleh dashboard Streamlit maupun ekspor statis, sehingga tampilan
+# grafik hanya didefinisikan di satu tempat. Plotly Express baru diimpor saat
+# grafik pertama dibangun karena impornya mahal dan tidak dibutuhkan untuk
+# kartu ringkasan maupun grafik yang sudah ada di cache.
+
+# Emoji untuk kartu ringkasan setiap dataset
+CATEGORY_EMOJIS = {
+    "Agama": {
+        'ISLAM': '🕌',
+        'KRISTEN': '✝️',
+        'KATHOLIK': '⛪',
+        'HINDU': '🕉️',
+        'BUDHA': '☸️',
+        'KHONGHUCU': '🏮',
+        'KEPERCAYAAN': '✨'
+    },
+    "Perkawinan": {
+        'KAWIN': '💍',
+        'BELUM KAWIN': '👤',
+        'CERAI HIDUP': '💔',
+        'CERAI MATI': '🕊️'
+    },
+    "Golongan Darah": {
+        'A': '🩸',
+        'A+': '🩸',
+        'A-': '🩸',
+        'B': '💉',
+        'B+': '💉',
+        'B-': '💉',
+        'AB': '🧬',
+        'AB+': '🧬',
+        'AB-': '🧬',
+        'O': '⭕',
+        'O+': '⭕',
+        'O-': '⭕',
+        'TIDAK TAHU': '❓'
+    },
+}
+
+# Jumlah kartu per baris untuk setiap dataset
+CARDS_PER_ROW = {"Agama": 6, "Perkawinan": 4, "Pekerjaan": 2, "Golongan Darah": 6}
+
+
+def period_title(tahun, semester=None):
+    """Akhiran judul grafik, misalnya 'Tahun 2024 Semester 1'."""
+    return f'Tahun {tahun}' + (f' Semester {semester}' if semester is not None else '')
+
+
+def period_label(tahun, semester=None):
+    """Label periode singkat untuk sumbu grafik tren, misalnya '2024 S1'."""
+    return f'{tahun}' + (f' S{semester}' if semester is not None else '')
+
+
+def _series_frame(series):
+    """DataFrame deret waktu lebar dengan kolom 'periode' sebagai sumbu x."""
+    df = series.reset_index()
+    semesters = df['semester'] if 'semester' in df.columns else [None] * len(df)
+    df.insert(0, 'periode', [period_label(tahun, semester) for tahun, semester in zip(df['tahun'], semesters)])
+    return df
+
+
+def card_html(icon, value, label, color='#5A5A5A'):
+    """Markup HTML untuk satu kartu ringkasan."""
+    return f"""
+    <div style="
+        border-radius: 10px;
+        padding: 20px;
+        background-color: #f0f2f6;
+        display: flex;
+        flex-direction: column;
+        align-items: center;
+        text-align: center;
+        margin: 5px;">
+        <div style="font-size: 32px; color: {color};">{icon}</div>
+        <div style="font-size: 24px; font-weight: bold; margin-top: 10px; color: {color};">{value:,.0f}</div>
+        <div style="font-size: 14px; color: #5A5A5A;">{label}</div>
+    </div>
+    """
+
+
+def category_cards(name, df_sum):
+    """Daftar (ikon, jumlah, label, warna) untuk kartu per kategori dari rollup 'kategori' yang sudah difilter."""
+    category = DATASET_SPECS[name]['category']
+    emojis = CATEGORY_EMOJIS.get(name, {})
+    return [(emojis.get(str(row[category]).upper(), '❓'), row['jumlah'], row[category], '#5A5A5A') for _, row in df_sum.iterrows()]
+
+
+def jenis_kelamin_cards(df_kecamatan_jk):
+    """Kartu laki-laki, perempuan dan total dari rollup 'kecamatan_jk' yang sudah difilter."""
+    df_total_jk = df_kecamatan_jk.groupby('jenis_kelamin')['jumlah'].sum().reset_index()
+    # Label dibandingkan tanpa membedakan huruf besar, sama seperti tabel rasio
+    label = normalize_jenis_kelamin(df_total_jk['jenis_kelamin'])
+    laki_laki = df_total_jk[label.isin(LAKI_LAKI_LABELS)]['jumlah'].sum()
+    perempuan = df_total_jk[label.isin(PEREMPUAN_LABELS)]['jumlah'].sum()
+    return [
+        ('👨', laki_laki, 'Laki-laki', '#007BFF'),
+        ('👩', perempuan, 'Perempuan', '#FF69B4'),
+        ('👥', laki_laki + perempuan, 'Total Keseluruhan', '#5A5A5A'),
+    ]
+
+
+def pekerjaan_status_cards(df_sum):
+    """Kartu bekerja dan belum/tidak bekerja dari rollup 'kategori' Pekerjaan yang sudah difilter."""
+    # Menggunakan regex untuk mencari 'belum' dan 'tidak' dalam string
+    tidak_bekerja_mask = df_sum['jenis_pekerjaan'].str.contains(TIDAK_BEKERJA_PATTERN, case=False, na=False)
+    return [
+        ('💼', df_sum[~tidak_bekerja_mask]['jumlah'].sum(), 'Bekerja', '#32CD32'),
+        ('🚫', df_sum[tidak_bekerja_mask]['jumlah'].sum(), 'Belum/Tidak Bekerja', '#FF4500'),
+    ]
+
+
+def summary_cards(name, df_sum):
+    """Kartu ringkasan untuk tab sebuah dataset dari rollup 'kategori' yang sudah difilter."""
+    if name == "Pekerjaan":
+        return pekerjaan_status_cards(df_sum)
+    return category_cards(name, df_sum)
+
+
+def add_anomaly_markers(fig, df_anomalies, column):
+    """Menandai titik anomali (tabel detect_anomalies satu tingkat) di grafik tren dengan nilai deret di `column`."""
+    if df_anomalies is None or df_anomalies.empty:
+        return
+    import plotly.graph_objects as go
+
+    hover = [
+        f"{value}: {change:+.1f}% dari periode sebelumnya (z = {z:.1f})"
+        for value, change, z in zip(df_anomalies[column], df_anomalies['perubahan_pct'], df_anomalies['z'])
+    ]
+    fig.add_trace(go.Scatter(
+        x=[period_label(tahun, semester) for tahun, semester in zip(df_anomalies['tahun'], df_anomalies['semester'])],
+        y=df_anomalies['jumlah'], mode='markers', name='Anomali', hovertext=hover, hoverinfo='text',
+        marker={'symbol': 'x', 'size': 12, 'color': '#D62728', 'line': {'width': 2}},
+    ))
+
+
+def add_forecast_segments(fig, df_forecast, column, method=FORECAST_METHOD):
+    """
+    Menyambung setiap garis tren dengan proyeksi `method` (tabel build_forecast satu
+    tingkat, deret di `column`) sebagai garis putus-putus berwarna sama.
+    """
+    if df_forecast is None or df_forecast.empty:
+        return
+    import plotly.graph_objects as go
+
+    semesters = df_forecast['semester'] if 'semester' in df_forecast.columns else [None] * len(df_forecast)
+    series = {}
+    for value, tahun, semester, projected in zip(df_forecast[column], df_forecast['tahun'], semesters, df_forecast[method]):
+        series.setdefault(str(value), []).append((period_label(tahun, semester), projected))
+    for trace in list(fig.data):
+        points = series.get(str(trace.name))
+        if not points or trace.x is None or len(trace.x) == 0 or trace.y[-1] is None or trace.y[-1] != trace.y[-1]:
+            continue
+        fig.add_trace(go.Scatter(
+            x=[trace.x[-1]] + [x for x, _ in points], y=[trace.y[-1]] + [y for _, y in points],
+            mode='lines+markers', name=f"{trace.name} ({FORECAST_LABELS[method]})", legendgroup=trace.legendgroup, showlegend=False,
+            line={'dash': 'dash', 'color': trace.line.color}, marker={'symbol': 'circle-open', 'color': trace.line.color},
+        ))
+
+
+def category_figures(name, store, tahun, semester=None, anomalies=None, forecast=None):
+    """
+    Membangun grafik tab kategori (Agama, Perkawinan, Pekerjaan, Golongan Darah) dari PeriodStore.
+
+    Mengembalikan dict berisi 'bar', 'pie', 'tren' dan 'kecamatan' (bila data kecamatan tersedia).
+    `anomalies` (tabel detect_anomalies) ditandai di grafik tren dan proyeksi `forecast`
+    (hasil build_forecast) disambung sebagai garis putus-putus.
+    """
+    import plotly.express as px
+
+    spec = DATASET_SPECS[name]
+    category, label = spec['category'], spec['label']
+    suffix = period_title(tahun, semester)
+    df_sum = store.slice('kategori', tahun, semester)
+
+    figures = {}
+    figures['bar'] = px.bar(df_sum, x=category, y='jumlah', title=f'Jumlah Penduduk per {label} {suffix}', labels={category: label, 'jumlah': 'Jumlah Penduduk (jiwa)'}, color=category)
+    figures['bar'].update_layout(xaxis={'categoryorder':'total descending'}, yaxis_tickformat=".2s")
+
+    figures['pie'] = px.pie(df_sum, values='jumlah', names=category, title=f'Proporsi Penduduk Berdasarkan {label} {suffix}', labels={category: label, 'jumlah': 'Jumlah Penduduk (jiwa)'})
+    figures['pie'].update_traces(textposition='inside', textinfo='percent+label')
+
+    if 'kecamatan_kategori' in store:
+        df_kecamatan = store.slice('kecamatan_kategori', tahun, semester)
+        figures['kecamatan'] = px.bar(df_kecamatan, x=KECAMATAN_COL, y='jumlah', color=category, barmode='group', title=f'Sebaran {label} per Kecamatan {suffix}', labels={KECAMATAN_COL: 'Kecamatan', 'jumlah': 'Jumlah Penduduk (jiwa)', category: label})
+        figures['kecamatan'].update_layout(xaxis={'categoryorder':'total descending'}, yaxis_tickformat=".2s")
+
+    series = store.category_series
+    figures['tren'] = px.line(_series_frame(series), x='periode', y=list(series.columns), markers=True, title=f'Tren Jumlah Penduduk Berdasarkan {label}', labels={'periode': 'Periode', 'value': 'Jumlah Penduduk (jiwa)', 'variable': label})
+    figures['tren'].update_layout(hovermode="x unified", yaxis_tickformat=".2s")
+    if anomalies is not None:
+        add_anomaly_markers(figures['tren'], anomalies[anomalies['tingkat'] == 'kategori'], 'kategori')
+    if forecast is not None:
+        add_forecast_segments(figures['tren'], forecast['kategori'], category)
+    return figures
+
+
+def kecamatan_jk_figures(store, tahun, semester=None, anomalies=None, forecast=None):
+    """
+    Membangun grafik tab Kecamatan & Jenis Kelamin dari PeriodStore sebuah dataset.
+
+    Mengembalikan dict berisi 'total', 'tren' dan 'jenis_kelamin' (bila dataset memiliki
+    rollup 'kecamatan_jk'; tanpa itu total per kecamatan dihitung dari 'kecamatan_kategori').
+    `anomalies` (tabel detect_anomalies) ditandai di grafik tren dan proyeksi `forecast`
+    (hasil build_forecast) disambung sebagai garis putus-putus.
+    """
+    import plotly.express as px
+
+    suffix = period_title(tahun, semester)
+    has_jenis_kelamin = 'kecamatan_jk' in store
+    df_kecamatan = store.slice('kecamatan_jk' if has_jenis_kelamin else 'kecamatan_kategori', tahun, semester)
+
+    figures = {}
+    df_bar_kecamatan_total = df_kecamatan.groupby(KECAMATAN_COL, observed=True)['jumlah'].sum().reset_index()
+    figures['total'] = px.bar(df_bar_kecamatan_total, x=KECAMATAN_COL, y='jumlah', title=f'Total Jumlah Penduduk per Kecamatan {suffix}', labels={KECAMATAN_COL: 'Kecamatan', 'jumlah': 'Total Jumlah Penduduk (jiwa)'}, color=KECAMATAN_COL)
+    figures['total'].update_layout(xaxis={'categoryorder':'total descending'}, yaxis_tickformat=".2s")
+
+    if has_jenis_kelamin:
+        figures['jenis_kelamin'] = px.bar(df_kecamatan, x=KECAMATAN_COL, y='jumlah', color='jenis_kelamin', title=f'Jumlah Penduduk per Kecamatan Berdasarkan Jenis Kelamin {suffix}', labels={KECAMATAN_COL: 'Kecamatan', 'jumlah': 'Jumlah Penduduk (jiwa)', 'jenis_kelamin': 'Jenis Kelamin'}, barmode='group')
+        figures['jenis_kelamin'].update_layout(xaxis={'categoryorder':'total descending'}, yaxis_tickformat=".2s")
+
+    series = store.kecamatan_series
+    figures['tren'] = px.line(_series_frame(series), x='periode', y=list(series.columns), markers=True, title='Tren Total Jumlah Penduduk per Kecamatan', labels={'periode': 'Periode', 'value': 'Total Jumlah Penduduk (jiwa)', 'variable': 'Kecamatan'})
+    figures['tren'].update_layout(hovermode="x unified", yaxis_tickformat=".2s")
+    if anomalies is not None:
+        add_anomaly_markers(figures['tren'], anomalies[anomalies['tingkat'] == 'kecamatan'], KECAMATAN_COL)
+    if forecast is not None and 'kecamatan' in forecast:
+        add_forecast_segments(figures['tren'], forecast['kecamatan'], KECAMATAN_COL)
+    return figures
+
+
+# --- Perbandingan dua periode ---
+def _comparison_long(df_compare, x, base, current):
+    """Tabel PeriodStore.compare dalam bentuk panjang dengan kolom 'periode' untuk grafik batang berkelompok."""
+    labels = {'jumlah_pembanding': period_label(*base), 'jumlah': period_label(*current)}
+    df_compare = df_compare[[x] + list(labels)].rename(columns=labels)
+    return df_compare.melt(id_vars=x, value_vars=list(labels.values()), var_name='periode', value_name='jumlah')
+
+
+def delta_figure(df_compare, x, x_label, title, color=None, color_label=None):
+    """
+    Grafik batang divergen 'selisih' per nilai `x` dari tabel PeriodStore.compare.
+
+    Tanpa `color`, batang diwarnai hijau (naik) sampai merah (turun); dengan `color`,
+    batang dikelompokkan per nilai kolom tersebut.
+    """
+    import plotly.express as px
+
+    labels = {x: x_label, 'selisih': 'Selisih (jiwa)', 'selisih_pct': 'Selisih (%)'}
+    if color is None:
+        fig = px.bar(df_compare, x=x, y='selisih', title=title, labels=labels, hover_data={'selisih_pct': ':.2f'}, color='selisih', color_continuous_scale='RdYlGn', color_continuous_midpoint=0)
+        fig.update_layout(coloraxis_showscale=False)
+    else:
+        fig = px.bar(df_compare, x=x, y='selisih', title=title, labels={**labels, color: color_label or color}, hover_data={'selisih_pct': ':.2f'}, color=color, barmode='group')
+    fig.update_layout(xaxis={'categoryorder':'total descending'}, yaxis_tickformat=".2s")
+    fig.add_hline(y=0, line_color='gray')
+    return fig
+
+
+def comparison_figures(name, store, base, current):
+    """
+    Grafik perbandingan tab kategori antara periode `base` dan `current` dari PeriodStore.
+
+    Mengembalikan dict berisi 'bar' (batang berkelompok per periode), 'pie' (dua proporsi
+    berdampingan), 'selisih' (selisih per kategori) dan 'kecamatan' (selisih total per
+    kecamatan, bila data kecamatan tersedia).
+    """
+    import plotly.express as px
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    spec = DATASET_SPECS[name]
+    category, label = spec['category'], spec['label']
+    suffix = f'{period_label(*current)} vs {period_label(*base)}'
+    df_compare = store.compare('kategori', [category], base, current)
+
+    figures = {}
+    figures['bar'] = px.bar(_comparison_long(df_compare, category, base, current), x=category, y='jumlah', color='periode', barmode='group', title=f'Jumlah Penduduk per {label} {suffix}', labels={category: label, 'jumlah': 'Jumlah Penduduk (jiwa)', 'periode': 'Periode'})
+    figures['bar'].update_layout(xaxis={'categoryorder':'total descending'}, yaxis_tickformat=".2s")
+
+    figures['pie'] = make_subplots(rows=1, cols=2, specs=[[{'type': 'domain'}, {'type': 'domain'}]], subplot_titles=[period_label(*base), period_label(*current)])
+    for col, values in enumerate(('jumlah_pembanding', 'jumlah'), start=1):
+        figures['pie'].add_trace(go.Pie(labels=df_compare[category].astype(str), values=df_compare[values], textposition='inside', textinfo='percent+label', name=period_label(*(base if col == 1 else current))), row=1, col=col)
+    figures['pie'].update_layout(title_text=f'Proporsi Penduduk Berdasarkan {label} {suffix}')
+
+    figures['selisih'] = delta_figure(df_compare, category, label, f'Selisih Jumlah Penduduk per {label} {suffix}')
+    if 'kecamatan_kategori' in store:
+        df_kecamatan = store.compare('kecamatan_kategori', [KECAMATAN_COL], base, current)
+        figures['kecamatan'] = delta_figure(df_kecamatan, KECAMATAN_COL, 'Kecamatan', f'Selisih Jumlah Penduduk per Kecamatan {suffix}')
+    return figures
+
+
+def kecamatan_comparison_figures(store, base, current):
+    """
+    Grafik perbandingan tab Kecamatan & Jenis Kelamin antara periode `base` dan `current`.
+
+    Mengembalikan dict berisi 'total' (batang berkelompok per periode), 'selisih' (selisih
+    total per kecamatan) dan 'jenis_kelamin' (selisih per kecamatan x jenis kelamin, bila
+    dataset memiliki rollup 'kecamatan_jk').
+    """
+    import plotly.express as px
+
+    suffix = f'{period_label(*current)} vs {period_label(*base)}'
+    has_jenis_kelamin = 'kecamatan_jk' in store
+    key = 'kecamatan_jk' if has_jenis_kelamin else 'kecamatan_kategori'
+    df_compare = store.compare(key, [KECAMATAN_COL], base, current)
+
+    figures = {}
+    figures['total'] = px.bar(_comparison_long(df_compare, KECAMATAN_COL, base, current), x=KECAMATAN_COL, y='jumlah', color='periode', barmode='group', title=f'Total Jumlah Penduduk per Kecamatan {suffix}', labels={KECAMATAN_COL: 'Kecamatan', 'jumlah': 'Total Jumlah Penduduk (jiwa)', 'periode': 'Periode'})
+    figures['total'].update_layout(xaxis={'categoryorder':'total descending'}, yaxis_tickformat=".2s")
+    figures['selisih'] = delta_figure(df_compare, KECAMATAN_COL, 'Kecamatan', f'Selisih Total Jumlah Penduduk per Kecamatan {suffix}')
+    if has_jenis_kelamin:
+        df_jk = store.compare(key, [KECAMATAN_COL, 'jenis_kelamin'], base, current)
+        figures['jenis_kelamin'] = delta_figure(df_jk, KECAMATAN_COL, 'Kecamatan', f'Selisih Jumlah Penduduk per Kecamatan Berdasarkan Jenis Kelamin {suffix}', color='jenis_kelamin', color_label='Jenis Kelamin')
+    return figures
+
+
+def growth_figure(df_growth, x, x_label, metric, tahun, semester=None):
+    """Grafik batang metrik pertumbuhan `metric` per nilai `x` dari tabel GrowthStore satu periode."""
+    import plotly.express as px
+
+    suffix = period_title(tahun, semester)
+    fig = px.bar(df_growth, x=x, y=metric, title=f'{GROWTH_LABELS[metric]} per {x_label} {suffix}', labels={x: x_label, metric: GROWTH_LABELS[metric]}, color=metric, color_continuous_scale='RdYlGn', color_continuous_midpoint=0)
+    fig.update_layout(xaxis={'categoryorder':'total descending'}, coloraxis_showscale=False)
+    return fig
+
+
+def ratio_figure(df_ratios, metric, tahun, semester=None):
+    """Grafik batang rasio `metric` per kecamatan dari tabel RatioMetrics satu periode, dengan garis acuan bila ada."""
+    import plotly.express as px
+
+    df_ratios = df_ratios.assign(**{KECAMATAN_COL: df_ratios[KECAMATAN_COL].astype(str)})
+    fig = px.bar(df_ratios, x=KECAMATAN_COL, y=metric, title=f'{RATIO_LABELS[metric]} per Kecamatan {period_title(tahun, semester)}', labels={KECAMATAN_COL: 'Kecamatan', metric: RATIO_LABELS[metric]}, color=metric, color_continuous_scale='Tealgrn')
+    fig.update_layout(xaxis={'categoryorder':'total descending'}, coloraxis_showscale=False)
+    if metric in RATIO_REFERENCES:
+        fig.add_hline(y=RATIO_REFERENCES[metric], line_dash='dash', line_color='gray')
+    return fig
+
+
+def choropleth_figure(df_values, value_col, value_label, title, geojson_url):
+    """
+    Peta choropleth nilai `value_col` per kecamatan.
+
+    Geometri dirujuk lewat URL (lihat diskominfo_geo), sehingga grafik hanya berisi
+    nama kecamatan dan nilainya.
+    """
+    import plotly.express as px
+
+    fig = px.choropleth(df_values, geojson=geojson_url, locations=KECAMATAN_COL, featureidkey=FEATURE_KEY, color=value_col, hover_name=KECAMATAN_COL, color_continuous_scale='Blues', title=title, labels={value_col: value_label})
+    fig.update_geos(fitbounds='locations', visible=False)
+    fig.update_layout(margin={'l': 0, 'r': 0, 'b': 0})
+    return fig
@@ -0,0 +1,467 @@
+import hashlib
+import threading
+
+import numpy as np
+import requests
+import pandas as pd
+
+from diskominfo_cache import estimate_nbytes
+
+# --- Lapisan data bersama ---
+# Modul ini sengaja tidak mengimpor Streamlit agar bisa dipakai oleh dashboard
+# maupun perintah headless (ETL, ekspor, dsb).
+
+# --- URL API untuk setiap dataset ---
+API_URLS = {
+    "Agama": "https://satudata-api.garutkab.go.id/api/datasets/jumlah-penduduk-kabupaten-garut-berdasarkan-agama-4203/",
+    "Pekerjaan": "https://satudata-api.garutkab.go.id/api/datasets/jumlah-penduduk-usia-produktif-kabupaten-garut-berdasarkan-pekerjaan-4489/",
+    "Perkawinan": "https://satudata-api.garutkab.go.id/api/datasets/jumlah-penduduk-kabupaten-garut-berdasarkan-status-kawin-4489/",
+    "Golongan Darah": "https://satudata-api.garutkab.go.id/api/datasets/jumlah-penduduk-kabupaten-garut-berdasarkan-golongan-darah-4167/",
+}
+
+# --- Spesifikasi kolom untuk setiap dataset ---
+# 'category' adalah kolom kategori utama, 'required' wajib ada, 'optional'
+# dipakai bila tersedia (misalnya dataset Pekerjaan tidak selalu punya semester).
+DATASET_SPECS = {
+    "Agama": {
+        "category": "agama",
+        "label": "Agama",
+        "required": ['tahun', 'agama', 'jumlah', 'jenis_kelamin', 'semester'],
+        "optional": [],
+    },
+    "Pekerjaan": {
+        "category": "jenis_pekerjaan",
+        "label": "Pekerjaan",
+        "required": ['tahun', 'jenis_pekerjaan', 'jumlah'],
+        "optional": ['semester', 'jenis_kelamin'],
+    },
+    "Perkawinan": {
+        "category": "status_kawin",
+        "label": "Status Perkawinan",
+        "required": ['tahun', 'status_kawin', 'jumlah', 'jenis_kelamin', 'semester'],
+        "optional": [],
+    },
+    "Golongan Darah": {
+        "category": "gol_drh",
+        "label": "Golongan Darah",
+        "required": ['tahun', 'gol_drh', 'jumlah', 'jenis_kelamin', 'semester'],
+        "optional": [],
+    },
+}
+
+# Pola jenis pekerjaan yang dihitung sebagai belum/tidak bekerja (tanpa membedakan huruf besar)
+TIDAK_BEKERJA_PATTERN = 'belum|tidak'
+
+# Label jenis kelamin yang dikenali, dibandingkan setelah normalize_jenis_kelamin
+LAKI_LAKI_LABELS = ('LAKI-LAKI', 'LAKI LAKI', 'L')
+PEREMPUAN_LABELS = ('PEREMPUAN', 'P')
+
+
+def normalize_jenis_kelamin(values):
+    """Label jenis kelamin untuk dibandingkan dengan LAKI_LAKI_LABELS/PEREMPUAN_LABELS: huruf besar, tanpa spasi tepi."""
+    return values.astype(str).str.strip().str.upper()
+
+
+class PayloadError(ValueError):
+    """Respons API atau snapshot tidak berisi data dataset yang dapat diproses."""
+
+
+def fetch_dataset(api_url, timeout=60):
+    """
+    Mengambil data JSON mentah dari URL API. Error jaringan/HTTP diteruskan ke pemanggil.
+    """
+    response = requests.get(api_url, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+def has_pivot_data(raw_api_response):
+    """True bila respons API memiliki list pada kunci 'data.pivot_data'."""
+    return bool(raw_api_response and 'data' in raw_api_response and 'pivot_data' in raw_api_response['data'] and isinstance(raw_api_response['data']['pivot_data'], list))
+
+
+def extract_pivot_data(raw_api_response):
+    """
+    Mengambil DataFrame dari kunci 'data.pivot_data', atau None bila struktur tidak sesuai.
+    """
+    if has_pivot_data(raw_api_response):
+        return pd.DataFrame(raw_api_response['data']['pivot_data'])
+    return None
+
+
+def content_hash(df):
+    """Hash isi DataFrame (nama kolom dan nilai, tanpa index) untuk mendeteksi perubahan data."""
+    hasher = hashlib.sha1('\x1f'.join(map(str, df.columns)).encode('utf-8'))
+    hasher.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return hasher.hexdigest()
+
+
+def get_kecamatan_col(df):
+    """
+    Nama kolom kecamatan di data mentah API ('nama_kecamatan' atau 'kecamatan').
+
+    Setelah normalize_dataset semua dataset memakai KECAMATAN_COL.
+    """
+    return 'nama_kecamatan' if 'nama_kecamatan' in df.columns else 'kecamatan'
+
+
+# --- Dimensi kecamatan bersama ---
+# Kolom kecamatan kanonik di semua dataset yang sudah dinormalisasi
+KECAMATAN_COL = 'kecamatan'
+
+
+def normalize_kecamatan_names(names):
+    """Nama kecamatan kanonik: huruf besar, tanpa spasi berlebih."""
+    return names.astype(str).str.strip().str.upper().str.replace(r'\s+', ' ', regex=True)
+
+
+class KecamatanDimension:
+    """
+    Tabel dimensi kecamatan: nama kanonik dengan kunci integer (kecamatan_id).
+
+    Kunci diberikan saat nama pertama kali terlihat dan tidak pernah berubah, sehingga
+    semua dataset yang dikodekan dengan dimensi yang sama berbagi kode yang sama. Kolom
+    kecamatan disimpan sebagai Categorical dengan kategori = nama dimensi saat dikodekan,
+    sehingga filter dan groupby berjalan di atas kode integer kecil.
+
+    ETL membangun dimensi dari semua dataset sebelum mengodekan (build_kecamatan_dimension),
+    sehingga semua dataset artefak berbagi dtype yang sama. Di dashboard setiap dataset
+    dikodekan saat diambil terhadap dimensi proses yang terus bertambah, sehingga dtype
+    Categorical-nya per dataset: kategori dataset yang dikodekan lebih awal hanya awalan
+    dimensi. Join dan concat antar dataset karena itu membandingkan nama kecamatan
+    (pandas memakai dtype object bila kategorinya berbeda), bukan kode.
+    """
+
+    def __init__(self, names=()):
+        self.names = []
+        self.ids = {}
+        self._lock = threading.Lock()
+        self.update(names)
+
+    def update(self, names):
+        """Menambahkan nama kanonik yang belum ada. Mengembalikan True bila dimensi bertambah."""
+        with self._lock:
+            added = False
+            for kecamatan in names:
+                if kecamatan not in self.ids:
+                    self.ids[kecamatan] = len(self.names)
+                    self.names.append(kecamatan)
+                    added = True
+            return added
+
+    @property
+    def dtype(self):
+        return pd.CategoricalDtype(list(self.names))
+
+    def encode(self, names):
+        """Series nama kecamatan mentah -> Categorical berkode kecamatan_id."""
+        canonical = normalize_kecamatan_names(names)
+        self.update(sorted(canonical.unique()))
+        return canonical.astype(self.dtype)
+
+    def table(self):
+        """DataFrame dimensi: kecamatan_id dan nama kecamatan."""
+        return pd.DataFrame({'kecamatan_id': range(len(self.names)), KECAMATAN_COL: list(self.names)})
+
+    @classmethod
+    def from_table(cls, df):
+        return cls(df.sort_values('kecamatan_id')[KECAMATAN_COL].tolist())
+
+
+def build_kecamatan_dimension(frames, dimension=None):
+    """Dimensi kecamatan dari kumpulan DataFrame mentah, melanjutkan `dimension` bila diberikan."""
+    dimension = dimension or KecamatanDimension()
+    names = set()
+    for df_raw in frames:
+        kecamatan_col = get_kecamatan_col(df_raw)
+        if kecamatan_col in df_raw.columns:
+            names.update(normalize_kecamatan_names(df_raw[kecamatan_col].dropna()).unique())
+    dimension.update(sorted(names))
+    return dimension
+
+
+def normalize_dataset(name, df_raw, dimension=None):
+    """
+    Membersihkan dan memberi tipe pada DataFrame mentah sebuah dataset.
+
+    Kolom wajib yang kosong dibuang, 'tahun' dan 'semester' dijadikan int (API kadang
+    mengirim semester sebagai teks) dan 'jumlah' numerik. Kolom kecamatan diganti nama
+    menjadi KECAMATAN_COL dan dikodekan terhadap `dimension` (dimensi baru bila tidak
+    diberikan). Memunculkan PayloadError bila kolom wajib tidak ditemukan atau nilainya
+    tidak dapat dikonversi.
+    """
+    spec = DATASET_SPECS[name]
+    kecamatan_col = get_kecamatan_col(df_raw)
+    missing_cols = [col for col in spec['required'] if col not in df_raw.columns]
+    if missing_cols:
+        raise PayloadError(f"Kolom yang dibutuhkan untuk visualisasi {spec['label']} tidak ditemukan: {', '.join(missing_cols)}")
+
+    subset = list(spec['required'])
+    for col in spec['optional'] + [kecamatan_col]:
+        if col in df_raw.columns:
+            subset.append(col)
+
+    df = df_raw.dropna(subset=subset).copy()
+    try:
+        df['tahun'] = df['tahun'].astype(int)
+        df['jumlah'] = pd.to_numeric(df['jumlah'])
+        if 'semester' in df.columns:
+            df['semester'] = pd.to_numeric(df['semester']).astype(int)
+    except (TypeError, ValueError) as e:
+        raise PayloadError(f"Nilai tahun/semester/jumlah data {spec['label']} tidak valid: {e}") from e
+    if kecamatan_col in df.columns:
+        if kecamatan_col != KECAMATAN_COL:
+            df = df.drop(columns=[KECAMATAN_COL], errors='ignore').rename(columns={kecamatan_col: KECAMATAN_COL})
+        df[KECAMATAN_COL] = (dimension or KecamatanDimension()).encode(df[KECAMATAN_COL])
+    return df.reset_index(drop=True)
+
+
+def get_period_cols(df):
+    """Kolom periode yang tersedia: ['tahun', 'semester'] atau hanya ['tahun']."""
+    return [col for col in ('tahun', 'semester') if col in df.columns]
+
+
+def build_rollups(name, df):
+    """
+    Menghitung agregasi yang dipakai oleh tab dashboard dari DataFrame yang sudah dinormalisasi.
+
+    Setiap rollup dijumlahkan per periode (tahun, semester) dan terurut per periode,
+    sehingga tab cukup mengambil irisan baris (lihat PeriodStore). Tren tidak disimpan
+    sebagai rollup terpisah: deretnya diturunkan dari rollup per periode, bukan dengan
+    menjumlahkan kedua semester dalam satu tahun (yang menghitung penduduk dua kali).
+    """
+    category = DATASET_SPECS[name]['category']
+    period_cols = get_period_cols(df)
+
+    rollups = {
+        'kategori': df.groupby(period_cols + [category])['jumlah'].sum().reset_index(),
+    }
+    if KECAMATAN_COL in df.columns:
+        rollups['kecamatan_kategori'] = df.groupby(period_cols + [KECAMATAN_COL, category], observed=True)['jumlah'].sum().reset_index()
+        if 'jenis_kelamin' in df.columns:
+            rollups['kecamatan_jk'] = df.groupby(period_cols + [KECAMATAN_COL, 'jenis_kelamin'], observed=True)['jumlah'].sum().reset_index()
+    return rollups
+
+
+def partition_hashes(df):
+    """
+    Hash isi per periode: {(tahun, semester): 'hash:jumlah_baris'}, semester None bila tidak ada.
+
+    Hash baris dijumlahkan per periode sehingga urutan baris dari API tidak berpengaruh.
+    """
+    period_cols = get_period_cols(df)
+    row_hashes = pd.util.hash_pandas_object(df[sorted(df.columns)], index=False)
+    grouped = row_hashes.groupby([df[col] for col in period_cols]).agg(['sum', 'size'])
+    partitions = {}
+    for key, (total, size) in zip(grouped.index, grouped.itertuples(index=False)):
+        tahun, semester = (key, None) if len(period_cols) == 1 else key
+        partitions[(tahun, semester)] = f"{int(total) & 0xFFFFFFFFFFFFFFFF:016x}:{int(size)}"
+    return partitions
+
+
+def _period_mask(df, periods):
+    """Mask baris `df` yang periodenya ada di `periods` ({(tahun, semester)})."""
+    if 'semester' not in df.columns:
+        return df['tahun'].isin({tahun for tahun, _ in periods})
+    return pd.MultiIndex.from_frame(df[['tahun', 'semester']]).isin(list(periods))
+
+
+def _concat_rollups(df_a, df_b):
+    """Menggabungkan dua rollup; kolom Categorical digabung dengan union kategorinya agar tetap Categorical."""
+    merged = pd.concat([df_a, df_b], ignore_index=True)
+    for col in df_b.columns:
+        if isinstance(df_b[col].dtype, pd.CategoricalDtype) and isinstance(df_a[col].dtype, pd.CategoricalDtype):
+            merged[col] = pd.api.types.union_categoricals([df_a[col], df_b[col]])
+    return merged
+
+
+def update_rollups(name, df, previous=None):
+    """
+    Rollup untuk `df`, dihitung ulang hanya untuk periode yang baru atau berubah.
+
+    `previous` berisi (rollups, partitions) dari versi data sebelumnya. Baris periode lain
+    diambil dari rollup sebelumnya. Mengembalikan (rollups, partitions, periode yang berubah).
+    """
+    partitions = partition_hashes(df)
+    if previous is None:
+        return build_rollups(name, df), partitions, set(partitions)
+
+    previous_rollups, previous_partitions = previous
+    changed = {period for period, digest in partitions.items() if previous_partitions.get(period) != digest}
+    changed |= set(previous_partitions) - set(partitions)
+    if not changed:
+        return previous_rollups, partitions, changed
+
+    partial = build_rollups(name, df[_period_mask(df, changed)])
+    if set(partial) != set(previous_rollups) or any(list(partial[key].columns) != list(previous_rollups[key].columns) for key in partial):
+        return build_rollups(name, df), partitions, changed
+
+    rollups = {}
+    for key, df_partial in partial.items():
+        df_previous = previous_rollups[key]
+        group_cols = [col for col in df_partial.columns if col != 'jumlah']
+        merged = _concat_rollups(df_previous[~_period_mask(df_previous, changed)], df_partial)
+        rollups[key] = merged.sort_values(group_cols, ignore_index=True)
+    return rollups, partitions, changed
+
+
+def filter_period(df, tahun, semester=None):
+    """Memfilter DataFrame (data atau rollup) untuk tahun dan semester yang dipilih."""
+    mask = df['tahun'] == tahun
+    if semester is not None and 'semester' in df.columns:
+        mask &= df['semester'] == semester
+    return df[mask]
+
+
+# Dataset yang dapat menjadi sumber tab Kecamatan & Jenis Kelamin, sesuai urutan prioritas
+KECAMATAN_JK_SOURCES = ("Agama", "Perkawinan", "Golongan Darah")
+
+
+def find_kecamatan_jk_source(rollups):
+    """Nama dataset pertama yang memiliki rollup kecamatan x jenis kelamin, atau None."""
+    for name in KECAMATAN_JK_SOURCES:
+        if name in rollups and 'kecamatan_jk' in rollups[name] and not rollups[name]['kecamatan_jk'].empty:
+            return name
+    return None
+
+
+def list_periods(df):
+    """Daftar (tahun, semester) yang ada di data, terbaru lebih dulu. Semester None bila tidak tersedia."""
+    if 'semester' not in df.columns:
+        return [(tahun, None) for tahun in sorted(df['tahun'].unique(), reverse=True)]
+    periods = df[['tahun', 'semester']].drop_duplicates().itertuples(index=False, name=None)
+    return sorted(periods, reverse=True)
+
+
+# --- Penyimpanan deret waktu per periode ---
+def _period_ranges(df):
+    """
+    Rentang baris {(tahun, semester): (awal, akhir)} untuk DataFrame yang terurut per periode.
+
+    Rentang per tahun juga dicatat dengan kunci (tahun, None) karena baris satu tahun
+    selalu bersebelahan.
+    """
+    ranges = {}
+    for cols in (['tahun'], get_period_cols(df)):
+        values = df[cols]
+        boundaries = np.flatnonzero((values != values.shift()).any(axis=1).to_numpy())
+        stops = np.append(boundaries[1:], len(df))
+        for start, stop in zip(boundaries, stops):
+            tahun = values['tahun'].iat[start]
+            semester = values['semester'].iat[start] if len(cols) == 2 else None
+            ranges[(tahun, semester)] = (int(start), int(stop))
+    return ranges
+
+
+def _period_series(df, column):
+    """Deret waktu lebar: satu baris per periode (urut kronologis), satu kolom per nilai `column`."""
+    series = df.pivot_table(index=get_period_cols(df), columns=column, values='jumlah', aggfunc='sum', sort=True, observed=True)
+    series.columns = series.columns.astype(object)
+    return series
+
+
+class PeriodStore:
+    """
+    Rollup satu dataset yang diindeks per periode (tahun, semester).
+
+    slice() mengambil irisan satu periode lewat lookup dict dan iloc tanpa memindai
+    seluruh rollup. Deret per kategori dan per kecamatan dihitung sekali saat store
+    dibangun, sehingga grafik tren cukup membaca hasilnya. Semester None berarti seluruh
+    tahun (atau dataset tanpa semester).
+    """
+
+    def __init__(self, name, rollups):
+        self.name = name
+        self.rollups = {}
+        self._ranges = {}
+        for key, df in rollups.items():
+            period_cols = get_period_cols(df)
+            if not pd.MultiIndex.from_frame(df[period_cols]).is_monotonic_increasing:
+                df = df.sort_values(period_cols, kind='stable', ignore_index=True)
+            self.rollups[key] = df
+            self._ranges[key] = _period_ranges(df)
+
+        self.periods = list_periods(self.rollups['kategori'])
+        self.category_series = _period_series(self.rollups['kategori'], DATASET_SPECS[name]['category'])
+        self.kecamatan_series = None
+        if 'kecamatan_kategori' in self.rollups:
+            self.kecamatan_series = _period_series(self.rollups['kecamatan_kategori'], KECAMATAN_COL)
+
+    @property
+    def nbytes(self):
+        """Perkiraan ukuran di memori (byte) untuk cache memori berbatas byte."""
+        return estimate_nbytes([self.rollups, self._ranges, self.category_series, self.kecamatan_series])
+
+    def __contains__(self, key):
+        return key in self.rollups
+
+    def slice(self, key, tahun, semester=None):
+        """Baris rollup `key` untuk satu periode (DataFrame kosong bila periode tidak ada)."""
+        start, stop = self._ranges[key].get((tahun, semester), (0, 0))
+        return self.rollups[key].iloc[start:stop]
+
+    def compare(self, key, columns, base, current):
+        """
+        Jumlah per `columns` rollup `key` di periode `base` dan `current` (tuple (tahun, semester)).
+
+        Kedua irisan diambil lewat slice(), lalu disejajarkan per nilai `columns`; nilai yang
+        hanya ada di salah satu periode bernilai 0 di periode lainnya. Mengembalikan
+        DataFrame berisi `columns`, 'jumlah_pembanding', 'jumlah', 'selisih' dan 'selisih_pct'.
+        """
+        totals = [self.slice(key, *period).groupby(columns, observed=True)['jumlah'].sum() for period in (base, current)]
+        df = pd.concat(totals, axis=1, keys=['jumlah_pembanding', 'jumlah']).fillna(0).astype('int64')
+        df['selisih'] = df['jumlah'] - df['jumlah_pembanding']
+        df['selisih_pct'] = (df['selisih'] / df['jumlah_pembanding'].where(df['jumlah_pembanding'] > 0)) * 100
+        return df.reset_index()
+
+
+class KecamatanStore:
+    """
+    Rollup kecamatan satu dataset yang diurutkan per kode kecamatan, dengan tabel offset.
+
+    Baris setiap kecamatan bersebelahan (dan terurut per periode di dalamnya), sehingga
+    kecamatan_rollups() cukup mengambil irisan iloc lewat lookup offset tanpa
+    membandingkan kolom kecamatan di semua baris. Baris tanpa kecamatan tidak diindeks.
+    """
+
+    def __init__(self, name, rollups):
+        self.name = name
+        self._rollups = {}
+        self._offsets = {}
+        for key in ('kecamatan_kategori', 'kecamatan_jk'):
+            if key not in rollups:
+                continue
+            df = rollups[key]
+            df = df[df[KECAMATAN_COL].notna()]
+            if not isinstance(df[KECAMATAN_COL].dtype, pd.CategoricalDtype):
+                df = df.assign(**{KECAMATAN_COL: df[KECAMATAN_COL].astype('category')})
+            df = df.sort_values([KECAMATAN_COL] + get_period_cols(df), kind='stable', ignore_index=True)
+            categories = df[KECAMATAN_COL].cat.categories
+            bounds = np.searchsorted(df[KECAMATAN_COL].cat.codes.to_numpy(), np.arange(len(categories) + 1))
+            self._rollups[key] = df
+            self._offsets[key] = {
+                str(kecamatan): (int(start), int(stop))
+                for kecamatan, start, stop in zip(categories, bounds[:-1], bounds[1:]) if start < stop
+            }
+        self.kecamatan = sorted(self._offsets.get('kecamatan_kategori', {}))
+
+    @property
+    def nbytes(self):
+        """Perkiraan ukuran di memori (byte) untuk cache memori berbatas byte."""
+        return estimate_nbytes([self._rollups, self._offsets, self.kecamatan])
+
+    def __contains__(self, key):
+        return key in self._rollups
+
+    def slice(self, key, kecamatan):
+        """Baris rollup `key` untuk satu kecamatan (DataFrame kosong bila kecamatan tidak ada)."""
+        start, stop = self._offsets[key].get(kecamatan, (0, 0))
+        return self._rollups[key].iloc[start:stop]
+
+    def kecamatan_rollups(self, kecamatan):
+        """Rollup satu kecamatan dengan kunci yang sama seperti build_rollups, siap untuk PeriodStore."""
+        df_kecamatan = self.slice('kecamatan_kategori', kecamatan)
+        result = {'kategori': df_kecamatan.drop(columns=KECAMATAN_COL), 'kecamatan_kategori': df_kecamatan}
+        if 'kecamatan_jk' in self._rollups:
+            result['kecamatan_jk'] = self.slice('kecamatan_jk', kecamatan)
+        return result
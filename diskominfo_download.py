@@ -0,0 +1,70 @@
+"""
+Ekspor CSV/Parquet bertahap untuk tombol unduh di dashboard.
+
+Data ditulis per potongan baris langsung dari DataFrame bertipe (kolom kategori tetap
+kategori sampai ditulis), sehingga ekspor besar tidak membangun salinan frame atau
+string CSV utuh sebagai perantara. Parquet ditulis per row group dengan pyarrow.
+"""
+import io
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Jumlah baris per potongan saat menulis CSV dan per row group Parquet
+EXPORT_CHUNK_ROWS = 50_000
+
+
+def period_slug(tahun, semester=None):
+    """Bagian nama file untuk satu periode, misalnya '2024-s1'."""
+    return f"{tahun}" + (f"-s{semester}" if semester is not None else "")
+
+
+def period_rows(df, tahun, semester=None):
+    """Posisi baris `df` untuk satu periode (tanpa menyalin barisnya)."""
+    mask = df['tahun'].to_numpy() == tahun
+    if semester is not None and 'semester' in df.columns:
+        mask &= df['semester'].to_numpy() == semester
+    return np.flatnonzero(mask)
+
+
+def iter_chunks(df, rows=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Potongan `df` (atau baris `rows` saja) berukuran paling banyak `chunk_rows` baris."""
+    n_rows = len(df) if rows is None else len(rows)
+    for start in range(0, n_rows, chunk_rows):
+        if rows is None:
+            yield df.iloc[start:start + chunk_rows]
+        else:
+            yield df.iloc[rows[start:start + chunk_rows]]
+
+
+def write_csv(f, df, rows=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Menulis `df` sebagai CSV UTF-8 ke file biner `f`, satu potongan baris setiap kali."""
+    f.write((','.join(map(str, df.columns)) + '\n').encode('utf-8'))
+    for chunk in iter_chunks(df, rows, chunk_rows):
+        f.write(chunk.to_csv(header=False, index=False).encode('utf-8'))
+
+
+def write_parquet(f, df, rows=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Menulis `df` sebagai Parquet ke file biner `f`, satu row group per potongan baris."""
+    schema = pa.Schema.from_pandas(df.iloc[:0], preserve_index=False)
+    with pq.ParquetWriter(f, schema) as writer:
+        for chunk in iter_chunks(df, rows, chunk_rows):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+# Format ekspor: ekstensi -> (label, tipe MIME, fungsi penulis)
+EXPORT_FORMATS = {
+    'csv': ("CSV", 'text/csv', write_csv),
+    'parquet': ("Parquet", 'application/vnd.apache.parquet', write_parquet),
+}
+
+
+def export_buffer(df, fmt, rows=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """`df` (atau baris `rows` saja) dalam format `fmt` sebagai io.BytesIO yang siap dibaca."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Format ekspor tidak dikenal: {fmt}")
+    buffer = io.BytesIO()
+    EXPORT_FORMATS[fmt][2](buffer, df, rows, chunk_rows)
+    buffer.seek(0)
+    return buffer
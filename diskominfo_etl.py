@@ -0,0 +1,259 @@
+"""
+Perintah ETL headless untuk dashboard kependudukan Garut.
+
+Mengambil semua dataset di API_URLS satu kali, menormalisasi, menghitung rollup,
+lalu menulis artefak berversi (tabel Parquet bertipe + rollup) ke direktori lokal.
+Dashboard dapat membaca artefak ini tanpa menyentuh API Satu Data dengan
+menyetel environment variable DISKOMINFO_ARTIFACT_DIR.
+
+Dengan --incremental, artefak terbaru dipakai sebagai penyimpanan historis per
+(tahun, semester): hanya periode yang baru atau berubah yang diagregasi ulang.
+
+Penggunaan:
+    python diskominfo_etl.py --output artifacts
+    python diskominfo_etl.py --output artifacts --incremental
+"""
+import argparse
+import datetime
+import json
+import os
+import shutil
+import sys
+
+import pandas as pd
+
+from diskominfo_data import API_URLS, KECAMATAN_COL, KecamatanDimension, PayloadError, build_kecamatan_dimension, content_hash, extract_pivot_data, fetch_dataset, normalize_dataset, partition_hashes, update_rollups
+from diskominfo_quality import RECONCILE_THRESHOLD, reconcile
+
+LATEST_FILE = "LATEST"
+MANIFEST_FILE = "manifest.json"
+DATA_FILE = "data.parquet"
+KECAMATAN_FILE = "kecamatan.parquet"
+
+
+def dataset_slug(name):
+    """Nama direktori artefak untuk sebuah dataset, misalnya 'Golongan Darah' -> 'golongan_darah'."""
+    return name.lower().replace(' ', '_')
+
+
+def fetch_raw(name, api_url):
+    """DataFrame mentah 'data.pivot_data' sebuah dataset. PayloadError bila strukturnya tidak sesuai."""
+    df_raw = extract_pivot_data(fetch_dataset(api_url))
+    if df_raw is None:
+        raise PayloadError(f"Struktur data API untuk {name} tidak memiliki kunci 'data.pivot_data'.")
+    return df_raw
+
+
+def process_dataset(name, df_raw, dimension=None, previous=None):
+    """
+    Menormalisasi (dengan dimensi kecamatan `dimension`) dan mengagregasi satu dataset.
+
+    `previous` berisi (rollups, partitions) versi sebelumnya; bila diberikan hanya periode
+    yang berubah yang diagregasi ulang (lihat update_rollups).
+    Mengembalikan (df, rollups, periode yang baru atau berubah).
+    """
+    df = normalize_dataset(name, df_raw, dimension)
+    rollups, _, changed = update_rollups(name, df, previous)
+    return df, rollups, changed
+
+
+def _json_scalar(value):
+    return value.item() if hasattr(value, 'item') else value
+
+
+def partitions_to_manifest(partitions):
+    """Hash per periode dalam bentuk JSON: [[tahun, semester, hash], ...]."""
+    return [[_json_scalar(tahun), _json_scalar(semester), digest] for (tahun, semester), digest in sorted(partitions.items(), key=str)]
+
+
+def partitions_from_manifest(entries):
+    return {(tahun, semester): digest for tahun, semester, digest in entries}
+
+
+def _new_version_id(output_dir):
+    version = datetime.datetime.now(datetime.timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    candidate, counter = version, 1
+    while os.path.exists(os.path.join(output_dir, candidate)):
+        candidate = f"{version}-{counter}"
+        counter += 1
+    return candidate
+
+
+def write_artifacts(output_dir, datasets, keep=3, dimension=None):
+    """
+    Menulis satu versi artefak lalu memindahkan penunjuk LATEST secara atomik.
+
+    `datasets` berisi {nama: (DataFrame, rollups)} dan `dimension` adalah dimensi kecamatan
+    yang dipakai untuk mengodekannya. Versi lama di luar `keep` terbaru dihapus.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    version = _new_version_id(output_dir)
+    tmp_dir = os.path.join(output_dir, f".{version}.tmp")
+    os.makedirs(tmp_dir)
+
+    manifest = {
+        'version': version,
+        'created_at': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'datasets': {},
+    }
+    if dimension is not None:
+        dimension.table().to_parquet(os.path.join(tmp_dir, KECAMATAN_FILE), index=False)
+        manifest['kecamatan'] = KECAMATAN_FILE
+    for name, (df, rollups) in datasets.items():
+        slug = dataset_slug(name)
+        dataset_dir = os.path.join(tmp_dir, slug)
+        os.makedirs(dataset_dir)
+        df.to_parquet(os.path.join(dataset_dir, DATA_FILE), index=False)
+        for key, df_rollup in rollups.items():
+            df_rollup.to_parquet(os.path.join(dataset_dir, f"rollup_{key}.parquet"), index=False)
+        manifest['datasets'][name] = {
+            'slug': slug,
+            'url': API_URLS.get(name),
+            'rows': len(df),
+            'content_hash': content_hash(df),
+            'partitions': partitions_to_manifest(partition_hashes(df)),
+            'rollups': sorted(rollups),
+        }
+
+    with open(os.path.join(tmp_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_dir, os.path.join(output_dir, version))
+
+    latest_tmp = os.path.join(output_dir, f".{LATEST_FILE}.tmp")
+    with open(latest_tmp, 'w', encoding='utf-8') as f:
+        f.write(version)
+    os.replace(latest_tmp, os.path.join(output_dir, LATEST_FILE))
+
+    _prune_versions(output_dir, keep)
+    return version
+
+
+def _prune_versions(output_dir, keep):
+    versions = sorted(
+        entry for entry in os.listdir(output_dir)
+        if not entry.startswith('.') and os.path.isfile(os.path.join(output_dir, entry, MANIFEST_FILE))
+    )
+    for version in versions[:-keep] if keep > 0 else []:
+        shutil.rmtree(os.path.join(output_dir, version), ignore_errors=True)
+
+
+def read_latest_version(artifact_dir):
+    """Versi artefak terbaru menurut file LATEST, atau None bila belum ada."""
+    try:
+        with open(os.path.join(artifact_dir, LATEST_FILE), encoding='utf-8') as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def read_manifest(artifact_dir, version):
+    """Isi manifest.json satu versi artefak."""
+    with open(os.path.join(artifact_dir, version, MANIFEST_FILE), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_artifact_dataset(artifact_dir, version, info):
+    """
+    Membaca satu dataset dari sebuah versi artefak. `info` adalah entri dataset di manifest.
+
+    Mengembalikan (DataFrame, rollups).
+    """
+    dataset_dir = os.path.join(artifact_dir, version, info['slug'])
+    # Artefak lama belum menyeragamkan nama kolom kecamatan
+    legacy_columns = {'nama_kecamatan': KECAMATAN_COL}
+    df = pd.read_parquet(os.path.join(dataset_dir, DATA_FILE)).rename(columns=legacy_columns)
+    rollups = {
+        key: pd.read_parquet(os.path.join(dataset_dir, f"rollup_{key}.parquet")).rename(columns=legacy_columns)
+        for key in info['rollups']
+    }
+    return df, rollups
+
+
+def load_dimension(artifact_dir, version=None):
+    """Dimensi kecamatan sebuah versi artefak (default: terbaru), atau None bila tidak ada."""
+    version = version or read_latest_version(artifact_dir)
+    if version is None:
+        return None
+    manifest = read_manifest(artifact_dir, version)
+    if 'kecamatan' not in manifest:
+        return None
+    return KecamatanDimension.from_table(pd.read_parquet(os.path.join(artifact_dir, version, manifest['kecamatan'])))
+
+
+def load_artifacts(artifact_dir, version):
+    """
+    Membaca satu versi artefak.
+
+    Mengembalikan (data, rollups, manifest) dengan data {nama: DataFrame} dan
+    rollups {nama: {kunci: DataFrame}}.
+    """
+    manifest = read_manifest(artifact_dir, version)
+    data, rollups = {}, {}
+    for name, info in manifest['datasets'].items():
+        data[name], rollups[name] = load_artifact_dataset(artifact_dir, version, info)
+    return data, rollups, manifest
+
+
+def load_previous(output_dir):
+    """
+    Rollup dan hash periode per dataset dari artefak terbaru: {nama: (rollups, partitions)}.
+
+    Dataset dari artefak lama yang belum menyimpan hash periode dilewati (diproses penuh).
+    """
+    version = read_latest_version(output_dir)
+    if version is None:
+        return {}
+    manifest = read_manifest(output_dir, version)
+    previous = {}
+    for name, info in manifest['datasets'].items():
+        if 'partitions' in info:
+            _, rollups = load_artifact_dataset(output_dir, version, info)
+            previous[name] = (rollups, partitions_from_manifest(info['partitions']))
+    return previous
+
+
+def refresh(output_dir, keep=3, incremental=False):
+    """
+    Menjalankan ETL untuk semua dataset di API_URLS.
+
+    Bila `incremental`, rollup artefak terbaru dipakai ulang dan hanya periode yang baru
+    atau berubah yang diagregasi ulang. Bila satu dataset gagal, tidak ada versi baru yang
+    ditulis sehingga LATEST tetap menunjuk ke artefak terakhir yang valid.
+    """
+    previous = load_previous(output_dir) if incremental else {}
+    raw = {name: fetch_raw(name, url) for name, url in API_URLS.items()}
+    # Dimensi kecamatan dibangun sekali per refresh dari semua dataset, melanjutkan
+    # dimensi artefak terbaru agar kecamatan_id tetap stabil antar versi
+    dimension = build_kecamatan_dimension(raw.values(), load_dimension(output_dir))
+    datasets = {}
+    for name, df_raw in raw.items():
+        df, rollups, changed = process_dataset(name, df_raw, dimension, previous.get(name))
+        datasets[name] = (df, rollups)
+        if name in previous:
+            print(f"{name}: {len(df)} baris, {len(changed)} periode baru/berubah")
+        else:
+            print(f"{name}: {len(df)} baris")
+
+    selisih = reconcile({name: rollups for name, (_, rollups) in datasets.items()})
+    print(f"Rekonsiliasi: {len(selisih)} selisih total antar dataset di atas {RECONCILE_THRESHOLD:.0%}")
+    return write_artifacts(output_dir, datasets, keep=keep, dimension=dimension)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Membangun artefak data statis untuk dashboard kependudukan Garut.")
+    parser.add_argument('--output', default='artifacts', help="Direktori tujuan artefak (default: artifacts)")
+    parser.add_argument('--keep', type=int, default=3, help="Jumlah versi artefak yang disimpan (default: 3)")
+    parser.add_argument('--incremental', action='store_true', help="Hanya agregasi ulang periode yang baru atau berubah dibanding artefak terbaru")
+    args = parser.parse_args(argv)
+
+    try:
+        version = refresh(args.output, keep=args.keep, incremental=args.incremental)
+    except Exception as e:
+        print(f"Gagal membangun artefak: {e}", file=sys.stderr)
+        return 1
+    print(f"Artefak versi {version} ditulis ke {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
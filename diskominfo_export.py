@@ -0,0 +1,218 @@
+"""
+Ekspor snapshot HTML statis untuk setiap tab x tahun x semester.
+
+Halaman dibangun dari definisi grafik yang sama dengan dashboard
+(diskominfo_charts.py) dan hanya merujuk satu berkas plotly.js bersama,
+sehingga hasilnya dapat disajikan oleh web server biasa tanpa Streamlit.
+Rendering dijalankan paralel dengan process pool.
+
+Penggunaan:
+    python diskominfo_export.py --output site --artifacts artifacts
+"""
+import argparse
+import datetime
+import html
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import plotly.offline
+
+from diskominfo_charts import card_html, category_figures, jenis_kelamin_cards, kecamatan_jk_figures, period_title, summary_cards
+from diskominfo_data import API_URLS, PeriodStore, build_kecamatan_dimension, find_kecamatan_jk_source, list_periods
+from diskominfo_etl import fetch_raw, load_artifacts, process_dataset, read_latest_version
+
+PLOTLY_BUNDLE = "plotly.min.js"
+
+# Tab yang diekspor: (slug, judul tab, dataset). Dataset None berarti tab Kecamatan & Jenis Kelamin.
+EXPORT_TABS = [
+    ('agama', "Berdasarkan Agama", "Agama"),
+    ('kecamatan_jk', "Berdasarkan Kecamatan & Jenis Kelamin", None),
+    ('perkawinan', "Berdasarkan Perkawinan", "Perkawinan"),
+    ('pekerjaan', "Berdasarkan Pekerjaan", "Pekerjaan"),
+    ('golongan_darah', "Berdasarkan Golongan Darah", "Golongan Darah"),
+]
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="id">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<script src="{bundle}"></script>
+<style>
+body {{ font-family: sans-serif; margin: 24px; color: #31333F; }}
+nav a {{ margin-right: 12px; }}
+.cards {{ display: flex; flex-wrap: wrap; }}
+.cards > div {{ flex: 1 1 160px; }}
+.row {{ display: flex; flex-wrap: wrap; }}
+.row > div {{ flex: 1 1 480px; min-width: 0; }}
+</style>
+</head>
+<body>
+<h1>Visualisasi Data Kependudukan Kabupaten Garut</h1>
+<nav>{nav}</nav>
+{body}
+<hr>
+<p>Data bersumber dari <a href="https://satudata.garutkab.go.id">Garut Satu Data</a>. Snapshot dibuat pada {generated}.</p>
+</body>
+</html>
+"""
+
+# Rollup dikirim sekali ke setiap worker lewat initializer, bukan per tugas, lalu
+# diindeks per periode sekali per worker
+_worker_stores = None
+
+
+def _init_worker(rollups):
+    global _worker_stores
+    _worker_stores = {name: PeriodStore(name, dataset_rollups) for name, dataset_rollups in rollups.items()}
+
+
+def page_path(slug, tahun, semester):
+    """Path relatif halaman untuk satu tab dan periode, misalnya 'agama/2024-s1.html'."""
+    return f"{slug}/{tahun}" + (f"-s{semester}" if semester is not None else "") + ".html"
+
+
+def tab_periods(rollups):
+    """Daftar (slug, judul, dataset, periode) untuk setiap tab yang datanya tersedia."""
+    tabs = []
+    for slug, tab_title, dataset in EXPORT_TABS:
+        if dataset is None:
+            source = find_kecamatan_jk_source(rollups)
+            if source is None:
+                continue
+            periods = list_periods(rollups[source]['kecamatan_jk'])
+        elif dataset in rollups:
+            periods = list_periods(rollups[dataset]['kategori'])
+        else:
+            continue
+        tabs.append((slug, tab_title, dataset, periods))
+    return tabs
+
+
+def _figure_html(fig):
+    return fig.to_html(full_html=False, include_plotlyjs=False, config={'responsive': True})
+
+
+def render_tab_body(stores, tab_title, dataset, tahun, semester):
+    """Isi HTML (kartu + grafik) satu tab untuk satu periode. `stores` berisi {nama: PeriodStore}."""
+    if dataset is None:
+        store = stores[find_kecamatan_jk_source({name: store.rollups for name, store in stores.items()})]
+        cards = jenis_kelamin_cards(store.slice('kecamatan_jk', tahun, semester))
+        figures = kecamatan_jk_figures(store, tahun, semester)
+        rows = [['total', 'jenis_kelamin'], ['tren']]
+    else:
+        cards = summary_cards(dataset, stores[dataset].slice('kategori', tahun, semester))
+        figures = category_figures(dataset, stores[dataset], tahun, semester)
+        rows = [['bar', 'pie'], ['kecamatan'], ['tren']]
+
+    parts = [f"<h2>{html.escape(tab_title)} {period_title(tahun, semester)}</h2>"]
+    parts.append('<div class="cards">' + ''.join(card_html(*card) for card in cards) + '</div>')
+    for row in rows:
+        cells = [f"<div>{_figure_html(figures[key])}</div>" for key in row if key in figures]
+        if cells:
+            parts.append('<div class="row">' + ''.join(cells) + '</div>')
+    return '\n'.join(parts)
+
+
+def render_page(task):
+    """Merender dan menulis satu halaman. Dijalankan di worker process pool."""
+    output_dir, slug, tab_title, dataset, tahun, semester, nav, generated = task
+    body = render_tab_body(_worker_stores, tab_title, dataset, tahun, semester)
+    page = PAGE_TEMPLATE.format(
+        title=html.escape(f"{tab_title} {period_title(tahun, semester)}"),
+        bundle=f"../{PLOTLY_BUNDLE}",
+        nav=nav,
+        body=body,
+        generated=generated,
+    )
+    path = os.path.join(output_dir, page_path(slug, tahun, semester))
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(page)
+    return path
+
+
+def _nav_html(tabs, tahun, semester, prefix):
+    links = [f'<a href="{prefix}index.html">Beranda</a>']
+    for slug, tab_title, _, periods in tabs:
+        if (tahun, semester) in periods:
+            links.append(f'<a href="{prefix}{page_path(slug, tahun, semester)}">{html.escape(tab_title)}</a>')
+    return ''.join(links)
+
+
+def write_index(output_dir, tabs, generated):
+    """Menulis index.html berisi tautan ke setiap tab dan periode, periode terbaru di atas."""
+    all_periods = sorted({period for *_, periods in tabs for period in periods}, reverse=True)
+    rows = []
+    for tahun, semester in all_periods:
+        cells = []
+        for slug, _, _, periods in tabs:
+            if (tahun, semester) in periods:
+                cells.append(f'<td><a href="{page_path(slug, tahun, semester)}">Lihat</a></td>')
+            else:
+                cells.append('<td>-</td>')
+        rows.append(f"<tr><th>{period_title(tahun, semester)}</th>{''.join(cells)}</tr>")
+    header = ''.join(f"<th>{html.escape(tab_title)}</th>" for _, tab_title, _, _ in tabs)
+    body = f"<h2>Daftar Snapshot</h2><table><tr><th>Periode</th>{header}</tr>{''.join(rows)}</table>"
+    nav = _nav_html(tabs, *all_periods[0], prefix='') if all_periods else ''
+    with open(os.path.join(output_dir, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write(PAGE_TEMPLATE.format(title="Visualisasi Data Kependudukan Kabupaten Garut", bundle=PLOTLY_BUNDLE, nav=nav, body=body, generated=generated))
+
+
+def export_site(rollups, output_dir, workers=None):
+    """
+    Mengekspor semua tab x periode ke `output_dir`. Mengembalikan jumlah halaman yang ditulis.
+    """
+    generated = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    tabs = tab_periods(rollups)
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, PLOTLY_BUNDLE), 'w', encoding='utf-8') as f:
+        f.write(plotly.offline.get_plotlyjs())
+
+    tasks = []
+    for slug, tab_title, dataset, periods in tabs:
+        os.makedirs(os.path.join(output_dir, slug), exist_ok=True)
+        for tahun, semester in periods:
+            nav = _nav_html(tabs, tahun, semester, prefix='../')
+            tasks.append((output_dir, slug, tab_title, dataset, tahun, semester, nav, generated))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(rollups,)) as executor:
+        written = list(executor.map(render_page, tasks, chunksize=4))
+
+    write_index(output_dir, tabs, generated)
+    return len(written)
+
+
+def load_rollups(artifact_dir=None):
+    """Rollup dari artefak ETL terbaru bila `artifact_dir` diberikan, atau langsung dari API."""
+    if artifact_dir:
+        version = read_latest_version(artifact_dir)
+        if version is None:
+            raise FileNotFoundError(f"Artefak data tidak ditemukan di {artifact_dir}")
+        return load_artifacts(artifact_dir, version)[1]
+    raw = {name: fetch_raw(name, url) for name, url in API_URLS.items()}
+    dimension = build_kecamatan_dimension(raw.values())
+    return {name: process_dataset(name, df_raw, dimension)[1] for name, df_raw in raw.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mengekspor snapshot HTML statis dashboard kependudukan Garut.")
+    parser.add_argument('--output', default='site', help="Direktori tujuan halaman HTML (default: site)")
+    parser.add_argument('--artifacts', default=os.environ.get("DISKOMINFO_ARTIFACT_DIR"), help="Direktori artefak ETL; bila kosong data diambil dari API")
+    parser.add_argument('--workers', type=int, default=None, help="Jumlah worker process pool (default: jumlah CPU)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        count = export_site(load_rollups(args.artifacts), args.output, workers=args.workers)
+    except Exception as e:
+        print(f"Gagal mengekspor snapshot: {e}", file=sys.stderr)
+        return 1
+    print(f"{count} halaman ditulis ke {args.output} dalam {time.perf_counter() - start:.1f} detik")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+Filter global dashboard: periode, subset kecamatan dan jenis kelamin.
+
+FilterIndex mencatat nilai yang tersedia dan posisi baris setiap nilai kolom filter
+satu dataset, dibangun sekali per versi data. Pilihan filter lalu diterjemahkan menjadi
+satu array posisi baris per dataset dengan operasi himpunan pada array terurut, tanpa
+membuat mask boolean baru di setiap tab.
+"""
+import numpy as np
+
+from diskominfo_cache import estimate_nbytes
+from diskominfo_data import KECAMATAN_COL, list_periods
+
+# Kolom yang dapat difilter per baris; periode dipilih per tab (lihat match_period)
+FILTER_COLUMNS = (KECAMATAN_COL, 'jenis_kelamin')
+
+
+class FilterIndex:
+    """Periode, nilai yang tersedia dan posisi baris per nilai kolom filter untuk satu dataset."""
+
+    def __init__(self, df):
+        self.periods = list_periods(df)
+        self._positions = {}
+        for col in FILTER_COLUMNS:
+            if col in df.columns:
+                groups = df.groupby(col, observed=True, sort=False).indices
+                self._positions[col] = {str(value): positions for value, positions in groups.items()}
+        self.values = {col: sorted(positions) for col, positions in self._positions.items()}
+
+    @property
+    def nbytes(self):
+        """Perkiraan ukuran di memori (byte) untuk cache memori berbatas byte."""
+        return estimate_nbytes([self.periods, self._positions, self.values])
+
+    def __contains__(self, col):
+        return col in self._positions
+
+    def rows(self, selections):
+        """
+        Posisi baris terurut yang cocok dengan `selections` {kolom: nilai terpilih}, atau None
+        bila tidak ada filter yang berlaku untuk dataset ini. Nilai dalam satu kolom digabung
+        (atau), antar kolom diiriskan (dan); kolom yang tidak dimiliki dataset dilewati.
+        """
+        rows = None
+        for col, selected in selections.items():
+            if not selected or col not in self._positions:
+                continue
+            positions = self._positions[col]
+            matched = np.sort(np.concatenate([positions[value] for value in selected if value in positions] + [np.empty(0, dtype=np.intp)]))
+            rows = matched if rows is None else np.intersect1d(rows, matched, assume_unique=True)
+        return rows
+
+
+def filter_options(indexes):
+    """Pilihan panel filter dari beberapa FilterIndex: (periode terbaru lebih dulu, {kolom: nilai})."""
+    indexes = list(indexes)
+    periods = sorted({period for index in indexes for period in index.periods}, key=lambda period: (period[0], period[1] or 0), reverse=True)
+    values = {col: sorted({value for index in indexes for value in index.values.get(col, [])}) for col in FILTER_COLUMNS}
+    return periods, values
+
+
+def match_period(periods, period):
+    """
+    Periode di `periods` yang sesuai dengan `period` (tahun, semester), atau None.
+
+    Dataset tanpa semester memakai periode tahunannya, misalnya (2024, None) untuk (2024, 1).
+    """
+    if period is None:
+        return None
+    if period in periods:
+        return period
+    if (period[0], None) in periods:
+        return (period[0], None)
+    return None
@@ -0,0 +1,129 @@
+"""
+Proyeksi jumlah penduduk periode berikutnya per kategori, kecamatan dan kecamatan x kategori.
+
+Rollup disusun menjadi array periode x deret (lihat diskominfo_growth._cube), lalu semua
+deret diproyeksikan sekaligus: tren linier dengan kuadrat terkecil dalam bentuk tertutup,
+dan pemulusan eksponensial ganda (Holt) yang hanya berulang per periode, bukan per deret.
+Hasilnya disimpan per versi data dan ditampilkan sebagai garis putus-putus di grafik tren.
+"""
+import numpy as np
+import pandas as pd
+
+from diskominfo_data import DATASET_SPECS, KECAMATAN_COL
+from diskominfo_growth import _cube, _sum_axis
+
+# Jumlah periode ke depan yang diproyeksikan
+FORECAST_HORIZON = 2
+
+# Parameter pemulusan Holt: level (alpha) dan tren (beta)
+FORECAST_ALPHA = 0.5
+FORECAST_BETA = 0.3
+
+# Metode proyeksi beserta labelnya; FORECAST_METHOD yang digambar di grafik tren
+FORECAST_LABELS = {
+    'holt': "Proyeksi Holt",
+    'linier': "Proyeksi Tren Linier",
+}
+FORECAST_METHOD = 'holt'
+
+
+def next_periods(periods, horizon=FORECAST_HORIZON):
+    """`horizon` periode setelah periode terakhir `periods`: semester berikutnya, atau tahun berikutnya bila tanpa semester."""
+    tahun, semester = periods[-1]
+    result = []
+    for _ in range(horizon):
+        if semester is None:
+            tahun += 1
+        else:
+            tahun, semester = (tahun, 2) if semester == 1 else (tahun + 1, 1)
+        result.append((tahun, semester))
+    return result
+
+
+def linear_forecast(cube, horizon=FORECAST_HORIZON):
+    """
+    Proyeksi tren linier (kuadrat terkecil atas semua periode yang berisi data) setiap deret.
+
+    Sumbu 0 `cube` adalah periode terurut. Hasil berbentuk (horizon,) + cube.shape[1:];
+    deret dengan kurang dari dua titik berisi NaN.
+    """
+    t = np.arange(len(cube), dtype=float).reshape((-1,) + (1,) * (cube.ndim - 1))
+    observed = ~np.isnan(cube)
+    y = np.nan_to_num(cube)
+    n = observed.sum(axis=0)
+    sum_t = (observed * t).sum(axis=0)
+    sum_tt = (observed * t * t).sum(axis=0)
+    sum_y = y.sum(axis=0)
+    sum_ty = (y * t).sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        denominator = n * sum_tt - sum_t ** 2
+        slope = np.where(denominator > 0, (n * sum_ty - sum_t * sum_y) / denominator, np.nan)
+        intercept = (sum_y - slope * sum_t) / n
+    steps = np.arange(len(cube), len(cube) + horizon, dtype=float).reshape((-1,) + (1,) * (cube.ndim - 1))
+    return intercept + slope * steps
+
+
+def holt_forecast(cube, horizon=FORECAST_HORIZON, alpha=FORECAST_ALPHA, beta=FORECAST_BETA):
+    """
+    Proyeksi pemulusan eksponensial ganda (Holt) setiap deret.
+
+    Level dimulai dari titik pertama dan tren dari selisih dua titik pertama; periode
+    kosong di tengah deret diisi nilai prediksinya. Hasil berbentuk (horizon,) +
+    cube.shape[1:]; deret dengan kurang dari dua titik berisi NaN.
+    """
+    shape = cube.shape[1:]
+    level = np.full(shape, np.nan)
+    trend = np.zeros(shape)
+    count = np.zeros(shape, dtype=int)
+    for y in cube:
+        observed = ~np.isnan(y)
+        predicted = level + trend
+        smoothed = alpha * y + (1 - alpha) * predicted
+        first, second, later = observed & (count == 0), observed & (count == 1), observed & (count >= 2)
+        new_level = np.select([first, second, later], [y, y, smoothed], default=np.where(count > 0, predicted, level))
+        trend = np.select([second, later], [y - level, beta * (smoothed - level) + (1 - beta) * trend], default=trend)
+        level = new_level
+        count += observed
+    steps = np.arange(1, horizon + 1, dtype=float).reshape((-1,) + (1,) * len(shape))
+    return np.where(count >= 2, level + steps * trend, np.nan)
+
+
+FORECAST_METHODS = {'holt': holt_forecast, 'linier': linear_forecast}
+
+
+def forecast_frame(cube, periods, labels, columns, horizon=FORECAST_HORIZON):
+    """
+    DataFrame panjang satu baris per periode proyeksi x deret `cube`: periode, `columns`,
+    'langkah' (1 = periode berikutnya) dan proyeksi setiap metode (dibulatkan, minimal 0).
+
+    Hanya deret yang berisi data di periode terakhir yang diproyeksikan.
+    """
+    forecasts = {method: np.clip(np.round(forecast(cube, horizon)), 0, None) for method, forecast in FORECAST_METHODS.items()}
+    active = np.broadcast_to(~np.isnan(cube[-1]), (horizon,) + cube.shape[1:])
+    cell = np.nonzero(active)
+    future = next_periods(periods, horizon)
+
+    frame = {'tahun': np.array([tahun for tahun, _ in future])[cell[0]]}
+    if periods[-1][1] is not None:
+        frame['semester'] = np.array([semester for _, semester in future])[cell[0]]
+    for axis, col in enumerate(columns, start=1):
+        frame[col] = np.array(labels[axis - 1], dtype=object)[cell[axis]]
+    frame['langkah'] = cell[0] + 1
+    for method, values in forecasts.items():
+        frame[method] = values[active]
+    return pd.DataFrame(frame)
+
+
+def build_forecast(name, rollups, horizon=FORECAST_HORIZON):
+    """
+    Tabel proyeksi dataset `name` dari rollup-nya: 'kategori', serta 'kecamatan_kategori'
+    dan 'kecamatan' bila data kecamatan tersedia (kolom seperti build_growth).
+    """
+    category = DATASET_SPECS[name]['category']
+    cube, periods, labels = _cube(rollups['kategori'], [category])
+    forecast = {'kategori': forecast_frame(cube, periods, labels, [category], horizon)}
+    if 'kecamatan_kategori' in rollups:
+        cube, periods, labels = _cube(rollups['kecamatan_kategori'], [KECAMATAN_COL, category])
+        forecast['kecamatan_kategori'] = forecast_frame(cube, periods, labels, [KECAMATAN_COL, category], horizon)
+        forecast['kecamatan'] = forecast_frame(_sum_axis(cube, 2), periods, labels[:1], [KECAMATAN_COL], horizon)
+    return forecast
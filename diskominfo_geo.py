@@ -0,0 +1,262 @@
+"""
+Geometri batas kecamatan untuk peta choropleth.
+
+Berkas GeoJSON yang sudah disederhanakan dan dikuantisasi sebelumnya (GEOMETRY_FILE)
+disajikan sebagai file statis Streamlit, sehingga grafik peta hanya berisi URL-nya
+(GEOMETRY_URL) dan nilai per kecamatan; browser mengunduh geometrinya sekali lalu
+menyimpannya di cache. Server hanya membaca nama kecamatannya, sekali per proses.
+
+Berkas itu dibangun saat deploy dari GeoJSON batas wilayah mentah (path atau URL)
+dengan perintah di bawah: koordinat dibulatkan ke grid (kuantisasi), lalu setiap ring
+disederhanakan dengan Douglas-Peucker. Ring dipotong di titik pertemuan antar kecamatan
+dan setiap potongan batas bersama disederhanakan sekali, sehingga kedua kecamatan
+memakai garis batas yang sama (tanpa celah atau tumpang tindih).
+
+Penggunaan:
+    python diskominfo_geo.py batas_desa.geojson --name-field WADMKC --where WADMKK=Garut
+    python diskominfo_geo.py kecamatan.geojson --name-field nama --tolerance 0.001 --precision 4
+    DISKOMINFO_GEOMETRY_SOURCE=batas_desa.geojson python diskominfo_geo.py --if-missing
+"""
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import requests
+
+from diskominfo_data import normalize_kecamatan_names
+
+# Berkas geometri kecamatan yang dibundel di direktori static/ (server.enableStaticServing)
+# dan URL relatifnya dari halaman dashboard
+GEOMETRY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "kecamatan_garut.geojson")
+GEOMETRY_URL = "app/static/kecamatan_garut.geojson"
+
+# Properti fitur yang berisi nama kecamatan kanonik (lihat normalize_kecamatan_names)
+FEATURE_NAME = "kecamatan"
+FEATURE_KEY = f"properties.{FEATURE_NAME}"
+
+DEFAULT_TOLERANCE = 0.0005  # derajat, sekitar 55 m
+DEFAULT_PRECISION = 4       # desimal, sekitar 11 m
+
+# Batas waktu pengunduhan GeoJSON mentah bila sumbernya URL (detik)
+SOURCE_TIMEOUT = 120
+
+# Sumber default untuk langkah build saat deploy (lihat .devcontainer/devcontainer.json):
+# GeoJSON mentah (path atau URL), properti nama kecamatan, dan filter PROPERTI=NILAI
+# dipisah koma
+GEOMETRY_SOURCE = os.environ.get("DISKOMINFO_GEOMETRY_SOURCE")
+GEOMETRY_NAME_FIELD = os.environ.get("DISKOMINFO_GEOMETRY_NAME_FIELD", "WADMKC")
+GEOMETRY_WHERE = os.environ.get("DISKOMINFO_GEOMETRY_WHERE", "WADMKK=Garut")
+
+
+def load_geometry(path=None):
+    """GeoJSON kecamatan yang dibundel, atau None bila berkasnya belum ada."""
+    try:
+        with open(path or GEOMETRY_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def geometry_names(geojson):
+    """Nama kecamatan semua fitur di `geojson`."""
+    return {feature['properties'][FEATURE_NAME] for feature in geojson['features']}
+
+
+# --- Penyederhanaan ---
+def _douglas_peucker(points, tolerance):
+    """Indeks titik `points` (array n x 2) yang dipertahankan Douglas-Peucker, termasuk kedua ujung."""
+    keep = np.zeros(len(points), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        segment = points[end] - points[start]
+        offsets = points[start + 1:end] - points[start]
+        length = np.hypot(*segment)
+        if length == 0:
+            distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        else:
+            distances = np.abs(segment[0] * offsets[:, 1] - segment[1] * offsets[:, 0]) / length
+        i = int(np.argmax(distances))
+        if distances[i] > tolerance:
+            split = start + 1 + i
+            keep[split] = True
+            stack.extend([(start, split), (split, end)])
+    return np.flatnonzero(keep)
+
+
+def _quantize_ring(ring, precision):
+    """Ring terkuantisasi tanpa titik berurutan yang sama dan tanpa titik penutup."""
+    points = np.round(np.asarray(ring, dtype=float)[:, :2], precision)
+    changed = np.append(True, (np.diff(points, axis=0) != 0).any(axis=1))
+    points = points[changed]
+    if len(points) > 1 and (points[0] == points[-1]).all():
+        points = points[:-1]
+    return points
+
+
+def _polygons(geometry):
+    if geometry['type'] == 'Polygon':
+        return [geometry['coordinates']]
+    if geometry['type'] == 'MultiPolygon':
+        return geometry['coordinates']
+    raise ValueError(f"Tipe geometri tidak didukung: {geometry['type']}")
+
+
+def _fixed_points(ring, owners):
+    """
+    Posisi titik ring yang tidak boleh dibuang: titik tempat himpunan pemiliknya berubah
+    (ujung batas bersama). Ring tanpa titik seperti itu dipaku di titik terkecil dan titik
+    terjauh darinya, dipilih dari koordinat sehingga sama untuk semua ring yang berbagi batas.
+    """
+    keys = [tuple(point) for point in ring]
+    sets = [owners[key] for key in keys]
+    n = len(ring)
+    fixed = [i for i in range(n) if sets[i] != sets[i - 1] or sets[i] != sets[(i + 1) % n]]
+    if fixed:
+        return fixed
+    first = min(range(n), key=lambda i: keys[i])
+    farthest = int(np.argmax(np.hypot(*(ring - ring[first]).T)))
+    return sorted({first, farthest})
+
+
+def _simplify_ring(ring, owners, tolerance, chains):
+    fixed = _fixed_points(ring, owners)
+    ring = np.roll(ring, -fixed[0], axis=0)
+    fixed = [(i - fixed[0]) % len(ring) for i in fixed] + [len(ring)]
+    closed = np.vstack([ring, ring[:1]])
+
+    parts = []
+    for start, end in zip(fixed, fixed[1:]):
+        chain = closed[start:end + 1]
+        forward, backward = tuple(map(tuple, chain)), tuple(map(tuple, chain[::-1]))
+        # Batas bersama dilalui berlawanan arah oleh kedua kecamatan: sederhanakan bentuk kanoniknya sekali
+        canonical = min(forward, backward)
+        if canonical not in chains:
+            points = np.array(canonical)
+            chains[canonical] = points[_douglas_peucker(points, tolerance)]
+        simplified = chains[canonical] if canonical == forward else chains[canonical][::-1]
+        parts.append(simplified[:-1])
+    result = np.vstack(parts + [parts[0][:1]])
+    return result if len(result) >= 4 else np.vstack([ring, ring[:1]])
+
+
+def simplify_features(features, tolerance=DEFAULT_TOLERANCE, precision=DEFAULT_PRECISION):
+    """
+    Menyederhanakan geometri `features` (Polygon/MultiPolygon) dengan mempertahankan topologi.
+
+    Mengembalikan fitur baru dengan koordinat terkuantisasi `precision` desimal.
+    """
+    quantized = [[[_quantize_ring(ring, precision) for ring in polygon] for polygon in _polygons(feature['geometry'])] for feature in features]
+
+    # Pemilik titik dibedakan per poligon, sehingga batas antar poligon dalam satu fitur juga terjaga
+    owners = {}
+    for index, polygons in enumerate(quantized):
+        for polygon_index, polygon in enumerate(polygons):
+            for ring in polygon:
+                for point in map(tuple, ring):
+                    owners.setdefault(point, set()).add((index, polygon_index))
+    owners = {point: frozenset(indexes) for point, indexes in owners.items()}
+
+    chains = {}
+    result = []
+    for feature, polygons in zip(features, quantized):
+        coordinates = [[_simplify_ring(ring, owners, tolerance, chains).tolist() for ring in polygon if len(ring) >= 3] for polygon in polygons]
+        coordinates = [polygon for polygon in coordinates if polygon]
+        result.append({
+            'type': 'Feature',
+            'properties': feature['properties'],
+            'geometry': {'type': 'MultiPolygon', 'coordinates': coordinates},
+        })
+    return result
+
+
+def _merge_by_name(features):
+    """Menggabungkan fitur dengan nama kecamatan yang sama (misalnya batas desa) menjadi satu MultiPolygon."""
+    merged = {}
+    for feature in features:
+        name = feature['properties'][FEATURE_NAME]
+        polygons = merged.setdefault(name, [])
+        polygons.extend(_polygons(feature['geometry']))
+    return [
+        {'type': 'Feature', 'properties': {FEATURE_NAME: name}, 'geometry': {'type': 'MultiPolygon', 'coordinates': polygons}}
+        for name, polygons in merged.items()
+    ]
+
+
+def build_geometry(source, name_field, where=None, tolerance=DEFAULT_TOLERANCE, precision=DEFAULT_PRECISION):
+    """
+    GeoJSON kecamatan siap bundel dari GeoJSON batas wilayah mentah `source`.
+
+    Nama di `name_field` dinormalisasi seperti kolom kecamatan dataset. `where` berisi
+    {properti: nilai} untuk memilih fitur (misalnya hanya Kabupaten Garut).
+    """
+    features = [
+        feature for feature in source['features']
+        if all(str(feature['properties'].get(field)) == value for field, value in (where or {}).items())
+    ]
+    if not features:
+        raise ValueError("Tidak ada fitur yang cocok dengan filter.")
+    names = normalize_kecamatan_names(pd.Series([feature['properties'][name_field] for feature in features]))
+    features = [
+        {'type': 'Feature', 'properties': {FEATURE_NAME: name}, 'geometry': feature['geometry']}
+        for feature, name in zip(features, names)
+    ]
+    features = simplify_features(_merge_by_name(features), tolerance, precision)
+    return {'type': 'FeatureCollection', 'features': sorted(features, key=lambda feature: feature['properties'][FEATURE_NAME])}
+
+
+def read_source(source):
+    """GeoJSON batas wilayah mentah dari path berkas atau URL http(s)."""
+    if source.startswith(('http://', 'https://')):
+        response = requests.get(source, timeout=SOURCE_TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+    with open(source, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _count_points(geojson):
+    return sum(len(ring) for feature in geojson['features'] for polygon in _polygons(feature['geometry']) for ring in polygon)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Menyederhanakan dan menguantisasi GeoJSON batas kecamatan untuk peta dashboard.")
+    parser.add_argument('source', nargs='?', default=GEOMETRY_SOURCE, help="GeoJSON batas wilayah mentah, path atau URL (default: DISKOMINFO_GEOMETRY_SOURCE)")
+    parser.add_argument('--name-field', default=GEOMETRY_NAME_FIELD, help=f"Properti berisi nama kecamatan (default: {GEOMETRY_NAME_FIELD})")
+    parser.add_argument('--where', action='append', default=None, metavar='PROPERTI=NILAI', help=f"Hanya fitur dengan properti bernilai tertentu, dapat diulang (default: {GEOMETRY_WHERE or 'semua fitur'})")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help=f"Toleransi Douglas-Peucker dalam derajat (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument('--precision', type=int, default=DEFAULT_PRECISION, help=f"Jumlah desimal koordinat (default: {DEFAULT_PRECISION})")
+    parser.add_argument('--output', default=GEOMETRY_FILE, help="Berkas tujuan (default: GEOMETRY_FILE)")
+    parser.add_argument('--if-missing', action='store_true', help="Lewati bila berkas tujuan sudah ada (untuk langkah deploy)")
+    args = parser.parse_args(argv)
+
+    if args.if_missing and os.path.exists(args.output):
+        print(f"{args.output} sudah ada, dilewati")
+        return 0
+    if not args.source:
+        print("Sumber geometri belum diatur: berikan path/URL atau atur DISKOMINFO_GEOMETRY_SOURCE.", file=sys.stderr)
+        return 1
+    items = args.where if args.where is not None else [item for item in GEOMETRY_WHERE.split(',') if item]
+    try:
+        where = dict(item.split('=', 1) for item in items)
+        source = read_source(args.source)
+        geojson = build_geometry(source, args.name_field, where, args.tolerance, args.precision)
+    except (OSError, ValueError, KeyError, requests.exceptions.RequestException) as e:
+        print(f"Gagal membangun geometri: {e}", file=sys.stderr)
+        return 1
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(geojson, f, separators=(',', ':'))
+    print(f"{len(geojson['features'])} kecamatan, {_count_points(source):,} -> {_count_points(geojson):,} titik, {os.path.getsize(args.output):,} byte ditulis ke {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+Mesin pertumbuhan: selisih, persentase, CAGR dan perubahan peringkat per periode.
+
+Rollup dijadikan array NumPy berdimensi (periode x kecamatan x kategori) sekali per
+versi data, lalu semua metrik untuk setiap sel dihitung dengan operasi array, tanpa
+loop per kecamatan atau kategori. Total per kecamatan diturunkan dari array yang sama.
+"""
+import numpy as np
+import pandas as pd
+
+from diskominfo_cache import estimate_nbytes
+from diskominfo_data import DATASET_SPECS, KECAMATAN_COL, _period_ranges, get_period_cols
+
+# Kolom metrik hasil growth_frame beserta labelnya di tabel dan grafik
+GROWTH_LABELS = {
+    'delta_semester': "Selisih Semester",
+    'pct_semester': "Pertumbuhan Semester (%)",
+    'delta_tahun': "Selisih Tahunan",
+    'pct_tahun': "Pertumbuhan Tahunan (%)",
+    'cagr': "CAGR (%)",
+    'peringkat': "Peringkat",
+    'perubahan_peringkat': "Perubahan Peringkat",
+}
+GROWTH_COLUMNS = list(GROWTH_LABELS)
+
+# Metrik persentase yang dapat dipilih untuk grafik pertumbuhan
+GROWTH_CHART_METRICS = ('pct_tahun', 'pct_semester', 'cagr')
+
+
+def _cube(df, columns):
+    """
+    Array (periode x nilai kolom pertama x nilai kolom berikutnya ...) berisi 'jumlah'.
+
+    Sel tanpa data berisi NaN. Mengembalikan (cube, periods, labels) dengan periods
+    berupa daftar (tahun, semester) terurut dan labels daftar nilai setiap kolom.
+    """
+    period_cols = get_period_cols(df)
+    period_codes, period_index = pd.MultiIndex.from_frame(df[period_cols]).factorize(sort=True)
+    periods = [(key[0], key[1] if len(key) == 2 else None) for key in period_index]
+
+    codes, labels = [], []
+    for col in columns:
+        col_codes, col_labels = pd.factorize(df[col].astype(object), sort=True)
+        codes.append(col_codes)
+        labels.append(list(col_labels))
+
+    cube = np.full((len(periods),) + tuple(len(values) for values in labels), np.nan)
+    cube[(period_codes, *codes)] = df['jumlah'].to_numpy(dtype=float)
+    return cube, periods, labels
+
+
+def _sum_axis(cube, axis):
+    """Jumlah `cube` sepanjang `axis`; NaN bila semua selnya kosong."""
+    total = np.nansum(cube, axis=axis)
+    return np.where(np.isnan(cube).all(axis=axis), np.nan, total)
+
+
+def _lag(cube, lag_index):
+    """Nilai `cube` pada periode `lag_index[p]` untuk setiap periode p (NaN bila -1)."""
+    lagged = cube[np.maximum(lag_index, 0)]
+    lagged[lag_index < 0] = np.nan
+    return lagged
+
+
+def _pct(current, previous):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(previous > 0, (current - previous) / previous * 100, np.nan)
+
+
+def _ranks(cube):
+    """Peringkat (1 = terbesar) sepanjang sumbu 1 untuk setiap periode dan kolom lain; NaN untuk sel kosong."""
+    order = np.argsort(-np.nan_to_num(cube, nan=-np.inf), axis=1, kind='stable')
+    ranks = np.empty_like(cube)
+    positions = np.arange(1, cube.shape[1] + 1, dtype=float).reshape((1, -1) + (1,) * (cube.ndim - 2))
+    np.put_along_axis(ranks, order, np.broadcast_to(positions, cube.shape), axis=1)
+    ranks[np.isnan(cube)] = np.nan
+    return ranks
+
+
+def growth_metrics(cube, periods):
+    """
+    Metrik pertumbuhan untuk setiap sel `cube` (sumbu 0 = periode terurut).
+
+    Semester-ke-semester membandingkan dengan semester sebelumnya menurut kalender;
+    tahun-ke-tahun dengan semester yang sama setahun sebelumnya. Keduanya NaN bila periode
+    pembandingnya tidak ada (dan semester-ke-semester selalu NaN tanpa semester). CAGR
+    dihitung dari periode pertama. Peringkat dihitung sepanjang sumbu 1 dan perubahannya
+    (dibanding periode tersedia sebelumnya) positif bila peringkat naik.
+    Mengembalikan dict {nama metrik: array berbentuk sama dengan `cube`}.
+    """
+    if not periods:
+        return {key: np.full(cube.shape, np.nan) for key in GROWTH_COLUMNS}
+    index = {period: i for i, period in enumerate(periods)}
+    previous = np.arange(len(periods)) - 1
+    year_ago = np.array([index.get((tahun - 1, semester), -1) for tahun, semester in periods])
+    # Semester sebelumnya menurut kalender, bukan periode tersedia sebelumnya: semester yang
+    # hilang menghasilkan NaN, bukan selisih setahun dengan label "semester"
+    semester_ago = np.array([
+        -1 if semester is None else index.get((tahun, semester - 1) if semester > 1 else (tahun - 1, 2), -1)
+        for tahun, semester in periods
+    ])
+
+    tahun0, semester0 = periods[0]
+    years = np.array([(tahun - tahun0) + ((semester - semester0) / 2 if semester is not None else 0) for tahun, semester in periods], dtype=float)
+    years = years.reshape((-1,) + (1,) * (cube.ndim - 1))
+
+    metrics = {}
+    semester_before = _lag(cube, semester_ago)
+    metrics['delta_semester'] = cube - semester_before
+    metrics['pct_semester'] = _pct(cube, semester_before)
+    year_before = _lag(cube, year_ago)
+    metrics['delta_tahun'] = cube - year_before
+    metrics['pct_tahun'] = _pct(cube, year_before)
+
+    first = cube[:1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cagr = (np.power(cube / first, 1 / years) - 1) * 100
+    metrics['cagr'] = np.where((years > 0) & (first > 0), cagr, np.nan)
+
+    ranks = _ranks(cube)
+    metrics['peringkat'] = ranks
+    metrics['perubahan_peringkat'] = _lag(ranks, previous) - ranks
+    return metrics
+
+
+def growth_frame(cube, periods, labels, columns, period_cols):
+    """DataFrame panjang satu baris per sel `cube` yang berisi data: periode, `columns`, 'jumlah' dan metrik."""
+    metrics = growth_metrics(cube, periods)
+    present = ~np.isnan(cube)
+    cell = np.nonzero(present)
+
+    frame = {'tahun': np.array([periods[p][0] for p in range(len(periods))])[cell[0]]}
+    if 'semester' in period_cols:
+        frame['semester'] = np.array([periods[p][1] for p in range(len(periods))])[cell[0]]
+    for axis, col in enumerate(columns, start=1):
+        frame[col] = np.array(labels[axis - 1], dtype=object)[cell[axis]]
+    frame['jumlah'] = cube[present].astype('int64')
+    for key in GROWTH_COLUMNS:
+        frame[key] = metrics[key][present]
+    return pd.DataFrame(frame)
+
+
+def build_growth(name, rollups):
+    """
+    Tabel pertumbuhan dataset `name` dari rollup-nya: 'kategori', serta
+    'kecamatan_kategori' dan 'kecamatan' bila data kecamatan tersedia.
+
+    Setiap tabel terurut per periode dengan peringkat dihitung antar kategori ('kategori')
+    atau antar kecamatan ('kecamatan', dan per kategori untuk 'kecamatan_kategori').
+    """
+    category = DATASET_SPECS[name]['category']
+    period_cols = get_period_cols(rollups['kategori'])
+
+    cube, periods, labels = _cube(rollups['kategori'], [category])
+    growth = {'kategori': growth_frame(cube, periods, labels, [category], period_cols)}
+    if 'kecamatan_kategori' in rollups:
+        cube, periods, labels = _cube(rollups['kecamatan_kategori'], [KECAMATAN_COL, category])
+        growth['kecamatan_kategori'] = growth_frame(cube, periods, labels, [KECAMATAN_COL, category], period_cols)
+        growth['kecamatan'] = growth_frame(_sum_axis(cube, 2), periods, labels[:1], [KECAMATAN_COL], period_cols)
+    return growth
+
+
+class GrowthStore:
+    """Tabel pertumbuhan satu dataset yang diindeks per periode, seperti PeriodStore."""
+
+    def __init__(self, name, rollups):
+        self.name = name
+        self.tables = build_growth(name, rollups)
+        self._ranges = {key: _period_ranges(df) for key, df in self.tables.items()}
+
+    @property
+    def nbytes(self):
+        """Perkiraan ukuran di memori (byte) untuk cache memori berbatas byte."""
+        return estimate_nbytes([self.tables, self._ranges])
+
+    def __contains__(self, key):
+        return key in self.tables
+
+    def slice(self, key, tahun, semester=None):
+        """Baris tabel `key` untuk satu periode (DataFrame kosong bila periode tidak ada)."""
+        start, stop = self._ranges[key].get((tahun, semester), (0, 0))
+        return self.tables[key].iloc[start:stop]
@@ -0,0 +1,112 @@
+"""
+Metrik rasio demografi per kecamatan x periode.
+
+Rasio jenis kelamin, rasio bekerja dan pangsa terhadap kabupaten dihitung sekali per
+versi data untuk semua kecamatan dan periode sekaligus (operasi kolom pandas), lalu
+tab cukup mengambil irisan satu periode dari tabelnya.
+"""
+from diskominfo_cache import estimate_nbytes
+from diskominfo_data import KECAMATAN_COL, LAKI_LAKI_LABELS, PEREMPUAN_LABELS, TIDAK_BEKERJA_PATTERN, _period_ranges, find_kecamatan_jk_source, get_period_cols, normalize_jenis_kelamin
+
+# Kolom tabel rasio beserta labelnya di tabel dan grafik
+RATIO_LABELS = {
+    'jumlah': "Jumlah Penduduk",
+    'laki_laki': "Laki-laki",
+    'perempuan': "Perempuan",
+    'rasio_jenis_kelamin': "Rasio Jenis Kelamin (L per 100 P)",
+    'pangsa_pct': "Pangsa Kabupaten (%)",
+    'bekerja': "Bekerja",
+    'belum_tidak_bekerja': "Belum/Tidak Bekerja",
+    'rasio_bekerja': "Rasio Bekerja (%)",
+}
+
+# Garis acuan grafik rasio
+RATIO_REFERENCES = {'rasio_jenis_kelamin': 100}
+
+
+def ratio_sources(rollups):
+    """Dataset yang dipakai tabel rasio: sumber jenis kelamin (bila ada) dan Pekerjaan (bila ada)."""
+    names = [find_kecamatan_jk_source(rollups)]
+    if 'Pekerjaan' in rollups and 'kecamatan_kategori' in rollups['Pekerjaan']:
+        names.append('Pekerjaan')
+    return [name for name in dict.fromkeys(names) if name is not None]
+
+
+def _jenis_kelamin_totals(df_jk):
+    label = normalize_jenis_kelamin(df_jk['jenis_kelamin'])
+    keys = get_period_cols(df_jk) + [KECAMATAN_COL]
+    frame = df_jk[keys].assign(
+        jumlah=df_jk['jumlah'],
+        laki_laki=df_jk['jumlah'].where(label.isin(LAKI_LAKI_LABELS), 0),
+        perempuan=df_jk['jumlah'].where(label.isin(PEREMPUAN_LABELS), 0),
+    )
+    totals = frame.groupby(keys, observed=True).sum().reset_index()
+    totals['rasio_jenis_kelamin'] = (totals['laki_laki'] / totals['perempuan'].where(totals['perempuan'] > 0)) * 100
+    return totals
+
+
+def _employment_totals(df_kecamatan):
+    tidak_bekerja = df_kecamatan['jenis_pekerjaan'].astype(str).str.contains(TIDAK_BEKERJA_PATTERN, case=False, na=False)
+    keys = get_period_cols(df_kecamatan) + [KECAMATAN_COL]
+    frame = df_kecamatan[keys].assign(
+        bekerja=df_kecamatan['jumlah'].where(~tidak_bekerja, 0),
+        belum_tidak_bekerja=df_kecamatan['jumlah'].where(tidak_bekerja, 0),
+    )
+    totals = frame.groupby(keys, observed=True).sum().reset_index()
+    angkatan = totals['bekerja'] + totals['belum_tidak_bekerja']
+    totals['rasio_bekerja'] = totals['bekerja'] / angkatan.where(angkatan > 0) * 100
+    return totals
+
+
+def build_ratio_metrics(rollups):
+    """
+    Tabel rasio per periode x kecamatan dari rollup yang tersedia, atau None.
+
+    Jumlah penduduk, rasio jenis kelamin dan pangsa kabupaten diambil dari dataset sumber
+    tab Kecamatan & Jenis Kelamin (atau Pekerjaan bila tidak ada); rasio bekerja dari
+    Pekerjaan. Bila Pekerjaan tidak memiliki semester, rasio tahunannya dipakai untuk
+    kedua semester.
+    """
+    sources = ratio_sources(rollups)
+    if not sources:
+        return None
+    pekerjaan = rollups['Pekerjaan']['kecamatan_kategori'] if 'Pekerjaan' in sources else None
+
+    if sources[0] != 'Pekerjaan':
+        table = _jenis_kelamin_totals(rollups[sources[0]]['kecamatan_jk'])
+    else:
+        keys = get_period_cols(pekerjaan) + [KECAMATAN_COL]
+        table = pekerjaan.groupby(keys, observed=True)['jumlah'].sum().reset_index()
+    period_cols = get_period_cols(table)
+    table['pangsa_pct'] = table['jumlah'] / table.groupby(period_cols)['jumlah'].transform('sum') * 100
+
+    if pekerjaan is not None:
+        employment = _employment_totals(pekerjaan)
+        keys = [col for col in period_cols if col in employment.columns] + [KECAMATAN_COL]
+        table = table.merge(employment, on=keys, how='left')
+    return table.sort_values(period_cols + [KECAMATAN_COL], ignore_index=True)
+
+
+class RatioMetrics:
+    """Tabel build_ratio_metrics yang diindeks per periode, seperti PeriodStore."""
+
+    def __init__(self, rollups):
+        self.sources = ratio_sources(rollups)
+        self.table = build_ratio_metrics(rollups)
+        self._ranges = _period_ranges(self.table) if self.table is not None else {}
+
+    @property
+    def nbytes(self):
+        """Perkiraan ukuran di memori (byte) untuk cache memori berbatas byte."""
+        return estimate_nbytes([self.sources, self.table, self._ranges])
+
+    def metrics(self):
+        """Kolom rasio yang tersedia di tabel."""
+        if self.table is None:
+            return []
+        return [col for col in ('rasio_jenis_kelamin', 'rasio_bekerja', 'pangsa_pct') if col in self.table.columns]
+
+    def slice(self, tahun, semester=None):
+        """Baris satu periode (DataFrame kosong bila periode tidak ada)."""
+        start, stop = self._ranges.get((tahun, semester), (0, 0))
+        return self.table.iloc[start:stop]
@@ -0,0 +1,134 @@
+"""
+Prewarm cache dataset sebelum server Streamlit menerima trafik.
+
+Mengambil, menormalisasi dan menghitung rollup semua dataset lewat getter yang sama
+dengan dashboard (get_processed_data / get_artifact_data). Cache disk bersama
+(diskominfo_cache) terisi untuk semua proses, dan cache memori (frame, rollup, versi)
+terisi untuk proses yang menjalankan prewarm, misalnya bila prewarm() dipanggil dari
+dalam proses server. Bila berhasil, file penanda kesiapan ditulis ke direktori cache
+sehingga pengunjung pertama setelah deploy tidak lagi menunggu API.
+
+Penggunaan:
+    python diskominfo_prewarm.py && streamlit run visualisasi.py
+    python diskominfo_prewarm.py --check   # probe kesiapan, exit code 0 bila siap
+"""
+import argparse
+import datetime
+import json
+import os
+import sys
+import time
+
+from diskominfo_app import ARTIFACT_DIR, CACHE_TTL, FETCH_ERRORS, get_artifact_data, get_artifact_manifest, get_processed_data
+from diskominfo_cache import CACHE_DIR, snapshot_mtime, write_atomic
+from diskominfo_data import API_URLS
+from diskominfo_etl import read_latest_version
+
+READY_FILE = "ready.json"
+
+
+def ready_path(cache_dir=None):
+    return os.path.join(cache_dir or CACHE_DIR, READY_FILE)
+
+
+def prewarm_dataset(name, api_url):
+    """Mengisi cache disk dan cache memori proses ini untuk satu dataset. Mengembalikan jumlah baris."""
+    df, _, _ = get_processed_data(name, api_url)
+    return len(df)
+
+
+def prewarm(names=None):
+    """
+    Memanaskan cache untuk dataset yang diminta (default: semua di API_URLS).
+
+    Mengembalikan dict {nama: {'ok', 'rows' atau 'error', 'seconds'}}. Dalam mode
+    artefak dataset dari artefak terbaru dimuat ke cache memori.
+    """
+    names = list(API_URLS) if names is None else names
+    results = {}
+    if ARTIFACT_DIR:
+        version = read_latest_version(ARTIFACT_DIR)
+        if version is None:
+            return {name: {'ok': False, 'error': f"Artefak tidak ditemukan di {ARTIFACT_DIR}"} for name in names}
+        datasets = get_artifact_manifest(ARTIFACT_DIR, version)['datasets']
+        for name in names:
+            if name in datasets:
+                df, _, _ = get_artifact_data(name, ARTIFACT_DIR, version, datasets[name])
+                results[name] = {'ok': True, 'rows': len(df)}
+            else:
+                results[name] = {'ok': False, 'error': f"Dataset tidak ada di artefak versi {version}"}
+        return results
+
+    for name in names:
+        start = time.perf_counter()
+        try:
+            results[name] = {'ok': True, 'rows': prewarm_dataset(name, API_URLS[name])}
+        except FETCH_ERRORS as e:
+            results[name] = {'ok': False, 'error': str(e)}
+        results[name]['seconds'] = round(time.perf_counter() - start, 2)
+    return results
+
+
+def write_ready(results, cache_dir=None):
+    """Menulis penanda kesiapan berisi waktu prewarm dan hasil per dataset."""
+    os.makedirs(cache_dir or CACHE_DIR, exist_ok=True)
+    write_atomic(ready_path(cache_dir), {
+        'ready_at': datetime.datetime.now().isoformat(timespec='seconds'),
+        'datasets': results,
+    })
+
+
+def is_ready(cache_dir=None, ttl=CACHE_TTL):
+    """
+    True bila prewarm sudah selesai, tidak ada dataset yang gagal, dan cache setiap dataset
+    masih segar.
+
+    Prewarm dengan --allow-partial yang dataset-nya gagal tetap dicatat sebagai belum siap.
+    Dalam mode artefak cache tidak diperiksa, karena artefak tidak kedaluwarsa.
+    """
+    try:
+        with open(ready_path(cache_dir), encoding='utf-8') as f:
+            ready = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if not all(result['ok'] for result in ready['datasets'].values()):
+        return False
+    if ARTIFACT_DIR:
+        return True
+    for name in ready['datasets']:
+        mtime = snapshot_mtime(API_URLS[name], cache_dir)
+        if mtime is None or time.time() - mtime >= ttl:
+            return False
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Memanaskan cache dataset dashboard kependudukan Garut sebelum server dijalankan.")
+    parser.add_argument('--check', action='store_true', help="Hanya memeriksa kesiapan (exit code 0 bila siap)")
+    parser.add_argument('--allow-partial', action='store_true', help="Tetap menandai siap walaupun sebagian dataset gagal")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        ready = is_ready()
+        print("siap" if ready else "belum siap")
+        return 0 if ready else 1
+
+    start = time.perf_counter()
+    results = prewarm()
+    for name, result in results.items():
+        if result['ok']:
+            print(f"{name}: {result['rows']} baris")
+        else:
+            print(f"{name}: gagal ({result['error']})", file=sys.stderr)
+
+    failed = [name for name, result in results.items() if not result['ok']]
+    if failed and not args.allow_partial:
+        print(f"Prewarm gagal untuk: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    write_ready(results)
+    print(f"Prewarm selesai dalam {time.perf_counter() - start:.1f} detik")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
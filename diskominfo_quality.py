@@ -0,0 +1,181 @@
+"""
+Pemeriksaan kualitas data: rekonsiliasi lintas dataset dan deteksi anomali.
+
+Semua dataset (Agama, Perkawinan, Golongan Darah, Pekerjaan) adalah rincian dari
+penduduk yang sama, sehingga total per kecamatan x jenis kelamin x periode seharusnya
+sama. Rollup semua dataset disusun ke satu array NumPy (dataset x periode x kecamatan
+x jenis kelamin) dengan sumbu bersama, lalu dibandingkan dengan median antar dataset
+dalam satu operasi array.
+
+Anomali dicari pada perubahan antar periode berurutan setiap deret (kategori,
+kecamatan dan kecamatan x kategori) dengan z-score robust (median dan MAD), dihitung
+untuk semua deret sekaligus sebagai array periode x deret.
+"""
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from diskominfo_data import DATASET_SPECS, KECAMATAN_COL
+from diskominfo_growth import _cube, _sum_axis
+
+# Selisih relatif terhadap median antar dataset yang dianggap tidak wajar
+RECONCILE_THRESHOLD = 0.01
+
+# Label jenis kelamin untuk total semua jenis kelamin
+ALL_JENIS_KELAMIN = "SEMUA"
+
+# Batas |z| robust (Iglewicz-Hoaglin) untuk menandai perubahan antar periode sebagai anomali
+ANOMALY_Z_THRESHOLD = 3.5
+# Batas bawah MAD log perubahan, agar deret yang hampir konstan tidak menandai perubahan kecil
+ANOMALY_MIN_MAD = 0.02
+# Jumlah perubahan minimal dalam satu deret sebelum z-score dihitung
+ANOMALY_MIN_CHANGES = 4
+
+
+def _period_keys(df):
+    """Daftar (tahun, semester) setiap baris; semester None bila tidak tersedia."""
+    semesters = df['semester'] if 'semester' in df.columns else [None] * len(df)
+    return list(zip(df['tahun'].tolist(), list(semesters)))
+
+
+def _scatter(cube, df, axes, columns):
+    """Mengisi `cube[p, k, ...]` dari 'jumlah' di `df` dengan sumbu `axes` {nama: pd.Index}."""
+    codes = [axes['periode'].get_indexer(_period_keys(df))]
+    codes += [axes[col].get_indexer(df[col].astype(object)) for col in columns]
+    np.add.at(cube, tuple(codes), df['jumlah'].to_numpy(dtype=float))
+
+
+def reconciliation_cube(rollups):
+    """
+    Array total per (dataset, periode, kecamatan, jenis kelamin) dengan sumbu bersama.
+
+    Sumbu jenis kelamin terakhir adalah total semua jenis kelamin (ALL_JENIS_KELAMIN),
+    sehingga dataset tanpa rincian jenis kelamin tetap ikut dibandingkan di total.
+    Sel tanpa data berisi NaN. Mengembalikan (cube, names, axes).
+    """
+    names = [name for name, dataset_rollups in rollups.items() if 'kecamatan_kategori' in dataset_rollups]
+    frames = [rollups[name]['kecamatan_kategori'] for name in names]
+    jk_frames = [rollups[name]['kecamatan_jk'] for name in names if 'kecamatan_jk' in rollups[name]]
+
+    axes = {
+        'periode': pd.Index(sorted({key for df in frames for key in _period_keys(df)}, key=lambda key: (key[0], key[1] or 0)), tupleize_cols=False),
+        KECAMATAN_COL: pd.Index(sorted({str(k) for df in frames for k in df[KECAMATAN_COL].dropna().unique()})),
+        'jenis_kelamin': pd.Index(sorted({str(g) for df in jk_frames for g in df['jenis_kelamin'].dropna().unique()}) + [ALL_JENIS_KELAMIN]),
+    }
+    shape = (len(names), len(axes['periode']), len(axes[KECAMATAN_COL]), len(axes['jenis_kelamin']))
+    cube = np.zeros(shape)
+    present = np.zeros(shape, dtype=bool)
+    for d, name in enumerate(names):
+        totals = np.zeros(shape[1:3])
+        _scatter(totals, frames[d], axes, [KECAMATAN_COL])
+        cube[d, :, :, -1] = totals
+        present[d, :, :, -1] = totals > 0
+        if 'kecamatan_jk' in rollups[name]:
+            _scatter(cube[d], rollups[name]['kecamatan_jk'], axes, [KECAMATAN_COL, 'jenis_kelamin'])
+            present[d, :, :, :-1] = cube[d, :, :, :-1] > 0
+    cube[~present] = np.nan
+    return cube, names, axes
+
+
+def reconcile(rollups, threshold=RECONCILE_THRESHOLD):
+    """
+    Selisih total antar dataset per kecamatan x jenis kelamin x periode.
+
+    Setiap sel dibandingkan dengan median dataset yang memiliki sel tersebut (minimal dua
+    dataset). Mengembalikan DataFrame baris yang selisih relatifnya melebihi `threshold`:
+    periode, kecamatan, jenis_kelamin, dataset, jumlah, acuan, selisih dan selisih_pct.
+    """
+    columns = ['tahun', 'semester', KECAMATAN_COL, 'jenis_kelamin', 'dataset', 'jumlah', 'acuan', 'selisih', 'selisih_pct']
+    cube, names, axes = reconciliation_cube(rollups)
+    if len(names) < 2:
+        return pd.DataFrame(columns=columns)
+
+    counts = np.sum(~np.isnan(cube), axis=0)
+    with warnings.catch_warnings():
+        # Sel tanpa data di semua dataset menghasilkan median NaN
+        warnings.simplefilter('ignore', RuntimeWarning)
+        reference = np.nanmedian(cube, axis=0)
+    difference = cube - reference
+    with np.errstate(divide='ignore', invalid='ignore'):
+        relative = difference / reference
+    flagged = (counts >= 2) & (np.abs(np.nan_to_num(relative)) > threshold)
+    d, p, k, g = np.nonzero(flagged)
+
+    periods = list(axes['periode'])
+    return pd.DataFrame({
+        'tahun': np.array([tahun for tahun, _ in periods])[p],
+        'semester': np.array([semester for _, semester in periods])[p],
+        KECAMATAN_COL: axes[KECAMATAN_COL].to_numpy()[k],
+        'jenis_kelamin': axes['jenis_kelamin'].to_numpy()[g],
+        'dataset': np.array(names, dtype=object)[d],
+        'jumlah': cube[d, p, k, g].astype('int64'),
+        'acuan': reference[p, k, g],
+        'selisih': difference[d, p, k, g],
+        'selisih_pct': relative[d, p, k, g] * 100,
+    }, columns=columns).sort_values(['tahun', 'semester', KECAMATAN_COL, 'jenis_kelamin', 'dataset'], ignore_index=True)
+
+
+# --- Deteksi anomali ---
+def robust_zscores(cube):
+    """
+    z-score robust perubahan log setiap periode terhadap periode sebelumnya, per deret.
+
+    Sumbu 0 `cube` adalah periode terurut; setiap posisi di sumbu lain adalah satu deret.
+    Hasil berbentuk sama dengan `cube`; periode pertama, sel kosong atau nol, dan deret
+    dengan kurang dari ANOMALY_MIN_CHANGES perubahan berisi NaN.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        changes = np.log(cube[1:] / cube[:-1])
+    changes[~np.isfinite(changes)] = np.nan
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        median = np.nanmedian(changes, axis=0)
+        mad = np.nanmedian(np.abs(changes - median), axis=0)
+    z = 0.6745 * (changes - median) / np.maximum(mad, ANOMALY_MIN_MAD)
+    z[:, np.sum(~np.isnan(changes), axis=0) < ANOMALY_MIN_CHANGES] = np.nan
+    return np.concatenate([np.full((1,) + cube.shape[1:], np.nan), z])
+
+
+def _anomaly_frame(level, cube, periods, labels, threshold):
+    """Baris anomali satu tingkat deret; `labels` berisi nilai sumbu kecamatan dan kategori (None bila tidak ada)."""
+    z = robust_zscores(cube)
+    flagged = np.abs(np.nan_to_num(z)) > threshold
+    cell = np.nonzero(flagged)
+    previous = cube[(np.maximum(cell[0] - 1, 0),) + cell[1:]]
+
+    frame = {
+        'tingkat': level,
+        'tahun': np.array([tahun for tahun, _ in periods])[cell[0]],
+        'semester': np.array([semester for _, semester in periods])[cell[0]],
+    }
+    axis = 1
+    for col, values in zip((KECAMATAN_COL, 'kategori'), labels):
+        if values is None:
+            frame[col] = None
+        else:
+            frame[col] = np.array(values, dtype=object)[cell[axis]]
+            axis += 1
+    frame['jumlah'] = cube[flagged].astype('int64')
+    frame['sebelumnya'] = previous.astype('int64')
+    frame['perubahan_pct'] = (cube[flagged] / previous - 1) * 100
+    frame['z'] = z[flagged]
+    return pd.DataFrame(frame)
+
+
+def detect_anomalies(name, rollups, threshold=ANOMALY_Z_THRESHOLD):
+    """
+    Perubahan antar periode yang tidak wajar di dataset `name`.
+
+    Deret yang diperiksa: total per kategori ('kategori'), total per kecamatan ('kecamatan')
+    dan per kecamatan x kategori ('kecamatan_kategori'). Mengembalikan DataFrame berisi
+    tingkat, periode, kecamatan, kategori, jumlah, sebelumnya, perubahan_pct dan z.
+    """
+    category = DATASET_SPECS[name]['category']
+    cube, periods, labels = _cube(rollups['kategori'], [category])
+    frames = [_anomaly_frame('kategori', cube, periods, [None, labels[0]], threshold)]
+    if 'kecamatan_kategori' in rollups:
+        cube, periods, labels = _cube(rollups['kecamatan_kategori'], [KECAMATAN_COL, category])
+        frames.append(_anomaly_frame('kecamatan', _sum_axis(cube, 2), periods, [labels[0], None], threshold))
+        frames.append(_anomaly_frame('kecamatan_kategori', cube, periods, labels, threshold))
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,148 @@
+"""
+Mesin kueri ad-hoc atas dataset yang sudah dinormalisasi.
+
+Bila DuckDB terpasang, DataFrame didaftarkan langsung ke DuckDB (tanpa salinan
+lewat Arrow) sehingga filter dan agregasi dijalankan oleh mesin vektor DuckDB.
+Tanpa DuckDB, kueri yang sama dijalankan dengan pandas.
+"""
+import numpy as np
+import pandas as pd
+
+try:
+    import duckdb
+except ImportError:  # DuckDB opsional: kueri dijalankan dengan pandas
+    duckdb = None
+
+from diskominfo_data import get_period_cols
+
+# Mesin kueri default: 'duckdb' bila tersedia, selain itu 'pandas'
+QUERY_ENGINE = 'duckdb' if duckdb is not None else 'pandas'
+
+
+def query_columns(df):
+    """Kolom yang dapat dipakai untuk pengelompokan dan filter (semua kolom kecuali 'jumlah')."""
+    return [col for col in df.columns if col != 'jumlah']
+
+
+def _validate(df, group_by, filters):
+    columns = set(query_columns(df))
+    unknown = [col for col in list(group_by) + list(filters) if col not in columns]
+    if unknown:
+        raise ValueError(f"Kolom tidak dikenal: {', '.join(unknown)}")
+
+
+def _quote(identifier):
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def build_sql(table, group_by, filters=None, tahun_range=None):
+    """
+    SQL berparameter untuk menjumlahkan 'jumlah' per `group_by`.
+
+    `filters` berisi {kolom: [nilai]} dan `tahun_range` (tahun_awal, tahun_akhir).
+    Nilai filter selalu dikirim sebagai parameter, bukan disisipkan ke SQL.
+    Mengembalikan (sql, params).
+    """
+    conditions, params = [], []
+    if tahun_range is not None:
+        conditions.append("tahun BETWEEN ? AND ?")
+        params.extend(int(tahun) for tahun in tahun_range)
+    for col, values in (filters or {}).items():
+        if values:
+            conditions.append(f"{_quote(col)} IN ({', '.join('?' for _ in values)})")
+            params.extend(value.item() if hasattr(value, 'item') else value for value in values)
+
+    select = [_quote(col) for col in group_by] + ["SUM(jumlah) AS jumlah"]
+    sql = f"SELECT {', '.join(select)} FROM {_quote(table)}"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    if group_by:
+        cols = ', '.join(_quote(col) for col in group_by)
+        sql += f" GROUP BY {cols} ORDER BY {cols}"
+    return sql, params
+
+
+def _run_duckdb(df, group_by, filters, tahun_range):
+    sql, params = build_sql('data', group_by, filters, tahun_range)
+    with duckdb.connect() as con:
+        con.register('data', df)
+        return con.execute(sql, params).df()
+
+
+def _filter_mask(df, filters, tahun_range=None):
+    """Mask boolean untuk `filters` {kolom: [nilai]} dan `tahun_range`, atau None bila tanpa filter."""
+    mask = None
+    if tahun_range is not None:
+        mask = df['tahun'].between(*tahun_range)
+    for col, values in (filters or {}).items():
+        if values:
+            col_mask = df[col].isin(values)
+            mask = col_mask if mask is None else mask & col_mask
+    return mask
+
+
+def _run_pandas(df, group_by, filters, tahun_range):
+    mask = _filter_mask(df, filters, tahun_range)
+    columns = list(group_by) + ['jumlah']
+    df_filtered = df[columns] if mask is None else df.loc[mask, columns]
+    if not group_by:
+        return df_filtered[['jumlah']].sum().to_frame().T
+    return df_filtered.groupby(list(group_by), observed=True, sort=True)['jumlah'].sum().reset_index()
+
+
+def run_query(df, group_by, filters=None, tahun_range=None, engine=None):
+    """
+    Menjumlahkan 'jumlah' di `df` per periode (tahun, semester) dan kolom `group_by`
+    setelah difilter. Kolom periode selalu ikut dikelompokkan: setiap periode adalah
+    hitungan penduduk yang sama, sehingga menjumlahkan antar periode menghitungnya
+    berkali-kali.
+
+    `filters` berisi {kolom: [nilai]} (list kosong berarti tanpa filter) dan
+    `tahun_range` (tahun_awal, tahun_akhir) inklusif. `engine` 'duckdb' atau 'pandas'
+    (default: QUERY_ENGINE). Memunculkan ValueError untuk kolom yang tidak dikenal.
+    """
+    filters = {col: list(values) for col, values in (filters or {}).items() if values}
+    _validate(df, group_by, filters)
+    period_cols = get_period_cols(df)
+    group_by = period_cols + [col for col in group_by if col not in period_cols]
+    engine = engine or QUERY_ENGINE
+    if engine == 'duckdb':
+        if duckdb is None:
+            raise ValueError("DuckDB tidak terpasang. Jalankan `pip install duckdb` atau gunakan engine 'pandas'.")
+        return _run_duckdb(df, group_by, filters, tahun_range)
+    return _run_pandas(df, group_by, filters, tahun_range)
+
+
+# --- Penjelajah data mentah ---
+def row_order(df, filters=None, sort_by=None, ascending=True):
+    """
+    Posisi baris `df` yang lolos `filters` {kolom: [nilai]}, diurutkan menurut `sort_by`.
+
+    Hanya array posisi (int) yang dibuat, bukan salinan DataFrame, sehingga urutan ini
+    murah disimpan di cache dan setiap halaman cukup diambil dengan `page_rows`.
+    Urutan stabil: baris dengan nilai sama tetap dalam urutan aslinya. Nilai kosong
+    selalu di akhir, baik urutan naik maupun turun.
+    """
+    filters = {col: list(values) for col, values in (filters or {}).items() if values}
+    _validate(df, [], filters)
+    mask = _filter_mask(df, filters)
+    positions = np.arange(len(df)) if mask is None else np.flatnonzero(mask.to_numpy())
+    if sort_by is None:
+        return positions
+    if sort_by not in df.columns:
+        raise ValueError(f"Kolom tidak dikenal: {sort_by}")
+    # Peringkat nilai dipakai sebagai kunci agar urutan menurun tetap stabil; factorize
+    # memberi kode -1 untuk nilai kosong (np.unique gagal membandingkan None dengan teks)
+    ranks = pd.factorize(df[sort_by].to_numpy()[positions], sort=True)[0]
+    keys = np.where(ranks < 0, len(positions), ranks if ascending else -ranks)
+    return positions[np.argsort(keys, kind='stable')]
+
+
+def page_count(n_rows, page_size):
+    return max(1, -(-n_rows // page_size))
+
+
+def page_rows(df, order, page, page_size):
+    """Baris halaman ke-`page` (mulai 1) dari `order`; hanya baris ini yang disalin."""
+    start = (page - 1) * page_size
+    return df.iloc[order[start:start + page_size]]
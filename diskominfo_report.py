@@ -0,0 +1,209 @@
+"""
+Laporan demografi PDF per kecamatan untuk satu periode.
+
+Setiap laporan berisi grafik jenis kelamin, agama, status perkawinan, pekerjaan dan
+golongan darah satu kecamatan, dibangun dari definisi grafik yang sama dengan dashboard
+(diskominfo_charts.py). Gambar statis dirender dengan Kaleido di worker process pool
+(satu kecamatan per tugas), lalu digabung menjadi satu PDF per kecamatan.
+Membutuhkan paket `kaleido` beserta Chrome (`plotly_get_chrome`).
+
+Penggunaan:
+    python diskominfo_report.py --output reports --artifacts artifacts
+    python diskominfo_report.py --tahun 2024 --semester 1 --workers 4
+"""
+import argparse
+import importlib.util
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image
+
+from diskominfo_charts import category_figures, kecamatan_jk_figures
+from diskominfo_data import KECAMATAN_COL, KecamatanStore, PeriodStore, find_kecamatan_jk_source, list_periods
+from diskominfo_download import period_slug
+from diskominfo_etl import dataset_slug
+from diskominfo_export import load_rollups
+from diskominfo_filters import match_period
+
+# Dataset kategori yang masuk laporan dan grafiknya, sesuai urutan halaman PDF
+REPORT_DATASETS = ("Agama", "Perkawinan", "Pekerjaan", "Golongan Darah")
+REPORT_CATEGORY_CHARTS = ('bar', 'pie')
+
+IMAGE_WIDTH = 1200
+IMAGE_HEIGHT = 700
+PDF_RESOLUTION = 150.0
+
+# Rollup dikirim sekali ke setiap worker lewat initializer, bukan per tugas; indeks
+# kecamatannya juga dibangun sekali per worker
+_worker_rollups = None
+_worker_stores = None
+
+
+def _init_worker(rollups):
+    global _worker_rollups, _worker_stores
+    _worker_rollups = rollups
+    _worker_stores = kecamatan_stores(rollups)
+
+
+def list_kecamatan(rollups):
+    """Nama semua kecamatan yang ada di rollup dataset laporan, urut abjad."""
+    names = set()
+    for name in REPORT_DATASETS:
+        if name in rollups and 'kecamatan_kategori' in rollups[name]:
+            names.update(rollups[name]['kecamatan_kategori'][KECAMATAN_COL].dropna().astype(str).unique())
+    return sorted(names)
+
+
+def latest_period(rollups, tahun=None):
+    """
+    Periode (tahun, semester) terbaru dari dataset laporan pertama yang tersedia, atau
+    semester terbaru tahun `tahun` bila diberikan.
+    """
+    for name in REPORT_DATASETS:
+        if name in rollups:
+            periods = [period for period in list_periods(rollups[name]['kategori']) if tahun is None or period[0] == tahun]
+            if not periods:
+                raise ValueError(f"Tahun {tahun} tidak ada di data {name}.")
+            return periods[0]
+    raise ValueError("Tidak ada dataset laporan yang tersedia.")
+
+
+def report_period(rollups, tahun=None, semester=None):
+    """
+    Periode laporan: periode terbaru bila `tahun` kosong, dan semester terbaru tahun itu
+    bila `semester` kosong. Laporan tidak pernah menjumlahkan kedua semester dalam satu
+    tahun, karena itu menghitung penduduk dua kali.
+    """
+    if tahun is None:
+        if semester is not None:
+            raise ValueError("--semester membutuhkan --tahun.")
+        return latest_period(rollups)
+    if semester is None:
+        return latest_period(rollups, tahun)
+    return tahun, semester
+
+
+def kecamatan_stores(rollups):
+    """KecamatanStore setiap dataset laporan yang memiliki rollup kecamatan."""
+    return {
+        name: KecamatanStore(name, rollups[name])
+        for name in REPORT_DATASETS if name in rollups and 'kecamatan_kategori' in rollups[name]
+    }
+
+
+def report_figures(rollups, kecamatan, tahun, semester=None, stores=None):
+    """
+    Daftar (slug, figure) grafik laporan satu kecamatan, sesuai urutan halaman PDF.
+
+    `stores` berisi KecamatanStore per dataset (lihat kecamatan_stores); bila kosong
+    dibangun dari `rollups`. Dataset tanpa semester (Pekerjaan) memakai periode tahunannya,
+    seperti match_period di dashboard.
+    """
+    stores = stores if stores is not None else kecamatan_stores(rollups)
+    figures = []
+    source = find_kecamatan_jk_source(rollups)
+    if source is not None:
+        store = PeriodStore(source, stores[source].kecamatan_rollups(kecamatan))
+        if not store.slice('kecamatan_jk', tahun, semester).empty:
+            figures.append(('jenis_kelamin', kecamatan_jk_figures(store, tahun, semester)['jenis_kelamin']))
+    for name in REPORT_DATASETS:
+        if name not in stores:
+            continue
+        store = PeriodStore(name, stores[name].kecamatan_rollups(kecamatan))
+        period = match_period(store.periods, (tahun, semester))
+        if period is None:
+            continue
+        charts = category_figures(name, store, *period)
+        figures.extend((f"{dataset_slug(name)}_{key}", charts[key]) for key in REPORT_CATEGORY_CHARTS)
+
+    for _, fig in figures:
+        fig.update_layout(title_text=f"Kecamatan {kecamatan}: {fig.layout.title.text}")
+    return figures
+
+
+def write_pdf(image_paths, pdf_path):
+    """Menggabungkan gambar menjadi satu PDF, satu gambar per halaman."""
+    images = [Image.open(path).convert('RGB') for path in image_paths]
+    images[0].save(pdf_path, save_all=True, append_images=images[1:], resolution=PDF_RESOLUTION)
+
+
+def render_report(task):
+    """
+    Merender gambar PNG dan PDF laporan satu kecamatan. Dijalankan di worker process pool.
+
+    Semua gambar satu kecamatan dirender dalam satu panggilan write_images sehingga
+    Kaleido cukup membuka satu sesi browser per tugas.
+    """
+    import plotly.io as pio
+
+    output_dir, kecamatan, tahun, semester = task
+    start = time.perf_counter()
+    figures = report_figures(_worker_rollups, kecamatan, tahun, semester, _worker_stores)
+    result = {'kecamatan': kecamatan, 'pid': os.getpid(), 'images': len(figures), 'pdf': None}
+    if figures:
+        slug = dataset_slug(kecamatan)
+        image_dir = os.path.join(output_dir, slug)
+        os.makedirs(image_dir, exist_ok=True)
+        paths = [os.path.join(image_dir, f"{chart}.png") for chart, _ in figures]
+        pio.write_images([fig for _, fig in figures], paths, width=IMAGE_WIDTH, height=IMAGE_HEIGHT)
+        result['pdf'] = os.path.join(output_dir, f"{slug}.pdf")
+        write_pdf(paths, result['pdf'])
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def export_reports(rollups, output_dir, tahun=None, semester=None, workers=None):
+    """
+    Menulis laporan PDF setiap kecamatan untuk satu periode (lihat report_period)
+    ke `output_dir`/<periode>. Mengembalikan daftar hasil per kecamatan dari render_report.
+    """
+    if importlib.util.find_spec('kaleido') is None:
+        raise RuntimeError("Paket kaleido belum terpasang. Jalankan `pip install kaleido` lalu `plotly_get_chrome`.")
+    tahun, semester = report_period(rollups, tahun, semester)
+    period_dir = os.path.join(output_dir, period_slug(tahun, semester))
+    os.makedirs(period_dir, exist_ok=True)
+
+    tasks = [(period_dir, kecamatan, tahun, semester) for kecamatan in list_kecamatan(rollups)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(rollups,)) as executor:
+        return list(executor.map(render_report, tasks))
+
+
+def worker_throughput(results):
+    """Ringkasan per worker: {pid: {'reports', 'images', 'seconds'}}."""
+    workers = {}
+    for result in results:
+        stats = workers.setdefault(result['pid'], {'reports': 0, 'images': 0, 'seconds': 0.0})
+        stats['reports'] += 1
+        stats['images'] += result['images']
+        stats['seconds'] += result['seconds']
+    return workers
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Membuat laporan demografi PDF per kecamatan dari data kependudukan Garut.")
+    parser.add_argument('--output', default='reports', help="Direktori tujuan laporan (default: reports)")
+    parser.add_argument('--artifacts', default=os.environ.get("DISKOMINFO_ARTIFACT_DIR"), help="Direktori artefak ETL; bila kosong data diambil dari API")
+    parser.add_argument('--tahun', type=int, default=None, help="Tahun laporan (default: periode terbaru)")
+    parser.add_argument('--semester', type=int, default=None, help="Semester laporan (butuh --tahun); kosong berarti semester terbaru tahun itu")
+    parser.add_argument('--workers', type=int, default=None, help="Jumlah worker process pool (default: jumlah CPU)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        results = export_reports(load_rollups(args.artifacts), args.output, args.tahun, args.semester, workers=args.workers)
+    except Exception as e:
+        print(f"Gagal membuat laporan: {e}", file=sys.stderr)
+        return 1
+
+    for pid, stats in sorted(worker_throughput(results).items()):
+        rate = stats['images'] / stats['seconds'] if stats['seconds'] else 0.0
+        print(f"worker {pid}: {stats['reports']} laporan, {stats['images']} gambar, {rate:.1f} gambar/detik")
+    written = sum(1 for result in results if result['pdf'])
+    print(f"{written} laporan PDF ditulis ke {args.output} dalam {time.perf_counter() - start:.1f} detik")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+import streamlit as st
+
+from diskominfo_app import apply_global_filters, load_data, render_category_tab, render_kecamatan_jk_tab, render_raw_explorer, setup_page
+
+# --- Konfigurasi Halaman ---
+setup_page()
+
+# --- Bagian Utama Aplikasi ---
+st.title("Visualisasi Data Penduduk Kabupaten Garut Berdasarkan Agama, Kecamatan & Jenis Kelamin")
+st.markdown("Data bersumber dari [Garut Satu Data](https://satudata.garutkab.go.id/)")
+
+# Hanya dataset Agama yang dimuat; cache-nya dipakai bersama dengan halaman lain (diskominfo_app.py)
+data_aggr, rollups, data_status = load_data(["Agama"])
+# Filter global di sidebar (periode, kecamatan, jenis kelamin) berlaku untuk semua tab halaman ini
+data_aggr, rollups, data_status = apply_global_filters(data_aggr, rollups, data_status)
+
+if "Agama" in data_aggr:
+    with st.expander("Lihat Data Mentah yang Sudah Diproses"):
+        render_raw_explorer("Agama", data_aggr["Agama"], data_status)
+
+# --- Tab untuk Visualisasi ---
+tab1, tab2 = st.tabs(["Berdasarkan Agama", "Berdasarkan Kecamatan & Jenis Kelamin"])
+
+with tab1:
+    st.markdown("### Jumlah Penduduk Berdasarkan Agama")
+    render_category_tab("Agama", 'agama', "Jumlah Penduduk per Agama", data_aggr, rollups, data_status)
+
+with tab2:
+    st.markdown("### Jumlah Penduduk Berdasarkan Kecamatan dan Jenis Kelamin")
+    render_kecamatan_jk_tab("Agama", 'kecamatan_jk_agama', data_aggr, rollups, data_status)
@@ -0,0 +1,30 @@
+import streamlit as st
+
+from diskominfo_app import apply_global_filters, load_data, render_category_tab, render_kecamatan_jk_tab, render_raw_explorer, setup_page
+
+# --- Konfigurasi Halaman ---
+setup_page()
+
+# --- Bagian Utama Aplikasi ---
+st.title("Visualisasi Data Penduduk Kabupaten Garut Berdasarkan Pekerjaan & Kecamatan")
+st.markdown("Data bersumber dari [Garut Satu Data](https://satudata.garutkab.go.id/)")
+
+# Hanya dataset Pekerjaan yang dimuat; cache-nya dipakai bersama dengan halaman lain (diskominfo_app.py)
+data_aggr, rollups, data_status = load_data(["Pekerjaan"])
+# Filter global di sidebar (periode, kecamatan, jenis kelamin) berlaku untuk semua tab halaman ini
+data_aggr, rollups, data_status = apply_global_filters(data_aggr, rollups, data_status)
+
+if "Pekerjaan" in data_aggr:
+    with st.expander("Lihat Data Mentah yang Sudah Diproses"):
+        render_raw_explorer("Pekerjaan", data_aggr["Pekerjaan"], data_status)
+
+# --- Tab untuk Visualisasi ---
+tab1, tab2 = st.tabs(["Berdasarkan Pekerjaan", "Berdasarkan Kecamatan"])
+
+with tab1:
+    st.markdown("### Jumlah Penduduk Berdasarkan Pekerjaan")
+    render_category_tab("Pekerjaan", 'pekerjaan', "Status Pekerjaan Penduduk", data_aggr, rollups, data_status)
+
+with tab2:
+    st.markdown("### Jumlah Penduduk Berdasarkan Kecamatan")
+    render_kecamatan_jk_tab("Pekerjaan", 'kecamatan_jk_pekerjaan', data_aggr, rollups, data_status)
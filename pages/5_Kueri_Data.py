@@ -0,0 +1,54 @@
+import streamlit as st
+
+from diskominfo_app import COLUMN_LABELS, get_query_result, load_data, setup_page
+from diskominfo_charts import period_title
+from diskominfo_data import DATASET_SPECS, filter_period, get_period_cols, list_periods
+from diskominfo_query import QUERY_ENGINE, query_columns
+
+# --- Konfigurasi Halaman ---
+setup_page()
+
+# --- Bagian Utama Aplikasi ---
+st.title("Kueri Data Kependudukan Kabupaten Garut")
+st.markdown("Susun irisan data sendiri, misalnya kecamatan × agama × jenis kelamin untuk rentang tahun tertentu. Hasil selalu dikelompokkan per periode, karena jumlah penduduk tidak dapat dijumlahkan antar periode.")
+
+data_aggr, rollups, data_status = load_data()
+
+name = st.selectbox("Dataset:", list(data_aggr), format_func=lambda n: DATASET_SPECS[n]['label'])
+df = data_aggr[name]
+columns = query_columns(df)
+period_cols = get_period_cols(df)
+category = DATASET_SPECS[name]['category']
+
+col_group, col_tahun = st.columns([2, 1])
+with col_group:
+    group_by = st.multiselect("Kelompokkan juga berdasarkan:", [col for col in columns if col not in period_cols], default=[category], format_func=lambda col: COLUMN_LABELS.get(col, col), key=f'kueri_group_{name}')
+with col_tahun:
+    tahun_min, tahun_max = int(df['tahun'].min()), int(df['tahun'].max())
+    if tahun_min < tahun_max:
+        tahun_range = st.slider("Rentang tahun:", tahun_min, tahun_max, (tahun_min, tahun_max), key=f'kueri_tahun_{name}')
+    else:
+        tahun_range = (tahun_min, tahun_max)
+        st.markdown(f"Tahun: {tahun_min}")
+
+# Filter nilai untuk setiap kolom selain tahun; pilihan kosong berarti semua nilai
+filters = {}
+filter_columns = [col for col in columns if col != 'tahun']
+filter_cols = st.columns(max(len(filter_columns), 1))
+for col, filter_col in zip(filter_columns, filter_cols):
+    with filter_col:
+        options = sorted(df[col].dropna().unique())
+        filters[col] = st.multiselect(f"Filter {COLUMN_LABELS.get(col, col)}:", options, key=f'kueri_filter_{name}_{col}')
+
+try:
+    result = get_query_result(name, df, data_status, group_by, filters, tahun_range)
+except ValueError as e:
+    st.error(f"Kueri tidak valid: {e}")
+    st.stop()
+
+st.markdown(f"#### Hasil Kueri ({len(result):,} baris)")
+st.caption(f"Dijalankan dengan mesin {QUERY_ENGINE}." + ("" if QUERY_ENGINE == 'duckdb' else " Pasang `duckdb` untuk kueri yang lebih cepat."))
+if not result.empty:
+    latest = list_periods(result)[0]
+    st.metric(f"Total Jumlah Penduduk {period_title(*latest)} (jiwa)", f"{filter_period(result, *latest)['jumlah'].sum():,.0f}")
+st.dataframe(result.rename(columns=COLUMN_LABELS), width="stretch", hide_index=True)
@@ -0,0 +1,19 @@
+import streamlit as st
+
+from diskominfo_app import load_data, render_raw_explorer, render_stale_badge, setup_page
+from diskominfo_data import DATASET_SPECS
+
+# --- Konfigurasi Halaman ---
+setup_page()
+
+# --- Bagian Utama Aplikasi ---
+st.title("Data Mentah Kependudukan Kabupaten Garut")
+st.markdown("Data bersumber dari [Garut Satu Data](https://satudata.garutkab.go.id/)")
+
+data_aggr, rollups, data_status = load_data()
+if not data_aggr:
+    st.stop()
+
+name = st.selectbox("Dataset:", list(data_aggr), format_func=lambda n: DATASET_SPECS[n]['label'])
+render_stale_badge(name, data_status)
+render_raw_explorer(name, data_aggr[name], data_status)
@@ -0,0 +1,65 @@
+import pandas as pd
+import streamlit as st
+
+from diskominfo_app import COLUMN_LABELS, get_anomalies, get_reconciliation, load_data, setup_page
+from diskominfo_data import DATASET_SPECS
+from diskominfo_quality import ANOMALY_Z_THRESHOLD, RECONCILE_THRESHOLD
+
+# --- Konfigurasi Halaman ---
+setup_page()
+
+# --- Bagian Utama Aplikasi ---
+st.title("Kualitas Data Kependudukan Kabupaten Garut")
+st.markdown("Data bersumber dari [Garut Satu Data](https://satudata.garutkab.go.id/)")
+
+data_aggr, rollups, data_status = load_data()
+
+# --- Rekonsiliasi antar dataset ---
+st.markdown("### Konsistensi Total Penduduk antar Dataset")
+st.markdown(
+    "Setiap dataset adalah rincian dari penduduk yang sama, sehingga total per kecamatan, "
+    "jenis kelamin dan periode seharusnya sama di semua dataset. Total setiap dataset "
+    "dibandingkan dengan median semua dataset yang memiliki data tersebut."
+)
+threshold_pct = st.slider("Ambang selisih (%):", 0.0, 10.0, RECONCILE_THRESHOLD * 100, 0.5)
+df_selisih = get_reconciliation(rollups, data_status, threshold_pct / 100)
+
+if df_selisih.empty:
+    st.success(f"Tidak ada selisih di atas {threshold_pct:.1f}% antar dataset.")
+else:
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Jumlah Selisih", f"{len(df_selisih):,}")
+    col2.metric("Kecamatan Terdampak", f"{df_selisih['kecamatan'].nunique():,}")
+    col3.metric("Selisih Terbesar", f"{df_selisih['selisih_pct'].abs().max():.1f}%")
+
+    st.markdown("#### Jumlah Selisih per Dataset")
+    st.bar_chart(df_selisih['dataset'].value_counts())
+
+    st.markdown("#### Rincian Selisih")
+    labels = {**COLUMN_LABELS, 'dataset': "Dataset", 'acuan': "Acuan (Median)", 'selisih': "Selisih", 'selisih_pct': "Selisih (%)"}
+    st.dataframe(df_selisih.rename(columns=labels), width="stretch", hide_index=True)
+
+# --- Anomali perubahan antar periode ---
+st.markdown("---")
+st.markdown("### Anomali Perubahan antar Periode")
+st.markdown(
+    "Perubahan setiap deret (kategori, kecamatan, dan kecamatan × kategori) dari periode ke periode "
+    f"dibandingkan dengan perubahan biasanya pada deret yang sama (z-score robust, |z| > {ANOMALY_Z_THRESHOLD}). "
+    "Anomali tingkat kategori dan kecamatan juga ditandai ✕ di grafik tren setiap tab."
+)
+TINGKAT_LABELS = {'kategori': "Total per kategori", 'kecamatan': "Total per kecamatan", 'kecamatan_kategori': "Kecamatan × kategori"}
+df_anomali = pd.concat(
+    [get_anomalies(name, rollups[name], data_status).assign(dataset=DATASET_SPECS[name]['label']) for name in rollups],
+    ignore_index=True,
+)
+tingkat = st.multiselect("Tingkat deret:", list(TINGKAT_LABELS), default=list(TINGKAT_LABELS), format_func=TINGKAT_LABELS.get)
+df_anomali = df_anomali[df_anomali['tingkat'].isin(tingkat)]
+
+if df_anomali.empty:
+    st.success("Tidak ada perubahan antar periode yang tidak wajar.")
+else:
+    st.metric("Jumlah Anomali", f"{len(df_anomali):,}")
+    df_anomali = df_anomali.assign(tingkat=df_anomali['tingkat'].map(TINGKAT_LABELS)).sort_values('z', key=abs, ascending=False)
+    columns = ['dataset', 'tingkat', 'tahun', 'semester', 'kecamatan', 'kategori', 'sebelumnya', 'jumlah', 'perubahan_pct', 'z']
+    labels = {**COLUMN_LABELS, 'dataset': "Dataset", 'tingkat': "Tingkat", 'kategori': "Kategori", 'sebelumnya': "Periode Sebelumnya", 'perubahan_pct': "Perubahan (%)", 'z': "Skor z"}
+    st.dataframe(df_anomali[columns].rename(columns=labels), width="stretch", hide_index=True)
@@ -0,0 +1,29 @@
+import streamlit as st
+
+from diskominfo_app import get_kecamatan_store, load_data, render_kecamatan_detail, setup_page
+
+# --- Konfigurasi Halaman ---
+setup_page()
+
+# --- Bagian Utama Aplikasi ---
+st.title("Detail Kependudukan per Kecamatan")
+st.markdown("Data bersumber dari [Garut Satu Data](https://satudata.garutkab.go.id/)")
+
+data_aggr, rollups, data_status = load_data()
+
+# Daftar kecamatan dari indeks kecamatan setiap dataset (dibangun sekali per versi data)
+list_kecamatan = sorted({
+    kecamatan
+    for name in rollups if 'kecamatan_kategori' in rollups[name]
+    for kecamatan in get_kecamatan_store(name, rollups[name], data_status).kecamatan
+})
+if not list_kecamatan:
+    st.info("Data kecamatan tidak tersedia.")
+    st.stop()
+
+# Kecamatan terpilih disimpan di URL (?kecamatan=...) agar halaman detail dapat dibagikan
+requested = st.query_params.get('kecamatan')
+selected_kecamatan = st.selectbox("Pilih Kecamatan:", list_kecamatan, index=list_kecamatan.index(requested) if requested in list_kecamatan else 0)
+st.query_params['kecamatan'] = selected_kecamatan
+
+render_kecamatan_detail(selected_kecamatan, rollups, data_status)
@@ -0,0 +1,34 @@
+import os
+import sys
+
+import pytest
+
+# Modul diskominfo_* berada di akar repo, bukan paket terpasang
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def pivot_payload(rows):
+    """Respons API tiruan berisi `rows` pada kunci 'data.pivot_data'."""
+    return {'data': {'pivot_data': rows}}
+
+
+def agama_rows(tahun=2023, semester=1, islam=100, kristen=10):
+    return [
+        {'tahun': tahun, 'semester': semester, 'kecamatan': kecamatan, 'agama': agama, 'jenis_kelamin': jk, 'jumlah': jumlah}
+        for kecamatan in ('GARUT KOTA', 'TAROGONG KIDUL')
+        for agama, jumlah in (('ISLAM', islam), ('KRISTEN', kristen))
+        for jk in ('LAKI-LAKI', 'PEREMPUAN')
+    ]
+
+
+@pytest.fixture
+def fresh_app():
+    """diskominfo_app dengan cache memori dan graf turunan yang kosong."""
+    import diskominfo_app
+    diskominfo_app.get_memory_cache.clear()
+    diskominfo_app.get_derivation_graph.clear()
+    diskominfo_app.get_kecamatan_dimension.clear()
+    yield diskominfo_app
+    diskominfo_app.get_memory_cache.clear()
+    diskominfo_app.get_derivation_graph.clear()
+    diskominfo_app.get_kecamatan_dimension.clear()
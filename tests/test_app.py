@@ -0,0 +1,60 @@
+import pandas as pd
+import pytest
+import requests
+
+import diskominfo_app
+from diskominfo_app import FETCH_ERRORS
+from diskominfo_cache import CircuitOpenError
+from conftest import agama_rows, pivot_payload
+from diskominfo_data import PayloadError, normalize_dataset
+
+
+# --- Error pengambilan data ---
+def test_fetch_errors_exclude_programming_errors():
+    assert isinstance(requests.exceptions.ConnectionError("x"), FETCH_ERRORS)
+    assert isinstance(CircuitOpenError("x"), FETCH_ERRORS)
+    assert isinstance(PayloadError("x"), FETCH_ERRORS)
+    assert not isinstance(ValueError("x"), FETCH_ERRORS)
+    assert not isinstance(KeyError("x"), FETCH_ERRORS)
+
+
+def test_fetch_checked_rejects_payload_without_pivot_data(monkeypatch):
+    monkeypatch.setattr(diskominfo_app, 'fetch_dataset', lambda url, timeout: {'data': {}})
+    with pytest.raises(PayloadError):
+        diskominfo_app._fetch_checked("http://contoh")
+
+
+def test_normalize_dataset_rejects_bad_payload():
+    with pytest.raises(PayloadError):
+        normalize_dataset("Agama", pd.DataFrame({'tahun': [2023]}))
+    df_raw = pd.DataFrame({'tahun': ['dua ribu'], 'agama': ['ISLAM'], 'jumlah': [1], 'jenis_kelamin': ['L'], 'semester': [1]})
+    with pytest.raises(PayloadError):
+        normalize_dataset("Agama", df_raw)
+
+
+# --- Cache dataset ---
+def test_cached_rerun_reuses_processed_data(fresh_app, monkeypatch):
+    calls = []
+
+    def fetch(api_url):
+        calls.append(api_url)
+        return pivot_payload(agama_rows())
+    monkeypatch.setattr(fresh_app, 'get_data_from_api', fetch)
+
+    api_url = fresh_app.API_URLS["Agama"]
+    first = fresh_app.get_processed_data("Agama", api_url)
+    rerun = fresh_app.get_processed_data("Agama", api_url)
+    assert len(calls) == 1
+    assert len(rerun) == 3
+    df, rollups, version = rerun
+    assert df is first[0] and rollups is first[1] and version == first[2]
+
+
+def test_changed_payload_registers_new_version(fresh_app):
+    payloads = [pivot_payload(agama_rows()), pivot_payload(agama_rows() + agama_rows(semester=2, islam=120))]
+    _, _, old_version = fresh_app.process_raw_data("Agama", fresh_app.extract_pivot_data(payloads[0]))
+    _, rollups, new_version = fresh_app.process_raw_data("Agama", fresh_app.extract_pivot_data(payloads[1]))
+    assert old_version != new_version
+    assert old_version not in fresh_app.get_memory_cache()
+    assert fresh_app.get_derivation_graph().children(('sumber', "Agama")) == {new_version}
+    assert set(zip(rollups['kategori']['tahun'], rollups['kategori']['semester'])) == {(2023, 1), (2023, 2)}
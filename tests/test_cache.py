@@ -0,0 +1,195 @@
+import threading
+
+import numpy as np
+import pytest
+
+from diskominfo_cache import CircuitBreaker, CircuitOpenError, DerivationGraph, SizedLRUCache, estimate_nbytes
+
+
+# --- Circuit breaker ---
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr('diskominfo_cache.time.monotonic', clock)
+    return clock
+
+
+def fail():
+    raise OSError("gagal")
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    for _ in range(2):
+        with pytest.raises(OSError):
+            breaker.call(fail)
+    assert breaker.opened_at == clock.now
+
+    calls = []
+    with pytest.raises(CircuitOpenError):
+        breaker.call(calls.append, 1)
+    assert calls == []
+
+
+def test_breaker_success_resets_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    with pytest.raises(OSError):
+        breaker.call(fail)
+    assert breaker.call(lambda: 'ok') == 'ok'
+    with pytest.raises(OSError):
+        breaker.call(fail)
+    assert breaker.failures == 1
+    assert breaker.opened_at is None
+
+
+def test_breaker_half_open_closes_on_success(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    with pytest.raises(OSError):
+        breaker.call(fail)
+    clock.now += 61
+    assert breaker.call(lambda: 'ok') == 'ok'
+    assert breaker.failures == 0
+    assert breaker.opened_at is None
+
+
+def test_breaker_half_open_reopens_on_failure(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    with pytest.raises(OSError):
+        breaker.call(fail)
+    clock.now += 61
+    with pytest.raises(OSError):
+        breaker.call(fail)
+    assert breaker.opened_at == clock.now
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: 'ok')
+
+
+# --- Cache memori berbatas byte ---
+def test_get_or_compute_concurrent_misses_compute_once():
+    cache = SizedLRUCache(10_000)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return np.zeros(10)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute('k', compute))) for _ in range(4)]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert len(calls) == 1
+    assert len(results) == 4 and all(result is results[0] for result in results)
+    assert cache._key_locks == {}
+
+
+def test_get_or_compute_exception_not_cached():
+    cache = SizedLRUCache(10_000)
+
+    def fail():
+        raise RuntimeError("gagal")
+    with pytest.raises(RuntimeError):
+        cache.get_or_compute('k', fail)
+    assert cache._key_locks == {}
+    assert cache.get_or_compute('k', lambda: 5) == 5
+
+
+# --- Graf turunan ---
+def test_invalidate_prunes_superseded_versions():
+    cache = SizedLRUCache(10_000)
+    graph = DerivationGraph()
+    source = ('sumber', 'Agama')
+    for hash_ in ('a', 'b', 'c'):
+        version = ('olahan', 'Agama', hash_)
+        graph.invalidate(source, cache)
+        graph.add(source, version)
+        cache.put(version, 1)
+        for period in range(5):
+            graph.add(version, ('grafik', version, period))
+            cache.put(('grafik', version, period), 1)
+    assert graph.children(source) == {('olahan', 'Agama', 'c')}
+    assert len(graph.descendants(source)) == 6
+    assert len(graph._children) == 2
+    assert cache.stats()['entries'] == 6
+
+
+def test_invalidate_removes_child_from_other_parents():
+    cache = SizedLRUCache(10_000)
+    graph = DerivationGraph()
+    agama, pekerjaan = ('olahan', 'Agama', 'a'), ('olahan', 'Pekerjaan', 'a')
+    graph.add(('sumber', 'Agama'), agama)
+    graph.add(('sumber', 'Pekerjaan'), pekerjaan)
+    for version in (agama, pekerjaan):
+        graph.add(version, ('rasio', agama, pekerjaan))
+    cache.put(('rasio', agama, pekerjaan), 1)
+
+    assert graph.invalidate(('sumber', 'Agama'), cache) == 1
+    assert graph.children(pekerjaan) == set()
+    assert ('rasio', agama, pekerjaan) not in cache
+
+
+def test_prune_drops_evicted_leaves():
+    cache = SizedLRUCache(10_000)
+    graph = DerivationGraph()
+    version = ('olahan', 'Agama', 'a')
+    graph.add(('sumber', 'Agama'), version)
+    cache.put(version, 1)
+    filtered = ('tersaring', version, 'pilihan')
+    graph.add(version, filtered)
+    graph.add(filtered, ('grafik', filtered))
+    cache.put(('grafik', filtered), 1)
+
+    # Frame tersaring terbuang tetapi grafiknya masih ada: keduanya tetap di graf
+    assert graph.prune(cache) == 0
+    cache.invalidate(lambda key: key == ('grafik', filtered))
+    assert graph.prune(cache) == 2
+    assert graph.descendants(('sumber', 'Agama')) == {version}
+
+
+def test_sized_cache_byte_accounting():
+    cache = SizedLRUCache(3000)
+    for key in 'abc':
+        cache.put(key, np.zeros(100))
+    assert cache.stats()['bytes'] == 2400
+    cache.put('a', np.zeros(50))
+    assert cache.stats()['bytes'] == 2000
+
+    # Urutan LRU kini b, a, c: 'b' paling lama tidak dipakai dan dibuang lebih dulu
+    cache.get('c')
+    cache.put('d', np.zeros(200))
+    assert 'b' not in cache and 'a' in cache
+    assert cache.stats()['bytes'] == 400 + 800 + 1600
+    assert cache.stats()['evicted_bytes'] == 800
+
+    cache.put('besar', np.zeros(1000))
+    assert 'besar' not in cache and cache.stats()['rejected'] == 1
+    assert cache.invalidate(lambda key: key == 'c') == 1
+    assert cache.stats()['bytes'] == 2000
+
+
+def test_estimate_nbytes_measures_stores():
+    import pandas as pd
+    from conftest import agama_rows
+    from diskominfo_data import PeriodStore, build_rollups, normalize_dataset
+
+    rollups = build_rollups("Agama", normalize_dataset("Agama", pd.DataFrame(agama_rows(2023, 1) + agama_rows(2023, 2))))
+    store = PeriodStore("Agama", rollups)
+    frames = sum(int(df.memory_usage(deep=True).sum()) for df in rollups.values())
+    assert estimate_nbytes(store) == store.nbytes
+    assert store.nbytes > frames
@@ -0,0 +1,95 @@
+import pandas as pd
+import pytest
+
+from conftest import agama_rows
+from diskominfo_data import KecamatanDimension, KecamatanStore, PeriodStore, build_rollups, filter_period, normalize_dataset, update_rollups
+
+
+def normalized(rows):
+    return normalize_dataset("Agama", pd.DataFrame(rows))
+
+
+def assert_rollups_equal(actual, expected):
+    assert set(actual) == set(expected)
+    for key in expected:
+        pd.testing.assert_frame_equal(actual[key].reset_index(drop=True), expected[key].reset_index(drop=True), check_dtype=False, check_categorical=False)
+
+
+# --- Rollup inkremental ---
+@pytest.mark.parametrize('new_rows', [
+    # Periode baru
+    agama_rows(2023, 1) + agama_rows(2023, 2) + agama_rows(2024, 1, islam=130),
+    # Periode lama berubah
+    agama_rows(2023, 1) + agama_rows(2023, 2, islam=999),
+    # Periode hilang
+    agama_rows(2023, 1),
+])
+def test_incremental_rollups_match_full_rebuild(new_rows):
+    old = normalized(agama_rows(2023, 1) + agama_rows(2023, 2))
+    old_rollups, old_partitions, _ = update_rollups("Agama", old)
+
+    df = normalized(new_rows)
+    rollups, _, changed = update_rollups("Agama", df, (old_rollups, old_partitions))
+    assert changed
+    assert_rollups_equal(rollups, build_rollups("Agama", df))
+
+
+def test_unchanged_data_reuses_rollups():
+    df = normalized(agama_rows(2023, 1) + agama_rows(2023, 2))
+    rollups, partitions, _ = update_rollups("Agama", df)
+    reused, _, changed = update_rollups("Agama", df.sample(frac=1, random_state=0), (rollups, partitions))
+    assert changed == set()
+    assert reused is rollups
+
+
+# --- Irisan periode ---
+def test_period_store_slice_matches_filter():
+    rows = agama_rows(2024, 1, islam=130) + agama_rows(2023, 2) + agama_rows(2023, 1)
+    rollups = build_rollups("Agama", normalized(rows))
+    store = PeriodStore("Agama", rollups)
+    assert store.periods == [(2024, 1), (2023, 2), (2023, 1)]
+    for key, df in rollups.items():
+        for tahun, semester in store.periods:
+            expected = filter_period(df, tahun, semester)
+            pd.testing.assert_frame_equal(store.slice(key, tahun, semester).reset_index(drop=True), expected.reset_index(drop=True))
+        assert len(store.slice(key, 2023)) == len(filter_period(df, 2023))
+    assert store.slice('kategori', 2030, 1).empty
+
+
+def test_period_store_compare():
+    rollups = build_rollups("Agama", normalized(agama_rows(2023, 1) + agama_rows(2023, 2, islam=150, kristen=0)))
+    df = PeriodStore("Agama", rollups).compare('kategori', ['agama'], (2023, 1), (2023, 2)).set_index('agama')
+    assert df.loc['ISLAM', 'jumlah_pembanding'] == 400 and df.loc['ISLAM', 'jumlah'] == 600
+    assert df.loc['ISLAM', 'selisih_pct'] == 50
+    assert df.loc['KRISTEN', 'selisih'] == -40
+
+
+# --- Indeks kecamatan ---
+def test_kecamatan_store_slices_match_filter():
+    rows = agama_rows(2023, 1) + agama_rows(2023, 2, islam=150)
+    rollups = build_rollups("Agama", normalized(rows[::-1]))
+    store = KecamatanStore("Agama", rollups)
+    assert store.kecamatan == ['GARUT KOTA', 'TAROGONG KIDUL']
+    for key in ('kecamatan_kategori', 'kecamatan_jk'):
+        df = rollups[key]
+        for kecamatan in store.kecamatan:
+            expected = df[df['kecamatan'] == kecamatan]
+            assert store.slice(key, kecamatan)['jumlah'].sum() == expected['jumlah'].sum()
+            assert len(store.slice(key, kecamatan)) == len(expected)
+    assert store.slice('kecamatan_kategori', 'TIDAK ADA').empty
+
+    per_kecamatan = PeriodStore("Agama", store.kecamatan_rollups('GARUT KOTA'))
+    assert per_kecamatan.slice('kategori', 2023, 2)['jumlah'].sum() == 2 * (150 + 10)
+
+
+# --- Dimensi kecamatan ---
+def test_dimension_codes_stable_across_datasets():
+    dimension = KecamatanDimension()
+    first = dimension.encode(pd.Series(['garut kota', 'Cibatu']))
+    second = dimension.encode(pd.Series(['CIBATU', 'Bayongbong']))
+    # Kategori dataset pertama adalah awalan dimensi, sehingga kode yang sama tetap sama
+    assert list(second.cat.categories[:len(first.cat.categories)]) == list(first.cat.categories)
+    assert first.cat.codes[1] == second.cat.codes[0]
+
+    merged = pd.DataFrame({'kecamatan': first, 'a': [1, 2]}).merge(pd.DataFrame({'kecamatan': second, 'b': [3, 4]}), on='kecamatan')
+    assert merged['kecamatan'].astype(str).tolist() == ['CIBATU'] and merged['b'].tolist() == [3]
@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+
+from conftest import agama_rows
+from diskominfo_data import normalize_dataset
+from diskominfo_filters import FilterIndex, filter_options, match_period
+
+
+def dataset():
+    return normalize_dataset("Agama", pd.DataFrame(agama_rows(2023, 1) + agama_rows(2023, 2)))
+
+
+def test_filter_index_rows_match_boolean_mask():
+    df = dataset()
+    index = FilterIndex(df)
+    selections = {'kecamatan': ['GARUT KOTA'], 'jenis_kelamin': ['PEREMPUAN', 'LAKI-LAKI']}
+    expected = np.flatnonzero((df['kecamatan'].astype(str) == 'GARUT KOTA').to_numpy())
+    np.testing.assert_array_equal(index.rows(selections), expected)
+
+    assert index.rows({'kecamatan': []}) is None
+    assert index.rows({'tidak_ada': ['x']}) is None
+    assert len(index.rows({'kecamatan': ['TIDAK ADA']})) == 0
+
+
+def test_filter_options_and_match_period():
+    periods, values = filter_options([FilterIndex(dataset())])
+    assert periods == [(2023, 2), (2023, 1)]
+    assert values['kecamatan'] == ['GARUT KOTA', 'TAROGONG KIDUL']
+    assert match_period([(2023, 2)], (2023, 2)) == (2023, 2)
+    assert match_period([(2023, None)], (2023, 1)) == (2023, None)
+    assert match_period([(2022, 1)], (2023, 1)) is None
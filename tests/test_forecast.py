@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from conftest import agama_rows
+from diskominfo_data import build_rollups, normalize_dataset
+from diskominfo_forecast import build_forecast, holt_forecast, linear_forecast, next_periods
+
+
+def test_next_periods():
+    assert next_periods([(2023, 1), (2023, 2)], 3) == [(2024, 1), (2024, 2), (2025, 1)]
+    assert next_periods([(2023, None)], 2) == [(2024, None), (2025, None)]
+
+
+def test_forecasts_continue_linear_series():
+    t = np.arange(6, dtype=float)
+    cube = np.column_stack([10 + 5 * t, 100 - 2 * t])
+    expected = np.column_stack([10 + 5 * np.arange(6, 8), 100 - 2 * np.arange(6, 8)])
+    np.testing.assert_allclose(linear_forecast(cube, 2), expected)
+    np.testing.assert_allclose(holt_forecast(cube, 2), expected)
+
+
+def test_forecasts_handle_gaps_and_short_series():
+    cube = np.array([[1.0, np.nan, np.nan], [2.0, np.nan, 7.0], [np.nan, 5.0, np.nan], [4.0, np.nan, np.nan]])
+    linear = linear_forecast(cube, 1)
+    np.testing.assert_allclose(linear[0, 0], 5)
+    assert np.isnan(linear[0, 1:]).all()
+    holt = holt_forecast(cube, 1)
+    # Level dan tren dari 1 dan 2; periode kosong diisi prediksinya (3), lalu 4 tetap di garis
+    np.testing.assert_allclose(holt[0, 0], 5)
+    assert np.isnan(holt[0, 1:]).all()
+
+
+def test_build_forecast_with_text_semesters():
+    rows = agama_rows(2023, 1) + agama_rows(2023, 2, islam=110) + agama_rows(2024, 1, islam=120)
+    df = normalize_dataset("Agama", pd.DataFrame([dict(row, semester=str(row['semester'])) for row in rows]))
+    forecast = build_forecast("Agama", build_rollups("Agama", df))
+
+    kategori = forecast['kategori']
+    assert sorted(set(zip(kategori['tahun'], kategori['semester']))) == [(2024, 2), (2025, 1)]
+    islam = kategori[kategori['agama'] == 'ISLAM'].sort_values('langkah')
+    assert islam['linier'].tolist() == [520, 560]
+    assert set(forecast['kecamatan']['kecamatan']) == {'GARUT KOTA', 'TAROGONG KIDUL'}
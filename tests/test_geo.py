@@ -0,0 +1,65 @@
+import json
+
+import numpy as np
+
+import diskominfo_geo
+from diskominfo_geo import build_geometry, geometry_names
+
+
+def square(x0, y0, size, steps=20):
+    """Ring persegi searah jarum jam dengan titik rapat di setiap sisi (agar ada yang disederhanakan)."""
+    t = np.linspace(0, size, steps, endpoint=False)
+    wobble = 0.00001 * np.sin(t * 1000)
+    sides = [
+        np.column_stack([x0 + wobble, y0 + t]),
+        np.column_stack([x0 + t, y0 + size + wobble]),
+        np.column_stack([x0 + size + wobble, y0 + size - t]),
+        np.column_stack([x0 + size - t, y0 + wobble]),
+    ]
+    ring = np.vstack(sides)
+    return np.vstack([ring, ring[:1]]).tolist()
+
+
+def source():
+    features = [
+        {'type': 'Feature', 'properties': {'WADMKC': 'garut  kota', 'WADMKK': 'Garut'}, 'geometry': {'type': 'Polygon', 'coordinates': [square(107.0, -7.2, 0.05)]}},
+        {'type': 'Feature', 'properties': {'WADMKC': 'Tarogong Kidul', 'WADMKK': 'Garut'}, 'geometry': {'type': 'Polygon', 'coordinates': [square(107.05, -7.2, 0.05)]}},
+        {'type': 'Feature', 'properties': {'WADMKC': 'Lain', 'WADMKK': 'Bandung'}, 'geometry': {'type': 'Polygon', 'coordinates': [square(106.0, -7.0, 0.05)]}},
+    ]
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+def test_build_geometry_simplifies_and_shares_borders():
+    geojson = build_geometry(source(), 'WADMKC', {'WADMKK': 'Garut'})
+    assert geometry_names(geojson) == {'GARUT KOTA', 'TAROGONG KIDUL'}
+
+    rings = [np.array(feature['geometry']['coordinates'][0][0]) for feature in geojson['features']]
+    assert all(len(ring) < 80 for ring in rings)
+    # Titik batas bersama (x = 107.05) sama persis di kedua kecamatan
+    shared = [{tuple(point) for point in ring if abs(point[0] - 107.05) < 0.001} for ring in rings]
+    assert shared[0] == shared[1] and len(shared[0]) >= 2
+
+
+def test_main_builds_once_with_if_missing(tmp_path, capsys):
+    source_path, output = tmp_path / 'mentah.geojson', tmp_path / 'static' / 'kecamatan.geojson'
+    source_path.write_text(json.dumps(source()))
+    args = [str(source_path), '--name-field', 'WADMKC', '--where', 'WADMKK=Garut', '--output', str(output), '--if-missing']
+
+    assert diskominfo_geo.main(args) == 0
+    assert geometry_names(diskominfo_geo.load_geometry(str(output))) == {'GARUT KOTA', 'TAROGONG KIDUL'}
+    assert diskominfo_geo.main(args) == 0
+    assert "dilewati" in capsys.readouterr().out
+
+
+def test_main_uses_deploy_defaults(tmp_path, monkeypatch, capsys):
+    source_path, output = tmp_path / 'mentah.geojson', tmp_path / 'kecamatan.geojson'
+    source_path.write_text(json.dumps(source()))
+
+    monkeypatch.setattr(diskominfo_geo, 'GEOMETRY_SOURCE', None)
+    assert diskominfo_geo.main(['--output', str(output), '--if-missing']) == 1
+    assert "DISKOMINFO_GEOMETRY_SOURCE" in capsys.readouterr().err
+    assert not output.exists()
+
+    monkeypatch.setattr(diskominfo_geo, 'GEOMETRY_SOURCE', str(source_path))
+    assert diskominfo_geo.main(['--output', str(output), '--if-missing']) == 0
+    assert geometry_names(diskominfo_geo.load_geometry(str(output))) == {'GARUT KOTA', 'TAROGONG KIDUL'}
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from conftest import agama_rows
+from diskominfo_data import build_rollups, normalize_dataset
+from diskominfo_growth import GrowthStore, growth_metrics
+
+
+def test_string_semester_is_normalized_to_int():
+    rows = [dict(row, semester=str(row['semester'])) for row in agama_rows(2023, 1) + agama_rows(2023, 2)]
+    df = normalize_dataset("Agama", pd.DataFrame(rows))
+    assert df['semester'].dtype.kind == 'i'
+
+    store = GrowthStore("Agama", build_rollups("Agama", df))
+    assert not store.slice('kategori', 2023, 2).empty
+
+
+def test_growth_metrics():
+    periods = [(2022, 1), (2022, 2), (2023, 1), (2023, 2)]
+    cube = np.array([[100.0, 10.0], [110.0, 20.0], [121.0, 5.0], [np.nan, 40.0]])
+    metrics = growth_metrics(cube, periods)
+
+    np.testing.assert_allclose(metrics['delta_semester'][1:3, 0], [10, 11])
+    np.testing.assert_allclose(metrics['pct_semester'][1:3, 0], [10, 10])
+    np.testing.assert_allclose(metrics['delta_tahun'][2:, 1], [-5, 20])
+    # Satu tahun (dua semester) dari 100 ke 121: CAGR 21%
+    np.testing.assert_allclose(metrics['cagr'][2, 0], 21)
+    assert np.isnan(metrics['cagr'][0]).all()
+    assert metrics['peringkat'][2].tolist() == [1, 2]
+
+
+def test_growth_metrics_missing_semester_is_nan():
+    periods = [(2022, 1), (2023, 1), (2023, 2)]
+    cube = np.array([[100.0], [120.0], [126.0]])
+    metrics = growth_metrics(cube, periods)
+    # (2022, 2) tidak ada: bukan selisih setahun berlabel semester
+    assert np.isnan(metrics['delta_semester'][1, 0])
+    np.testing.assert_allclose(metrics['pct_semester'][2, 0], 5)
+    np.testing.assert_allclose(metrics['delta_tahun'][1, 0], 20)
+
+
+def test_growth_metrics_yearly_and_empty():
+    metrics = growth_metrics(np.array([[10.0], [12.0]]), [(2022, None), (2023, None)])
+    assert np.isnan(metrics['delta_semester']).all()
+    np.testing.assert_allclose(metrics['pct_tahun'][1, 0], 20)
+
+    empty = growth_metrics(np.empty((0, 3)), [])
+    assert all(values.shape == (0, 3) for values in empty.values())
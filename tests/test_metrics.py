@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from conftest import agama_rows
+from diskominfo_data import build_rollups, normalize_dataset
+from diskominfo_metrics import RatioMetrics
+
+
+def pekerjaan_rows(tahun=2023, semester=1):
+    return [
+        {'tahun': tahun, 'semester': semester, 'kecamatan': kecamatan, 'jenis_pekerjaan': pekerjaan, 'jenis_kelamin': 'LAKI-LAKI', 'jumlah': jumlah}
+        for kecamatan in ('GARUT KOTA', 'TAROGONG KIDUL')
+        for pekerjaan, jumlah in (('PETANI', 60), ('BELUM/TIDAK BEKERJA', 40))
+    ]
+
+
+@pytest.fixture
+def rollups():
+    agama = [dict(row, jumlah=row['jumlah'] * (2 if row['jenis_kelamin'] == 'LAKI-LAKI' else 1)) for row in agama_rows(2023, 1)]
+    return {
+        "Agama": build_rollups("Agama", normalize_dataset("Agama", pd.DataFrame(agama))),
+        "Pekerjaan": build_rollups("Pekerjaan", normalize_dataset("Pekerjaan", pd.DataFrame(pekerjaan_rows()))),
+    }
+
+
+def test_ratio_metrics(rollups):
+    metrics = RatioMetrics(rollups)
+    assert metrics.sources == ["Agama", "Pekerjaan"]
+    assert metrics.metrics() == ['rasio_jenis_kelamin', 'rasio_bekerja', 'pangsa_pct']
+
+    df = metrics.slice(2023, 1).set_index('kecamatan')
+    assert df.loc['GARUT KOTA', 'jumlah'] == 3 * 110
+    assert df.loc['GARUT KOTA', 'rasio_jenis_kelamin'] == 200
+    assert df.loc['GARUT KOTA', 'rasio_bekerja'] == 60
+    assert df['pangsa_pct'].sum() == pytest.approx(100)
+    assert metrics.slice(2024, 1).empty
+
+
+def test_ratio_metrics_without_sources():
+    metrics = RatioMetrics({})
+    assert metrics.table is None and metrics.metrics() == []
+
+
+def test_jenis_kelamin_cards_match_ratio_labels(rollups):
+    from diskominfo_charts import jenis_kelamin_cards
+
+    df_jk = rollups["Agama"]['kecamatan_jk']
+    for labels in (('LAKI-LAKI', 'PEREMPUAN'), ('Laki-Laki', 'Perempuan'), (' l ', 'p')):
+        relabeled = df_jk.assign(jenis_kelamin=df_jk['jenis_kelamin'].map(dict(zip(('LAKI-LAKI', 'PEREMPUAN'), labels))))
+        cards = {label: jumlah for _, jumlah, label, _ in jenis_kelamin_cards(relabeled)}
+        assert cards['Laki-laki'] == 2 * 2 * 110 and cards['Perempuan'] == 2 * 110
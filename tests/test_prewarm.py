@@ -0,0 +1,51 @@
+import json
+
+import requests
+
+import diskominfo_prewarm
+from conftest import agama_rows, pivot_payload
+
+
+def test_prewarm_fills_memory_cache(fresh_app, monkeypatch):
+    calls = []
+
+    def fetch(api_url):
+        calls.append(api_url)
+        return pivot_payload(agama_rows())
+    monkeypatch.setattr(fresh_app, 'get_data_from_api', fetch)
+
+    results = diskominfo_prewarm.prewarm(["Agama"])
+    assert results["Agama"]['ok'] and results["Agama"]['rows'] == 8
+
+    df, rollups, version = fresh_app.get_processed_data("Agama", fresh_app.API_URLS["Agama"])
+    assert len(calls) == 1
+    assert len(df) == 8 and version[0] == 'olahan'
+
+
+def test_prewarm_records_failures(fresh_app, monkeypatch):
+    def fetch(api_url):
+        raise requests.exceptions.ConnectionError("API mati")
+    monkeypatch.setattr(fresh_app, 'get_data_from_api', fetch)
+
+    results = diskominfo_prewarm.prewarm(["Agama"])
+    assert not results["Agama"]['ok'] and "API mati" in results["Agama"]['error']
+
+
+def write_ready(tmp_path, datasets):
+    (tmp_path / diskominfo_prewarm.READY_FILE).write_text(json.dumps({'ready_at': '', 'datasets': datasets}))
+
+
+def test_is_ready_false_when_any_dataset_failed(tmp_path, monkeypatch):
+    monkeypatch.setattr(diskominfo_prewarm, 'snapshot_mtime', lambda api_url, cache_dir: 1e12)
+    write_ready(tmp_path, {"Agama": {'ok': True, 'rows': 8}})
+    assert diskominfo_prewarm.is_ready(str(tmp_path), ttl=float('inf'))
+
+    write_ready(tmp_path, {"Agama": {'ok': True, 'rows': 8}, "Pekerjaan": {'ok': False, 'error': "API mati"}})
+    assert not diskominfo_prewarm.is_ready(str(tmp_path), ttl=float('inf'))
+
+    monkeypatch.setattr(diskominfo_prewarm, 'ARTIFACT_DIR', str(tmp_path))
+    assert not diskominfo_prewarm.is_ready(str(tmp_path))
+
+
+def test_is_ready_false_without_marker(tmp_path):
+    assert not diskominfo_prewarm.is_ready(str(tmp_path))
@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+from diskominfo_query import page_rows, row_order
+
+
+def test_row_order_text_column_with_nulls():
+    df = pd.DataFrame({'kecamatan': ['CIBATU', None, 'BAYONGBONG', 'CIBATU', np.nan], 'jumlah': [1, 2, 3, 4, 5]})
+    assert row_order(df, sort_by='kecamatan').tolist() == [2, 0, 3, 1, 4]
+    assert row_order(df, sort_by='kecamatan', ascending=False).tolist() == [0, 3, 2, 1, 4]
+
+
+def test_row_order_filters_then_sorts_stably():
+    df = pd.DataFrame({'jenis_kelamin': ['L', 'P', 'L', 'L'], 'jumlah': [5, 1, 5, 2]})
+    order = row_order(df, filters={'jenis_kelamin': ['L']}, sort_by='jumlah', ascending=False)
+    assert order.tolist() == [0, 2, 3]
+    assert page_rows(df, order, 2, 2)['jumlah'].tolist() == [2]
+
+
+def test_row_order_categorical_sorts_by_name():
+    df = pd.DataFrame({'kecamatan': pd.Categorical(['GARUT KOTA', 'BAYONGBONG', None], categories=['GARUT KOTA', 'BAYONGBONG'])})
+    assert row_order(df, sort_by='kecamatan').tolist() == [1, 0, 2]
+
+
+def test_run_query_always_groups_by_period():
+    from conftest import agama_rows
+    from diskominfo_data import normalize_dataset
+    from diskominfo_query import run_query
+
+    df = normalize_dataset("Agama", pd.DataFrame(agama_rows(2023, 1) + agama_rows(2023, 2, islam=150)))
+    result = run_query(df, ['agama'], {'agama': ['ISLAM']}, (2023, 2023), engine='pandas')
+    assert result[['tahun', 'semester', 'jumlah']].values.tolist() == [[2023, 1, 400], [2023, 2, 600]]
+    assert run_query(df, ['tahun'], engine='pandas').columns.tolist() == ['tahun', 'semester', 'jumlah']
@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+
+from conftest import agama_rows
+from diskominfo_data import build_rollups, normalize_dataset
+from diskominfo_report import report_figures, report_period
+
+
+@pytest.fixture
+def rollups():
+    df = normalize_dataset("Agama", pd.DataFrame(agama_rows(2023, 1) + agama_rows(2023, 2) + agama_rows(2024, 1)))
+    return {"Agama": build_rollups("Agama", df)}
+
+
+def test_report_period_uses_latest_semester(rollups):
+    assert report_period(rollups) == (2024, 1)
+    assert report_period(rollups, 2023) == (2023, 2)
+    assert report_period(rollups, 2023, 1) == (2023, 1)
+
+
+def test_report_period_rejects_invalid_options(rollups):
+    with pytest.raises(ValueError):
+        report_period(rollups, semester=1)
+    with pytest.raises(ValueError):
+        report_period(rollups, 2030)
+
+
+def test_report_figures_do_not_double_count(rollups):
+    figures = dict(report_figures(rollups, 'GARUT KOTA', *report_period(rollups, 2023)))
+    # Satu semester: (ISLAM + KRISTEN) x dua jenis kelamin, bukan dijumlahkan dengan semester 1
+    assert sum(sum(trace.y) for trace in figures['agama_bar'].data) == 2 * (100 + 10)
+
+
+def test_report_figures_include_yearly_pekerjaan(rollups):
+    rows = [
+        {'tahun': 2023, 'kecamatan': 'GARUT KOTA', 'jenis_pekerjaan': pekerjaan, 'jumlah': jumlah}
+        for pekerjaan, jumlah in (('PETANI', 60), ('BELUM/TIDAK BEKERJA', 40))
+    ]
+    rollups = dict(rollups, Pekerjaan=build_rollups("Pekerjaan", normalize_dataset("Pekerjaan", pd.DataFrame(rows))))
+    figures = dict(report_figures(rollups, 'GARUT KOTA', 2023, 2))
+    assert sum(sum(trace.y) for trace in figures['pekerjaan_bar'].data) == 100
+    assert 'agama_bar' in figures